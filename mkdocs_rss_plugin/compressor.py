@@ -0,0 +1,137 @@
+#! python3  # noqa: E265
+
+# ############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+import gzip
+from concurrent.futures import Future, ThreadPoolExecutor
+from os import utime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+# 3rd party
+from mkdocs.plugins import get_plugin_logger
+
+# package
+from mkdocs_rss_plugin.constants import MKDOCS_LOGGER_NAME
+
+# conditional
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# ############################################################################
+# ########## Globals #############
+# ################################
+
+logger = get_plugin_logger(MKDOCS_LOGGER_NAME)
+
+# ############################################################################
+# ########## Classes #############
+# ################################
+
+
+class FeedsCompressor:
+    """Write gzip (and brotli, if the package is installed) precompressed siblings of
+    the generated files, in a background thread while the next feeds are rendered.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the compressor and its background thread."""
+        self.executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="mkdocs-rss-compress"
+        )
+        self.futures: list[Future] = []
+        self.encodings: dict[str, Callable[[bytes, float], bytes]] = {
+            ".gz": self.compress_gzip
+        }
+        if brotli is not None:
+            self.encodings[".br"] = self.compress_brotli
+        else:
+            logger.debug(
+                "Brotli package is not installed. Only gzip precompressed files will "
+                "be written."
+            )
+
+    @staticmethod
+    def compress_gzip(data: bytes, mtime: float) -> bytes:
+        """Compress data with gzip.
+
+        Args:
+            data (bytes): data to compress
+            mtime (float): modification time of the source file, stored in the gzip
+                header to get the same output for the same source
+
+        Returns:
+            bytes: compressed data
+        """
+        return gzip.compress(data, compresslevel=9, mtime=int(mtime))
+
+    @staticmethod
+    def compress_brotli(data: bytes, mtime: float) -> bytes:
+        """Compress data with brotli.
+
+        Args:
+            data (bytes): data to compress
+            mtime (float): modification time of the source file (unused)
+
+        Returns:
+            bytes: compressed data
+        """
+        return brotli.compress(data, quality=11)
+
+    def compress(self, in_file: Path) -> list[Path]:
+        """Write the precompressed siblings of a file (i.e. feed.xml.gz), with the
+        same modification time. Up to date siblings are left untouched.
+
+        Args:
+            in_file (Path): file to compress
+
+        Returns:
+            list[Path]: written siblings
+        """
+        in_file = Path(in_file)
+        in_file_stat = in_file.stat()
+        data: bytes | None = None
+        written_files: list[Path] = []
+
+        for suffix, compress_function in self.encodings.items():
+            out_file = in_file.with_name(in_file.name + suffix)
+            if (
+                out_file.is_file()
+                and out_file.stat().st_mtime_ns == in_file_stat.st_mtime_ns
+            ):
+                continue
+
+            if data is None:
+                data = in_file.read_bytes()
+            out_file.write_bytes(compress_function(data, in_file_stat.st_mtime))
+            utime(out_file, ns=(in_file_stat.st_atime_ns, in_file_stat.st_mtime_ns))
+            written_files.append(out_file)
+
+        return written_files
+
+    def submit(self, in_file: Path) -> None:
+        """Compress a file in the background.
+
+        Args:
+            in_file (Path): file to compress
+        """
+        self.futures.append(self.executor.submit(self.compress, in_file))
+
+    def join(self) -> None:
+        """Wait for the submitted files to be compressed and stop the background
+        thread."""
+        for future in self.futures:
+            try:
+                future.result()
+            except OSError as err:
+                logger.warning(f"Unable to write precompressed file. Trace: {err}")
+        self.futures.clear()
+        self.executor.shutdown()
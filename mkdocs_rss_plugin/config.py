@@ -16,6 +16,28 @@ from mkdocs_rss_plugin.constants import DEFAULT_CACHE_FOLDER
 # ##################################
 
 
+class _ArchivesConfig(Config):
+    """Sub configuration for archived feeds (RFC 5005)."""
+
+    enabled = config_options.Type(bool, default=False)
+    filename_pattern = config_options.Type(str, default="archives/{page}/{filename}")
+    page_size = config_options.Type(int, default=50)
+
+
+class _AuthorsFeedsConfig(Config):
+    """Sub configuration for feeds by author."""
+
+    enabled = config_options.Type(bool, default=False)
+    filename_pattern = config_options.Type(str, default="author/{slug}/{filename}")
+
+
+class _CategoriesFeedsConfig(Config):
+    """Sub configuration for feeds by category."""
+
+    enabled = config_options.Type(bool, default=False)
+    filename_pattern = config_options.Type(str, default="category/{slug}/{filename}")
+
+
 class _DateFromMeta(Config):
     """Sub configuration object for related date options."""
 
@@ -36,14 +58,28 @@ class _FeedsFilenamesConfig(Config):
     rss_updated = config_options.Type(str, default="feed_rss_updated.xml")
 
 
+class _RemoteImagesConfig(Config):
+    """Sub configuration for remote images (enclosures) handling."""
+
+    cache_ttl = config_options.Type(int, default=10080)
+    cache_ttl_errors = config_options.Type(int, default=1440)
+    max_workers = config_options.Type(int, default=8)
+    max_workers_per_host = config_options.Type(int, default=4)
+    offline = config_options.Type(bool, default=False)
+
+
 class RssPluginConfig(Config):
     """Configuration for RSS plugin for Mkdocs."""
 
     abstract_chars_count = config_options.Type(int, default=160)
     abstract_delimiter = config_options.Type(str, default="<!-- more -->")
+    abstract_use_markdown_extensions = config_options.Type(bool, default=False)
+    archives = config_options.SubConfig(_ArchivesConfig)
+    authors_feeds = config_options.SubConfig(_AuthorsFeedsConfig)
     categories = config_options.Optional(
         config_options.ListOfItems(config_options.Type(str))
     )
+    categories_feeds = config_options.SubConfig(_CategoriesFeedsConfig)
     cache_dir = config_options.Type(str, default=f"{DEFAULT_CACHE_FOLDER.resolve()}")
     comments_path = config_options.Optional(config_options.Type(str))
     date_from_meta = config_options.SubConfig(_DateFromMeta)
@@ -56,10 +92,13 @@ class RssPluginConfig(Config):
     json_feed_enabled = config_options.Type(bool, default=True)
     length = config_options.Type(int, default=20)
     match_path = config_options.Type(str, default=".*")
+    precompress = config_options.Type(bool, default=False)
     pretty_print = config_options.Type(bool, default=False)
+    remote_images = config_options.SubConfig(_RemoteImagesConfig)
     rss_feed_enabled = config_options.Type(bool, default=True)
     stylesheet = config_options.Type(str, default="auto")
     url_parameters = config_options.Optional(config_options.Type(dict))
     use_git = config_options.Type(bool, default=True)
+    use_git_dates_index = config_options.Type(bool, default=True)
     use_material_blog = config_options.Type(bool, default=True)
     use_material_social_cards = config_options.Type(bool, default=True)
@@ -0,0 +1,166 @@
+#! python3  # noqa: E265
+
+# ############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+from collections.abc import Callable, Iterable, Iterator
+from heapq import heapify, heappush, heappushpop
+from itertools import count
+from typing import Literal
+
+# package
+from mkdocs_rss_plugin.models import PageInformation
+
+# ############################################################################
+# ########## Classes #############
+# ################################
+
+
+class FeedEntriesSelector:
+    """Keep only the most recent pages as they are collected, using a bounded heap,
+    instead of storing every page and sorting them all at the end of the build.
+    """
+
+    def __init__(
+        self, filter_attribute: Literal["created", "updated"], length: int
+    ) -> None:
+        """Initialize the selector.
+
+        Args:
+            filter_attribute: page attribute to use as sort key
+            length: max number of pages to keep
+        """
+        self.filter_attribute = filter_attribute
+        self.length = max(length, 0)
+        # min-heap of (date, -insertion order, key, page): the root is the page to
+        # evict first, i.e. the oldest one and, for equal dates, the last added one
+        self._heap: list[tuple] = []
+        self._keys: set[str] = set()
+        self._counter = count()
+
+    def __len__(self) -> int:
+        """Number of pages currently selected."""
+        return len(self._heap)
+
+    def add(self, page: PageInformation, key: str | None = None) -> None:
+        """Offer a page to the selector.
+
+        Args:
+            page: page to offer
+            key: unique identifier of the page (i.e. its source URI), used to
+                replace a previously added version of the same page. Defaults to None.
+        """
+        if not self.length:
+            return
+
+        if key is not None and key in self._keys:
+            self.discard(key)
+
+        item = (
+            getattr(page, self.filter_attribute),
+            -next(self._counter),
+            key,
+            page,
+        )
+        evicted_item = None
+        if len(self._heap) < self.length:
+            heappush(self._heap, item)
+        else:
+            # the evicted page might be the offered one if it is not recent enough
+            evicted_item = heappushpop(self._heap, item)
+
+        if key is not None:
+            self._keys.add(key)
+        if evicted_item is not None and evicted_item[2] is not None:
+            self._keys.discard(evicted_item[2])
+
+    def discard(self, key: str) -> None:
+        """Remove a page from the selection.
+
+        Args:
+            key: unique identifier of the page to remove
+        """
+        self._heap = [item for item in self._heap if item[2] != key]
+        heapify(self._heap)
+        self._keys.discard(key)
+
+    def select(self) -> list[PageInformation]:
+        """Return selected pages, from the most recent to the oldest. Pages with
+        the same date are kept in the order they were added.
+
+        Returns:
+            list of selected pages
+        """
+        return [
+            item[3]
+            for item in sorted(
+                self._heap, key=lambda item: (item[0], item[1]), reverse=True
+            )
+        ]
+
+
+class GroupedEntriesSelector:
+    """Inverted index of the most recent pages by group (i.e. category), filled
+    during the single pass over the pages to build one feed per group.
+    """
+
+    def __init__(self, length: int, slugify: Callable[[str], str]) -> None:
+        """Initialize the grouped selector.
+
+        Args:
+            length: max number of pages to keep by group and by date
+            slugify: function turning a group name into the identifier used to
+                merge groups (i.e. "Python" and "python") and to name outputs
+        """
+        self.length = length
+        self.slugify = slugify
+        # group slug -> (group name, selector by creation, selector by update)
+        self._groups: dict[
+            str, tuple[str, FeedEntriesSelector, FeedEntriesSelector]
+        ] = {}
+
+    def __len__(self) -> int:
+        """Number of groups."""
+        return len(self._groups)
+
+    def add(
+        self,
+        page: PageInformation,
+        groups: Iterable[str] | None,
+        key: str | None = None,
+    ) -> None:
+        """Offer a page to the selectors of the groups it belongs to.
+
+        Args:
+            page: page to offer
+            groups: names of the groups the page belongs to
+            key: unique identifier of the page (i.e. its source URI). Defaults to None.
+        """
+        # groups with the same slug are merged
+        slugs = {self.slugify(str(group)): str(group) for group in groups or ()}
+        for slug, group in slugs.items():
+            if not slug:
+                continue
+            if slug not in self._groups:
+                self._groups[slug] = (
+                    group,
+                    FeedEntriesSelector(filter_attribute="created", length=self.length),
+                    FeedEntriesSelector(filter_attribute="updated", length=self.length),
+                )
+            self._groups[slug][1].add(page, key=key)
+            self._groups[slug][2].add(page, key=key)
+
+    def select(
+        self,
+    ) -> Iterator[tuple[str, str, list[PageInformation], list[PageInformation]]]:
+        """Return selected pages of each group, sorted by group slug.
+
+        Yields:
+            group slug, group name, pages by creation and pages by update, from the
+            most recent to the oldest
+        """
+        for slug in sorted(self._groups):
+            name, entries_created, entries_updated = self._groups[slug]
+            yield slug, name, entries_created.select(), entries_updated.select()
@@ -0,0 +1,330 @@
+#! python3  # noqa: E265
+
+# ############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+import json
+from collections.abc import Iterable, Iterator
+from os import path as os_path
+from pathlib import Path
+
+# 3rd party
+from git import Git, GitCommandError, GitCommandNotFound
+from mkdocs.plugins import get_plugin_logger
+
+# package
+from mkdocs_rss_plugin.constants import MKDOCS_LOGGER_NAME
+
+# ############################################################################
+# ########## Globals #############
+# ################################
+
+logger = get_plugin_logger(MKDOCS_LOGGER_NAME)
+
+# marker prepended to each commit timestamp in the git log output
+COMMIT_MARKER: str = "\x01"
+# name of the file persisting the index within the plugin's cache folder
+CACHE_FILENAME: str = "git_dates_index.json"
+
+# ############################################################################
+# ########## Classes #############
+# ################################
+
+
+class GitDatesIndex:
+    """Index of files creation and last update timestamps, built from a single walk
+    through the git log instead of spawning two git processes per page.
+    """
+
+    def __init__(self, repo: Git) -> None:
+        """Initialize the git dates index.
+
+        Args:
+            repo (Git): Git command wrapper of the repository
+        """
+        self.repo = repo
+        self.root_dir: str = os_path.normpath(repo.working_dir)
+        # absolute file path -> (creation timestamp, last commit timestamp)
+        self.dates: dict[str, tuple[int | None, int | None]] = {}
+        # commit the index has been computed at
+        self.head: str | None = None
+
+    def __contains__(self, file_path: str) -> bool:
+        """Check if a file is known by the index.
+
+        Args:
+            file_path (str): absolute path to the file
+
+        Returns:
+            bool: True if the file has been found in the git log
+        """
+        return os_path.normpath(file_path) in self.dates
+
+    def __len__(self) -> int:
+        """Number of indexed files."""
+        return len(self.dates)
+
+    def get(self, file_path: str) -> tuple[int | None, int | None] | None:
+        """Get creation and last update timestamps for a file.
+
+        Args:
+            file_path (str): absolute path to the file
+
+        Returns:
+            tuple[int | None, int | None] | None: (creation timestamp, last commit
+                timestamp) or None if the file is not indexed
+        """
+        return self.dates.get(os_path.normpath(file_path))
+
+    def build(self, paths: Iterable[str], cache_dir: Path | None = None) -> bool:
+        """Fill the index for the given paths.
+
+        If a cache folder is given, the index persisted during a previous build is
+        loaded and only the commits added since then are walked.
+
+        Args:
+            paths (Iterable[str]): paths (folders or files) to limit the git log to
+            cache_dir (Path | None, optional): folder where the index is persisted. \
+                Defaults to None.
+
+        Returns:
+            bool: True if the index has been built
+        """
+        paths = sorted(paths)
+        try:
+            head = self.repo.rev_parse("HEAD")
+
+            if cache_dir is not None and self.load(
+                cache_file=Path(cache_dir).joinpath(CACHE_FILENAME), paths=paths
+            ):
+                if self.head == head:
+                    logger.debug(
+                        f"Git dates index loaded from cache for {len(self.dates)} "
+                        f"files at commit {head}."
+                    )
+                    return True
+                elif self.is_ancestor(commit=self.head, descendant=head):
+                    logger.debug(
+                        f"Git dates index loaded from cache at commit {self.head}. "
+                        f"Updating it with commits until {head}."
+                    )
+                    self.merge(self.walk(paths, revision_range=f"{self.head}..{head}"))
+                else:
+                    logger.debug(
+                        f"Cached git dates index commit ({self.head}) is not an "
+                        "ancestor of HEAD. Rebuilding it."
+                    )
+                    self.dates = self.walk(paths)
+            else:
+                self.dates = self.walk(paths)
+        except (GitCommandError, GitCommandNotFound) as err:
+            logger.info(
+                "Unable to build the git dates index. Dates will be retrieved file "
+                f"by file. Trace: {err}"
+            )
+            self.dates = {}
+            return False
+
+        self.head = head
+        logger.debug(f"Git dates index built for {len(self.dates)} files.")
+
+        if cache_dir is not None:
+            self.save(cache_file=Path(cache_dir).joinpath(CACHE_FILENAME), paths=paths)
+
+        return True
+
+    def walk(
+        self, paths: Iterable[str], revision_range: str | None = None
+    ) -> dict[str, tuple[int | None, int | None]]:
+        """Walk the git log once for the given paths.
+
+        Args:
+            paths (Iterable[str]): paths (folders or files) to limit the git log to
+            revision_range (str | None, optional): commits range to walk. Defaults to
+                None (all the history reachable from HEAD).
+
+        Returns:
+            dict[str, tuple[int | None, int | None]]: absolute file path ->
+                (creation timestamp, last commit timestamp)
+        """
+        git_log_args = [revision_range] if revision_range else []
+        git_log_output = self.repo.log(
+            *git_log_args,
+            "--",
+            *paths,
+            format=f"{COMMIT_MARKER}%at",
+            name_status=True,
+            z=True,
+            # merges list the files differing from all their parents, as the ones
+            # `git log -- <file>` shows for a single file
+            c=True,
+        )
+
+        walked_index = GitDatesIndex(repo=self.repo)
+        walked_index.parse_log(git_log_output)
+        return walked_index.dates
+
+    def is_ancestor(self, commit: str, descendant: str) -> bool:
+        """Check if a commit is an ancestor of another one.
+
+        Args:
+            commit (str): supposed ancestor commit
+            descendant (str): supposed descendant commit
+
+        Returns:
+            bool: True if commit is an ancestor of descendant
+        """
+        try:
+            self.repo.merge_base(commit, descendant, is_ancestor=True)
+        except GitCommandError:
+            return False
+        return True
+
+    def merge(self, newer_dates: dict[str, tuple[int | None, int | None]]) -> None:
+        """Update the index with dates from more recent commits.
+
+        Commits merged since the index was computed can be older than the indexed
+        ones, so the oldest creation and the newest update dates are kept.
+
+        Args:
+            newer_dates (dict[str, tuple[int | None, int | None]]): dates walked from
+                commits added since the ones already indexed
+        """
+        for abs_path, (created, updated) in newer_dates.items():
+            previous_created, previous_updated = self.dates.get(abs_path, (None, None))
+            self.dates[abs_path] = (
+                min(filter(None, (created, previous_created)), default=None),
+                max(filter(None, (updated, previous_updated)), default=None),
+            )
+
+    def load(self, cache_file: Path, paths: list[str]) -> bool:
+        """Load the index persisted during a previous build.
+
+        Args:
+            cache_file (Path): path to the persisted index
+            paths (list[str]): paths the index is expected to cover
+
+        Returns:
+            bool: True if a compatible index has been loaded
+        """
+        if not cache_file.is_file():
+            return False
+
+        try:
+            with cache_file.open(mode="r", encoding="UTF-8") as in_file:
+                cached_index = json.load(in_file)
+        except (OSError, ValueError) as err:
+            logger.debug(f"Unable to read git dates index cache {cache_file}: {err}")
+            return False
+
+        if not isinstance(cached_index, dict) or cached_index.get("paths") != [
+            os_path.relpath(p, self.root_dir) for p in paths
+        ]:
+            logger.debug(
+                f"Git dates index cache {cache_file} does not match indexed paths."
+            )
+            return False
+
+        self.head = cached_index.get("head")
+        self.dates = {
+            os_path.normpath(Path(self.root_dir, rel_path)): tuple(dates)
+            for rel_path, dates in cached_index.get("dates", {}).items()
+        }
+        return self.head is not None
+
+    def save(self, cache_file: Path, paths: list[str]) -> None:
+        """Persist the index to be reused by the next builds.
+
+        Args:
+            cache_file (Path): path to the persisted index
+            paths (list[str]): paths covered by the index
+        """
+        cached_index = {
+            "head": self.head,
+            "paths": [os_path.relpath(p, self.root_dir) for p in paths],
+            "dates": {
+                os_path.relpath(abs_path, self.root_dir): dates
+                for abs_path, dates in self.dates.items()
+            },
+        }
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_cache_file = cache_file.with_suffix(".tmp")
+            with tmp_cache_file.open(mode="w", encoding="UTF-8") as out_file:
+                json.dump(cached_index, out_file)
+            tmp_cache_file.replace(cache_file)
+        except OSError as err:
+            logger.debug(f"Unable to write git dates index cache {cache_file}: {err}")
+
+    def parse_log(self, git_log_output: str) -> None:
+        """Parse the output of `git log -c --name-status -z` and fill the index.
+
+        Commits are listed from the most recent to the oldest, so the first
+        occurrence of a path gives its last commit date and the first addition (or
+        rename) gives its creation date, matching `git log -n 1 [--diff-filter=AR]`.
+        Merge commits list the files differing from all their parents, with one
+        status letter per parent (i.e. `MM`), as merges shown by `git log` for a
+        single file.
+
+        Args:
+            git_log_output (str): raw git log output
+        """
+        for _ in self.parse_tokens(iter(git_log_output.split("\0"))):
+            pass
+
+    def parse_tokens(self, tokens: Iterator[str]) -> Iterator[str]:
+        """Fill the index from the NUL-separated tokens of a `git log --name-status
+            -z` output, as they come.
+
+        Args:
+            tokens (Iterator[str]): git log output tokens
+
+        Yields:
+            Iterator[str]: absolute path of each file registered in the index
+        """
+        commit_timestamp: int | None = None
+        for token in tokens:
+            if token.startswith(COMMIT_MARKER):
+                commit_timestamp = int(token.lstrip(COMMIT_MARKER))
+                continue
+
+            status = token.strip()
+            if not status or commit_timestamp is None:
+                continue
+
+            # renames and copies are followed by the source and the destination paths
+            if status[0] in ("R", "C"):
+                next(tokens, None)
+            file_path = next(tokens, None)
+            if not file_path:
+                continue
+
+            yield self.add(
+                file_path=file_path,
+                timestamp=commit_timestamp,
+                is_creation=status[0] in ("A", "R"),
+            )
+
+    def add(self, file_path: str, timestamp: int, is_creation: bool = False) -> str:
+        """Register a commit timestamp for a file, unless a more recent one is
+        already known.
+
+        Args:
+            file_path (str): file path relative to the repository root
+            timestamp (int): commit timestamp
+            is_creation (bool, optional): True if the commit added the file. \
+                Defaults to False.
+
+        Returns:
+            str: absolute path of the file in the index
+        """
+        abs_path = os_path.normpath(Path(self.root_dir, file_path))
+        created, updated = self.dates.get(abs_path, (None, None))
+        if updated is None:
+            updated = timestamp
+        if created is None and is_creation:
+            created = timestamp
+        self.dates[abs_path] = (created, updated)
+        return abs_path
@@ -0,0 +1,197 @@
+#! python3  # noqa: E265
+
+# ############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+from collections.abc import Iterable, Iterator
+from io import BufferedReader
+from os import path as os_path
+from pathlib import Path
+from threading import Lock
+
+# 3rd party
+from git import Git, GitCommandError
+from mkdocs.plugins import get_plugin_logger
+
+# package
+from mkdocs_rss_plugin.constants import MKDOCS_LOGGER_NAME
+from mkdocs_rss_plugin.git_manager.dates_index import COMMIT_MARKER, GitDatesIndex
+
+# ############################################################################
+# ########## Globals #############
+# ################################
+
+logger = get_plugin_logger(MKDOCS_LOGGER_NAME)
+
+# size of the chunks read from the git log output
+CHUNK_SIZE: int = 64 * 1024
+
+# ############################################################################
+# ########## Classes #############
+# ################################
+
+
+class GitLogWorker:
+    """Long-lived git process streaming the history of the given paths, read only
+    as far as needed to answer files dates queries instead of spawning two git
+    processes per file.
+    """
+
+    def __init__(self, repo: Git, paths: Iterable[str] | None = None) -> None:
+        """Initialize the git log worker. The git process is started on first query.
+
+        Args:
+            repo (Git): Git command wrapper of the repository
+            paths (Iterable[str] | None, optional): paths (folders or files) to limit
+                the git log to. Defaults to None (the whole repository).
+        """
+        self.repo = repo
+        self.paths: list[str] = sorted(paths or [])
+        # dates of the files met so far in the streamed history
+        self.dates_index = GitDatesIndex(repo=repo)
+        self.lock = Lock()
+        self.process: Git.AutoInterrupt | None = None
+        self.parsed_paths: Iterator[str] | None = None
+        self.is_exhausted: bool = False
+        # files known by git within the paths, listed on first query
+        self.tracked_paths: set[str] | None = None
+
+    def get(self, file_path: str) -> tuple[int | None, int | None]:
+        """Get creation and last update timestamps for a file, reading the git log
+            until its creation commit or the end of the history.
+
+        Args:
+            file_path (str): absolute path to the file
+
+        Raises:
+            GitCommandError: if the git log failed
+            GitCommandNotFound: if git is not installed
+
+        Returns:
+            tuple[int | None, int | None]: (creation timestamp, last commit timestamp)
+        """
+        abs_path = os_path.normpath(file_path)
+        with self.lock:
+            # files unknown by git have no history: don't walk it for nothing
+            if abs_path not in self.list_tracked_paths():
+                return None, None
+
+            created, updated = self.dates_index.dates.get(abs_path, (None, None))
+            if created is None and not self.is_exhausted:
+                self.read_until(abs_path)
+                created, updated = self.dates_index.dates.get(abs_path, (None, None))
+
+        return created, updated
+
+    def prefetch(self, file_paths: Iterable[str]) -> None:
+        """Read dates of several files ahead of their queries, in a single pass
+            through the git log.
+
+        Args:
+            file_paths (Iterable[str]): absolute paths to the files
+        """
+        try:
+            for file_path in file_paths:
+                self.get(file_path)
+        except GitCommandError as err:
+            logger.info(
+                "Unable to read git logs. Is git log readable? Falling back to build "
+                "date. To disable this warning, set 'use_git: false' in plugin "
+                f"options. Trace: {err}"
+            )
+
+    def list_tracked_paths(self) -> set[str]:
+        """List files known by git within the worker paths, once.
+
+        Raises:
+            GitCommandError: if the files listing failed
+
+        Returns:
+            set[str]: normalized absolute paths of the tracked files
+        """
+        if self.tracked_paths is None:
+            self.tracked_paths = {
+                os_path.normpath(Path(self.dates_index.root_dir, rel_path))
+                for rel_path in self.repo.ls_files("-z", "--", *self.paths).split("\0")
+                if rel_path
+            }
+        return self.tracked_paths
+
+    def read_until(self, abs_path: str) -> None:
+        """Read the git log until the creation commit of a file is met, starting the
+            git process if needed.
+
+        Commits are listed from the most recent to the oldest, so once the creation
+        commit is met, the last commit date is known too.
+
+        Args:
+            abs_path (str): normalized absolute path to the file
+        """
+        if self.parsed_paths is None:
+            logger.debug("Starting git log worker for files missing from the index.")
+            self.process = self.repo.log(
+                "--",
+                *self.paths,
+                format=f"{COMMIT_MARKER}%at",
+                name_status=True,
+                z=True,
+                # merges list the files differing from all their parents
+                c=True,
+                as_process=True,
+            )
+            self.parsed_paths = self.dates_index.parse_tokens(
+                self.iter_tokens(self.process.stdout)
+            )
+
+        for parsed_path in self.parsed_paths:
+            if (
+                parsed_path == abs_path
+                and self.dates_index.dates[abs_path][0] is not None
+            ):
+                return
+
+        # end of the history: every file within the paths is known
+        logger.debug(
+            f"Git log worker read the whole history: {len(self.dates_index)} files."
+        )
+        self.is_exhausted = True
+        self.close()
+
+    def close(self) -> None:
+        """Stop the git process. A new one is started by the next query if the
+        history has not been fully read.
+
+        Raises:
+            GitCommandError: if the history has been fully read but git failed
+        """
+        process, self.process, self.parsed_paths = self.process, None, None
+        if process is None:
+            return
+
+        if self.is_exhausted:
+            # raise if git exited with an error
+            process.wait()
+        else:
+            process.proc.stdout.close()
+            process.proc.terminate()
+            process.proc.wait()
+
+    @staticmethod
+    def iter_tokens(stream: BufferedReader) -> Iterator[str]:
+        """Split a `git log -z` output into tokens as it is read.
+
+        Args:
+            stream (BufferedReader): git process standard output
+
+        Yields:
+            Iterator[str]: NUL-separated tokens
+        """
+        pending = b""
+        while chunk := stream.read1(CHUNK_SIZE):
+            *tokens, pending = (pending + chunk).split(b"\0")
+            for token in tokens:
+                yield token.decode("UTF-8", errors="surrogateescape")
+        if pending:
+            yield pending.decode("UTF-8", errors="surrogateescape")
@@ -6,7 +6,9 @@
 
 # standard library
 import json
+from os import scandir
 from pathlib import Path
+from threading import Lock
 
 # 3rd party
 from mkdocs.config.defaults import MkDocsConfig
@@ -57,6 +59,10 @@ class IntegrationMaterialSocialCards(IntegrationMaterialThemeBase):
                 it to False to disable it even if Social Cards are enabled in Mkdocs
                 configuration. Defaults to True.
         """
+        # sizes of the cards files by path, scanned once per folder
+        self.cards_indexes: dict[str, dict[str, int]] = {}
+        self.cards_indexes_lock = Lock()
+
         # support cards for blog posts
         self.integration_material_blog = IntegrationMaterialBlog(
             mkdocs_config=mkdocs_config
@@ -202,6 +208,70 @@ class IntegrationMaterialSocialCards(IntegrationMaterialThemeBase):
 
         return self.CARDS_MANIFEST
 
+    @staticmethod
+    def scan_cards_dir(cards_dir: Path) -> dict[str, int]:
+        """Walk a folder once to list the files within it with their size, instead
+        of probing every expected card path.
+
+        Args:
+            cards_dir (Path): folder to scan, recursively
+
+        Returns:
+            dict[str, int]: file path -> size in octets. Empty if the folder does not
+                exist.
+        """
+        cards_index: dict[str, int] = {}
+        folders = [str(cards_dir)]
+        while folders:
+            folder = folders.pop()
+            try:
+                with scandir(folder) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            folders.append(entry.path)
+                        elif entry.is_file():
+                            cards_index[entry.path] = entry.stat().st_size
+            except OSError as err:
+                logger.debug(f"Unable to scan social cards folder {folder}: {err}")
+
+        return cards_index
+
+    def get_cards_index(self, cards_dir: Path) -> dict[str, int]:
+        """Returns the files sizes within a cards folder, scanning it on first use.
+
+        Args:
+            cards_dir (Path): cards folder
+
+        Returns:
+            dict[str, int]: file path -> size in octets
+        """
+        with self.cards_indexes_lock:
+            if str(cards_dir) not in self.cards_indexes:
+                self.cards_indexes[str(cards_dir)] = self.scan_cards_dir(cards_dir)
+                logger.debug(
+                    f"{len(self.cards_indexes[str(cards_dir)])} files found in social "
+                    f"cards folder: {cards_dir}"
+                )
+            return self.cards_indexes[str(cards_dir)]
+
+    def get_social_card_length(self, card_path: Path) -> int | None:
+        """Get the size of a card found in one of the scanned folders.
+
+        Args:
+            card_path (Path): path to the card, as returned by
+                `get_social_card_cache_path_for_page` or
+                `get_social_card_build_path_for_page`
+
+        Returns:
+            int | None: size in octets or None if the card is not indexed
+        """
+        with self.cards_indexes_lock:
+            for cards_index in self.cards_indexes.values():
+                if str(card_path) in cards_index:
+                    return cards_index[str(card_path)]
+
+        return None
+
     def get_social_cards_dir(self, mkdocs_config: MkDocsConfig) -> str:
         """Get Social Cards folder relative to Mkdocs site_dir.
         See: https://squidfunk.github.io/mkdocs-material/plugins/social/#config.cards_dir
@@ -287,22 +357,22 @@ class IntegrationMaterialSocialCards(IntegrationMaterialThemeBase):
         if mkdocs_site_dir is None and self.mkdocs_site_build_dir:
             mkdocs_site_dir = self.mkdocs_site_build_dir
 
+        built_cards_dir = Path(f"{mkdocs_site_dir}/{self.social_cards_assets_dir}")
+
         # if page is a blog post
         if (
             self.integration_material_blog.IS_BLOG_PLUGIN_ENABLED
             and self.integration_material_blog.is_page_a_blog_post(mkdocs_page)
         ):
-            expected_built_card_path = Path(
-                f"{mkdocs_site_dir}/{self.social_cards_assets_dir}/"
+            expected_built_card_path = built_cards_dir.joinpath(
                 f"{Path(mkdocs_page.dest_uri).parent}.png"
             )
         else:
-            expected_built_card_path = Path(
-                f"{mkdocs_site_dir}/{self.social_cards_assets_dir}/"
+            expected_built_card_path = built_cards_dir.joinpath(
                 f"{Path(mkdocs_page.src_uri).with_suffix('.png')}"
             )
 
-        if expected_built_card_path.is_file():
+        if str(expected_built_card_path) in self.get_cards_index(built_cards_dir):
             logger.debug(
                 f"Social card file found in build folder: {expected_built_card_path}"
             )
@@ -328,6 +398,8 @@ class IntegrationMaterialSocialCards(IntegrationMaterialThemeBase):
         Returns:
             path to the image in local cache folder if it exists
         """
+        cached_cards_dir = self.social_cards_cache_dir.joinpath("assets/images/social")
+
         # if page is a blog post
         if (
             self.integration_material_blog.IS_BLOG_PLUGIN_ENABLED
@@ -336,18 +408,18 @@ class IntegrationMaterialSocialCards(IntegrationMaterialThemeBase):
             logger.debug(
                 f"Looking for social card in cache for blog post: {mkdocs_page.src_uri}"
             )
-            expected_cached_card_path = self.social_cards_cache_dir.joinpath(
-                f"assets/images/social/{Path(mkdocs_page.dest_uri).parent}.png"
+            expected_cached_card_path = cached_cards_dir.joinpath(
+                f"{Path(mkdocs_page.dest_uri).parent}.png"
             )
         else:
             logger.debug(
                 f"Looking for social card in cache for page: {mkdocs_page.src_uri}"
             )
-            expected_cached_card_path = self.social_cards_cache_dir.joinpath(
-                f"assets/images/social/{Path(mkdocs_page.src_uri).with_suffix('.png')}"
+            expected_cached_card_path = cached_cards_dir.joinpath(
+                f"{Path(mkdocs_page.src_uri).with_suffix('.png')}"
             )
 
-        if expected_cached_card_path.is_file():
+        if str(expected_cached_card_path) in self.get_cards_index(cached_cards_dir):
             logger.debug(
                 f"Social card file found in cache folder: {expected_cached_card_path}"
             )
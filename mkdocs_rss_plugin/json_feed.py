@@ -0,0 +1,198 @@
+#! python3  # noqa: E265
+
+# ############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+# 3rd party
+from mkdocs.plugins import get_plugin_logger
+
+# package
+from mkdocs_rss_plugin.constants import MKDOCS_LOGGER_NAME
+from mkdocs_rss_plugin.models import PageInformation, RssFeedBase
+
+# conditional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ############################################################################
+# ########## Globals #############
+# ################################
+
+logger = get_plugin_logger(MKDOCS_LOGGER_NAME)
+
+JSON_FEED_VERSION: str = "https://jsonfeed.org/version/1.1"
+
+# ############################################################################
+# ########## Classes #############
+# ################################
+
+
+class JsonFeedSerializer:
+    """Write feeds as JSON Feed, item after item, using orjson if it's installed or
+    the standard library otherwise.
+    """
+
+    def __init__(
+        self, pretty_print: bool = False, use_orjson: bool | None = None
+    ) -> None:
+        """Initialize the serializer.
+
+        Args:
+            pretty_print (bool, optional): indent the output. Defaults to False.
+            use_orjson (bool | None, optional): force the backend. Defaults to None
+                (orjson if installed).
+        """
+        self.pretty_print = pretty_print
+        self.use_orjson = orjson is not None if use_orjson is None else use_orjson
+        if self.use_orjson and orjson is None:
+            raise ImportError("orjson is not installed.")
+
+        if self.use_orjson:
+            # orjson only supports 2 spaces indentation
+            self.indent = "  " if pretty_print else None
+            self.item_separator = ","
+            self.key_separator = ": " if pretty_print else ":"
+        else:
+            self.indent = "    " if pretty_print else None
+            self.item_separator = "," if pretty_print else ", "
+            self.key_separator = ": "
+
+    @property
+    def backend(self) -> str:
+        """Name of the JSON backend.
+
+        Returns:
+            str: orjson or json
+        """
+        return "orjson" if self.use_orjson else "json"
+
+    @staticmethod
+    def feed_header(feed: RssFeedBase) -> dict[str, Any]:
+        """Format the feed attributes, without its items, as JSON Feed.
+
+        Args:
+            feed (RssFeedBase): feed to format
+
+        Returns:
+            dict[str, Any]: JSON Feed top-level object, without items
+        """
+        return {
+            "version": JSON_FEED_VERSION,
+            "title": feed.title,
+            "home_page_url": feed.html_url,
+            "feed_url": feed.json_url,
+            "description": feed.description,
+            "icon": feed.logo_url,
+            "authors": ([{"name": feed.author}] if feed.author is not None else []),
+            "language": str(feed.language),
+        }
+
+    @staticmethod
+    def feed_item(item: PageInformation, dates_as_str: bool = True) -> dict[str, Any]:
+        """Format a feed item as JSON Feed item.
+
+        Args:
+            item (PageInformation): item to format
+            dates_as_str (bool, optional): convert dates into ISO 8601 strings.
+                Defaults to True.
+
+        Returns:
+            dict[str, Any]: JSON Feed item
+        """
+        return {
+            "id": item.guid,
+            "url": item.link,
+            "title": item.title,
+            "content_html": item.description,
+            "image": (item.image or (None,))[0],
+            "date_modified": (
+                item.updated.isoformat("T") if dates_as_str else item.updated
+            ),
+            "date_published": (
+                item.created.isoformat("T") if dates_as_str else item.created
+            ),
+            "authors": [{"name": name} for name in (item.authors or ())],
+            "tags": item.categories,
+        }
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize an object with the selected backend.
+
+        Args:
+            obj (Any): object to serialize
+
+        Returns:
+            bytes: UTF-8 encoded JSON
+        """
+        if self.use_orjson:
+            return orjson.dumps(
+                obj, option=orjson.OPT_INDENT_2 if self.pretty_print else None
+            )
+        return json.dumps(
+            obj,
+            indent=self.indent,
+            separators=(self.item_separator, self.key_separator),
+        ).encode("UTF-8")
+
+    def iter_chunks(self, feed: RssFeedBase) -> Iterator[bytes]:
+        """Serialize a feed as JSON Feed, item after item.
+
+        Args:
+            feed (RssFeedBase): feed to serialize
+
+        Yields:
+            Iterator[bytes]: UTF-8 encoded JSON chunks
+        """
+        header = self.dumps(self.feed_header(feed))
+        items_key = self.dumps("items") + self.key_separator.encode()
+        item_separator = self.item_separator.encode()
+
+        if not self.pretty_print:
+            # header without its closing brace
+            yield header[:-1] + item_separator + items_key + b"["
+            for index, item in enumerate(feed.entries):
+                if index:
+                    yield item_separator
+                yield self.dumps(self.feed_item(item, dates_as_str=not self.use_orjson))
+            yield b"]}"
+            return
+
+        indent = self.indent.encode()
+        # header without its closing line
+        header = header[: header.rindex(b"\n")]
+        yield header + item_separator + b"\n" + indent + items_key
+        if not feed.entries:
+            yield b"[]\n}"
+            return
+
+        yield b"["
+        for index, item in enumerate(feed.entries):
+            if index:
+                yield item_separator
+            serialized_item = self.dumps(
+                self.feed_item(item, dates_as_str=not self.use_orjson)
+            )
+            # nest the item into the items list
+            item_indent = b"\n" + indent * 2
+            yield item_indent + serialized_item.replace(b"\n", item_indent)
+        yield b"\n" + indent + b"]\n}"
+
+    def write(self, feed: RssFeedBase, out_file: Path) -> None:
+        """Write a feed as JSON Feed into a file.
+
+        Args:
+            feed (RssFeedBase): feed to write
+            out_file (Path): path to the output file
+        """
+        with Path(out_file).open(mode="wb") as fp:
+            for chunk in self.iter_chunks(feed):
+                fp.write(chunk)
@@ -0,0 +1,68 @@
+#! python3  # noqa: E265
+
+"""
+Minify the whitespaces of rendered feeds, converting new lines into spaces and
+collapsing runs of spaces.
+
+"""
+
+# ############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+from re import compile as re_compile
+
+# ############################################################################
+# ########## Globals #############
+# ################################
+
+SPACES_RUN_PATTERN = re_compile(r" {2,}")
+NEW_LINES_TABLE = str.maketrans("\n", " ")
+
+# ############################################################################
+# ########## Classes #############
+# ################################
+
+
+class WhitespaceMinifier:
+    """Minify text, in one go or chunk after chunk, keeping the state between
+    chunks so the result is the same whatever the chunks boundaries.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the minifier."""
+        self.ends_with_space: bool = False
+
+    def feed(self, chunk: str) -> str:
+        """Minify a chunk of text following the previously fed ones.
+
+        Args:
+            chunk (str): text to minify
+
+        Returns:
+            str: minified text
+        """
+        if not chunk:
+            return chunk
+
+        minified = SPACES_RUN_PATTERN.sub(" ", chunk.translate(NEW_LINES_TABLE))
+        # a space following the end of the previous chunk would be a duplicate
+        if self.ends_with_space and minified.startswith(" "):
+            minified = minified[1:]
+        if minified:
+            self.ends_with_space = minified.endswith(" ")
+
+        return minified
+
+    @staticmethod
+    def minify(text: str) -> str:
+        """Convert new lines into spaces and collapse consecutive spaces.
+
+        Args:
+            text (str): text to minify
+
+        Returns:
+            str: minified text
+        """
+        return WhitespaceMinifier().feed(text)
@@ -16,6 +16,7 @@ from mkdocs_rss_plugin.__about__ import __title__, __version__
 
 if TYPE_CHECKING:
     from collections.abc import MutableMapping
+    from concurrent.futures import Future
     from datetime import datetime
     from pathlib import Path
 
@@ -69,18 +70,37 @@ class PageInformation:
     title: str | None = None
     updated: datetime | None = None
     # private
+    _abstract_markdown: str | None = field(default=None, repr=False, compare=False)
+    _dates_future: Future[tuple[datetime, datetime]] | None = field(
+        default=None, repr=False, compare=False
+    )
+    # dates attributes falling back to the build date, changing at each build
+    _volatile_dates: tuple[str, ...] = field(default=(), repr=False, compare=False)
     _mkdocs_page_ref: MkdocsPageSubset | None = field(
         default=None, repr=False, compare=False
     )
 
 
+@dataclass
+class RemoteImageMetadata:
+    """Object describing a remote image metadata, persisted between builds."""
+
+    fetched_at: float
+    status: str
+    length: int | None = None
+    mime_type: str | None = None
+
+
 @dataclass
 class RssFeedBase:
     """Object describing a feed."""
 
+    # archive document of a paged feed (RFC 5005)
+    archive: bool = False
     author: str | None = None
     buildDate: str | None = None
     copyright: str | None = None
+    current_url: str | None = None
     description: str | None = None
     entries: list[PageInformation] = field(default_factory=list)
     generator: str = f"{__title__} - v{__version__}"
@@ -88,6 +108,8 @@ class RssFeedBase:
     json_url: str | None = None
     language: str | None = None
     logo_url: str | None = None
+    next_archive_url: str | None = None
+    prev_archive_url: str | None = None
     pubDate: str | None = None
     repo_url: str | None = None
     rss_url: str | None = None
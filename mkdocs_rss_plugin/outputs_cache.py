@@ -0,0 +1,174 @@
+#! python3  # noqa: E265
+
+# ############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+import json
+from pathlib import Path
+from shutil import copy2
+from threading import Lock
+
+# 3rd party
+from mkdocs.plugins import get_plugin_logger
+
+# package
+from mkdocs_rss_plugin.constants import MKDOCS_LOGGER_NAME
+
+# ############################################################################
+# ########## Globals #############
+# ################################
+
+logger = get_plugin_logger(MKDOCS_LOGGER_NAME)
+
+# name of the file persisting the digests within the plugin's cache folder
+CACHE_FILENAME: str = "feeds_digests.json"
+# name of the folder storing a copy of the last written feeds
+CACHE_FEEDS_FOLDER: str = "feeds"
+
+# ############################################################################
+# ########## Classes #############
+# ################################
+
+
+class FeedsOutputsCache:
+    """Digests of the feeds written by previous builds, along with a copy of them,
+    to leave output files untouched when their content did not change.
+
+    Since MkDocs empties the site folder before each build (unless `--dirty` is
+    used), a missing output file is restored from the copy, keeping its content
+    and modification time.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        """Initialize the cache and load the digests persisted by previous builds.
+
+        Args:
+            cache_dir (Path): folder where the digests and feeds copies are persisted
+        """
+        self.cache_file = Path(cache_dir).joinpath(CACHE_FILENAME)
+        self.feeds_dir = Path(cache_dir).joinpath(CACHE_FEEDS_FOLDER)
+        # output path relative to the site folder -> feed digest
+        self.digests: dict[str, str] = {}
+        # outputs written during this build
+        self.updated_keys: set[str] = set()
+        self.lock = Lock()
+
+        self.load()
+
+    def get_copy_path(self, digest: str, out_file: Path) -> Path:
+        """Returns the path to the copy of a written feed.
+
+        Args:
+            digest (str): feed digest
+            out_file (Path): output file
+
+        Returns:
+            Path: path to the copy within the cache folder
+        """
+        return self.feeds_dir.joinpath(f"{digest}{Path(out_file).suffix}")
+
+    def restore(self, key: str, digest: str, out_file: Path) -> bool:
+        """Check if a feed is unchanged since the previous build and make sure the
+        output file exists.
+
+        Args:
+            key (str): output path relative to the site folder
+            digest (str): digest of the feed to write
+            out_file (Path): output file
+
+        Returns:
+            bool: True if the output file is up to date and has not to be written
+        """
+        with self.lock:
+            if self.digests.get(key) != digest:
+                return False
+
+        out_file = Path(out_file)
+        if out_file.is_file():
+            logger.debug(f"Feed {key} unchanged since the previous build.")
+            return True
+
+        copy_path = self.get_copy_path(digest=digest, out_file=out_file)
+        if not copy_path.is_file():
+            return False
+
+        try:
+            out_file.parent.mkdir(parents=True, exist_ok=True)
+            copy2(copy_path, out_file)
+        except OSError as err:
+            logger.debug(f"Unable to restore feed {key} from {copy_path}: {err}")
+            return False
+
+        logger.debug(f"Feed {key} unchanged since the previous build. Restored.")
+        return True
+
+    def store(self, key: str, digest: str, out_file: Path) -> None:
+        """Keep a copy of a written feed and its digest for the next builds.
+
+        Args:
+            key (str): output path relative to the site folder
+            digest (str): digest of the written feed
+            out_file (Path): written output file
+        """
+        copy_path = self.get_copy_path(digest=digest, out_file=out_file)
+        try:
+            self.feeds_dir.mkdir(parents=True, exist_ok=True)
+            copy2(out_file, copy_path)
+        except OSError as err:
+            logger.debug(f"Unable to cache feed {key} into {copy_path}: {err}")
+            return
+
+        with self.lock:
+            previous_digest = self.digests.get(key)
+            self.digests[key] = digest
+            self.updated_keys.add(key)
+
+        # remove the copy of the previous version, unless shared with another feed
+        if previous_digest and previous_digest not in self.digests.values():
+            self.get_copy_path(digest=previous_digest, out_file=out_file).unlink(
+                missing_ok=True
+            )
+
+    def load(self) -> None:
+        """Load digests persisted by previous builds."""
+        self.digests = self.read()
+
+    def read(self) -> dict[str, str]:
+        """Read the digests file.
+
+        Returns:
+            dict[str, str]: output path relative to the site folder -> feed digest
+        """
+        if not self.cache_file.is_file():
+            return {}
+
+        try:
+            with self.cache_file.open(mode="r", encoding="UTF-8") as in_file:
+                digests = json.load(in_file)
+        except (OSError, ValueError) as err:
+            logger.debug(f"Unable to read feeds digests {self.cache_file}: {err}")
+            return {}
+
+        return digests if isinstance(digests, dict) else {}
+
+    def save(self) -> None:
+        """Persist digests for the next builds, if they changed. Digests written
+        meanwhile by other plugin instances sharing the same cache folder are kept.
+        """
+        with self.lock:
+            if not self.updated_keys:
+                return
+
+            digests = self.read()
+            digests.update({key: self.digests[key] for key in self.updated_keys})
+            try:
+                self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_cache_file = self.cache_file.with_suffix(".tmp")
+                with tmp_cache_file.open(mode="w", encoding="UTF-8") as out_file:
+                    json.dump(digests, out_file)
+                tmp_cache_file.replace(self.cache_file)
+                self.updated_keys.clear()
+            except OSError as err:
+                logger.debug(f"Unable to write feeds digests {self.cache_file}: {err}")
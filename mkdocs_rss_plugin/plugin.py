@@ -5,18 +5,22 @@
 # ##################################
 
 # standard library
-import json
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
-from dataclasses import asdict
+from dataclasses import replace
 from datetime import datetime
 from email.utils import format_datetime, formatdate
+from functools import partial
+from os import cpu_count
 from pathlib import Path
 from re import compile as re_compile
 from shutil import copyfile
+from sys import maxsize
 from typing import Literal
 
 # 3rd party
-from jinja2 import Environment, FileSystemLoader, select_autoescape
 from mkdocs.config import config_options
 from mkdocs.config.defaults import MkDocsConfig
 from mkdocs.plugins import BasePlugin, event_priority, get_plugin_logger
@@ -26,19 +30,21 @@ from mkdocs.utils import get_build_timestamp
 
 # package modules
 from mkdocs_rss_plugin.__about__ import __title__, __version__
+from mkdocs_rss_plugin.compressor import FeedsCompressor
 from mkdocs_rss_plugin.config import RssPluginConfig
 from mkdocs_rss_plugin.constants import (
     DEFAULT_TEMPLATE_FILENAME,
     DEFAULT_TEMPLATE_FOLDER,
     MKDOCS_LOGGER_NAME,
 )
-from mkdocs_rss_plugin.integrations.theme_material_blog_plugin import (
-    IntegrationMaterialBlog,
-)
-from mkdocs_rss_plugin.integrations.theme_material_social_plugin import (
-    IntegrationMaterialSocialCards,
+from mkdocs_rss_plugin.entries_selector import (
+    FeedEntriesSelector,
+    GroupedEntriesSelector,
 )
+from mkdocs_rss_plugin.json_feed import JsonFeedSerializer
 from mkdocs_rss_plugin.models import MkdocsPageSubset, PageInformation, RssFeedBase
+from mkdocs_rss_plugin.outputs_cache import FeedsOutputsCache
+from mkdocs_rss_plugin.template_engine import FeedTemplateEngine
 from mkdocs_rss_plugin.util import Util
 
 # ############################################################################
@@ -66,6 +72,18 @@ class GitRssPlugin(BasePlugin[RssPluginConfig]):
         super().__init__(*args, **kwargs)
 
         self.cmd_is_serve: bool = False
+        # plugin tooling, set up by on_config when enabled
+        self.util: Util | None = None
+        # compiled RSS template, reused by the next builds (mkdocs serve)
+        self.template_engine: FeedTemplateEngine | None = None
+        # background compression of the written files, during on_post_build
+        self.compressor: FeedsCompressor | None = None
+        # background git log dates lookups (without index), joined during on_post_build
+        self.dates_executor: ThreadPoolExecutor | None = None
+        # pages processed during previous builds, by source URI, to be reused by
+        # incremental rebuilds (mkdocs serve) if their source did not change
+        self.pages_cache: dict[str, tuple[str, PageInformation]] = {}
+        self.pages_cache_fingerprint: str | None = None
 
     def on_startup(
         self, *, command: Literal["build", "gh-deploy", "serve"], dirty: bool
@@ -84,7 +102,22 @@ class GitRssPlugin(BasePlugin[RssPluginConfig]):
         # flag used command to disable some actions if serve is used
         self.cmd_is_serve = command == "serve"
 
-        self.pages_to_filter: list[PageInformation] = []
+        # Skip if disabled: everything else is set up by on_config when enabled
+        if not self.config.enabled:
+            return
+
+        # most recent pages matching during the current build, by dates
+        self.entries_created: FeedEntriesSelector = FeedEntriesSelector(
+            filter_attribute="created", length=0
+        )
+        self.entries_updated: FeedEntriesSelector = FeedEntriesSelector(
+            filter_attribute="updated", length=0
+        )
+        # every page by creation date, to split them into archived feeds
+        self.entries_archived: FeedEntriesSelector | None = None
+        # most recent pages by author and by category, to build a feed per group
+        self.entries_by_author: GroupedEntriesSelector | None = None
+        self.entries_by_category: GroupedEntriesSelector | None = None
         # prepare output feeds
         self.feed_created: RssFeedBase = RssFeedBase()
         self.feed_updated: RssFeedBase = RssFeedBase()
@@ -118,11 +151,32 @@ class GitRssPlugin(BasePlugin[RssPluginConfig]):
             self.config.enabled = False
             return config
 
+        # reset pages collected by the previous build (mkdocs serve)
+        self.init_entries_selectors()
+
+        # pages processed during the current build whose dates are being resolved,
+        # in processing order
+        self.pages_pending: deque[tuple[str, PageInformation]] = deque()
+        # cached pages not rendered again by the current build (mkdocs serve --dirty)
+        self.pages_not_rendered: dict[str, None] = {}
+        self.plugin_config_fingerprint = repr(dict(self.config))
+
         # cache dir
         self.cache_dir = Path(self.config.cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         logger.debug(f"Caching HTTP requests to: {self.cache_dir.resolve()}")
 
+        # feeds written by previous builds, to leave unchanged ones untouched
+        self.outputs_cache = FeedsOutputsCache(cache_dir=self.cache_dir)
+
+        # integrations, imported only when the plugin is enabled
+        from mkdocs_rss_plugin.integrations.theme_material_blog_plugin import (
+            IntegrationMaterialBlog,
+        )
+        from mkdocs_rss_plugin.integrations.theme_material_social_plugin import (
+            IntegrationMaterialSocialCards,
+        )
+
         # integrations - check if theme is Material and if blog are enabled
         self.integration_material_blog = IntegrationMaterialBlog(
             mkdocs_config=config,
@@ -141,7 +195,24 @@ class GitRssPlugin(BasePlugin[RssPluginConfig]):
             use_git=self.config.use_git,
             integration_material_blog=self.integration_material_blog,
             integration_material_social_cards=self.integration_material_social_cards,
+            markdown_extensions=(
+                config.markdown_extensions
+                if self.config.abstract_use_markdown_extensions
+                else None
+            ),
+            markdown_extensions_configs=(
+                config.mdx_configs
+                if self.config.abstract_use_markdown_extensions
+                else None
+            ),
             mkdocs_command_is_on_serve=self.cmd_is_serve,
+            remote_images_cache_ttl=self.config.remote_images.cache_ttl,
+            remote_images_cache_ttl_errors=self.config.remote_images.cache_ttl_errors,
+            remote_images_max_workers=self.config.remote_images.max_workers,
+            remote_images_max_workers_per_host=(
+                self.config.remote_images.max_workers_per_host
+            ),
+            remote_images_offline=self.config.remote_images.offline,
         )
 
         # check template dirs
@@ -150,7 +221,76 @@ class GitRssPlugin(BasePlugin[RssPluginConfig]):
         self.tpl_file = Path(DEFAULT_TEMPLATE_FILENAME)
         self.tpl_folder = DEFAULT_TEMPLATE_FOLDER
 
+        # template engine, compiled once and reused while its settings don't change
+        template_engine_settings = {
+            "template_path": self.tpl_file,
+            "pretty_print": self.config.pretty_print,
+            "bytecode_cache_dir": self.cache_dir.joinpath("jinja"),
+        }
+        if self.template_engine is None or not self.template_engine.is_compatible(
+            **template_engine_settings
+        ):
+            self.template_engine = FeedTemplateEngine(**template_engine_settings)
+
+        # JSON Feed writer
+        self.json_serializer = JsonFeedSerializer(pretty_print=self.config.pretty_print)
+
         # start a feed dictionary using global config vars
+        base_feed = self.get_base_feed(config)
+
+        # archived feeds
+        self.check_archives_config()
+
+        # pattern to match pages included in output
+        self.match_path_pattern = re_compile(self.config.match_path)
+
+        # dates settings
+        self.check_dates_config(config)
+
+        # kept to derive feeds by author and by category
+        self.base_feed = base_feed
+
+        # create 2 final dicts
+        self.feed_created = deepcopy(base_feed)
+        self.feed_updated = deepcopy(base_feed)
+
+        # final feed url
+        if base_feed.html_url:
+            # concatenate both URLs
+            self.feed_created.rss_url = (
+                base_feed.html_url + self.config.feeds_filenames.rss_created
+            )
+            self.feed_updated.rss_url = (
+                base_feed.html_url + self.config.feeds_filenames.rss_updated
+            )
+            self.feed_created.json_url = (
+                base_feed.html_url + self.config.feeds_filenames.json_created
+            )
+            self.feed_updated.json_url = (
+                base_feed.html_url + self.config.feeds_filenames.json_updated
+            )
+        else:
+            logger.error(
+                "The variable `site_url` is not set in the MkDocs "
+                "configuration file whereas a URL is mandatory to publish. "
+                "See: https://validator.w3.org/feed/docs/rss2.html#requiredChannelElements"
+            )
+            self.feed_created.rss_url = self.feed_updated.json_url = (
+                self.feed_updated.rss_url
+            ) = self.feed_updated.json_url = None
+
+        # ending event
+        return config
+
+    def get_base_feed(self, config: MkDocsConfig) -> RssFeedBase:
+        """Start a feed using global config vars, shared by every output feed.
+
+        Args:
+            config (MkDocsConfig): global configuration object
+
+        Returns:
+            RssFeedBase: feed without entries nor URLs
+        """
         base_feed = RssFeedBase(
             author=config.site_author or None,
             buildDate=formatdate(get_build_timestamp()),
@@ -192,10 +332,14 @@ class GitRssPlugin(BasePlugin[RssPluginConfig]):
         else:
             logger.debug("No stylesheet will be referenced in RSS feeds.")
 
-        # pattern to match pages included in output
-        self.match_path_pattern = re_compile(self.config.match_path)
+        return base_feed
 
-        # date handling
+    def check_dates_config(self, config: MkDocsConfig) -> None:
+        """Check dates settings, replacing deprecated and invalid values.
+
+        Args:
+            config (MkDocsConfig): global configuration object
+        """
         if (
             self.config.date_from_meta.as_creation == "git"
             and self.config.date_from_meta.as_update == "git"
@@ -247,37 +391,120 @@ class GitRssPlugin(BasePlugin[RssPluginConfig]):
                 "call to Git."
             )
 
-        # create 2 final dicts
-        self.feed_created = deepcopy(base_feed)
-        self.feed_updated = deepcopy(base_feed)
+    def init_entries_selectors(self) -> None:
+        """Create the selections of pages offered to the feeds during the build,
+        keeping only the most recent ones while pages are processed.
+        """
+        self.entries_created = FeedEntriesSelector(
+            filter_attribute="created", length=self.config.length
+        )
+        self.entries_updated = FeedEntriesSelector(
+            filter_attribute="updated", length=self.config.length
+        )
+        self.entries_archived = (
+            FeedEntriesSelector(filter_attribute="created", length=maxsize)
+            if self.config.archives.enabled
+            else None
+        )
+        self.entries_by_author = (
+            GroupedEntriesSelector(length=self.config.length, slugify=Util.slugify)
+            if self.config.authors_feeds.enabled
+            else None
+        )
+        self.entries_by_category = (
+            GroupedEntriesSelector(length=self.config.length, slugify=Util.slugify)
+            if self.config.categories_feeds.enabled
+            else None
+        )
 
-        # final feed url
-        if base_feed.html_url:
-            # concatenate both URLs
-            self.feed_created.rss_url = (
-                base_feed.html_url + self.config.feeds_filenames.rss_created
-            )
-            self.feed_updated.rss_url = (
-                base_feed.html_url + self.config.feeds_filenames.rss_updated
+    def check_archives_config(self) -> None:
+        """Check archives settings are consistent with the other feeds options,
+        disabling archives if they can't be written.
+        """
+        if not self.config.archives.enabled:
+            return
+
+        if not self.config.rss_feed_enabled:
+            logger.warning(
+                "Archived feeds are only written for RSS, which is disabled. "
+                "No archive will be written."
             )
-            self.feed_created.json_url = (
-                base_feed.html_url + self.config.feeds_filenames.json_created
+            self.entries_archived = None
+        elif self.config.length < self.config.archives.page_size:
+            logger.warning(
+                f"Feed length ({self.config.length}) is lower than the archives "
+                f"page size ({self.config.archives.page_size}): the most recent "
+                "pages not archived yet might be missing from the current feed."
             )
-            self.feed_updated.json_url = (
-                base_feed.html_url + self.config.feeds_filenames.json_updated
+
+    def on_files(self, files: Files, config: MkDocsConfig) -> Files:
+        """The files event is called after the files collection is populated from the
+            docs_dir. Used to resolve git dates of all the pages to include in feeds
+            before they are rendered.
+
+        See: https://www.mkdocs.org/user-guide/plugins/#on_files
+
+        Args:
+            files (Files): global files collection
+            config (MkDocsConfig): global configuration object
+
+        Returns:
+            Files: global files collection
+        """
+        # Skip if disabled
+        if not self.config.enabled:
+            return files
+
+        # walk the git log once for the whole docs folder and the pages matching
+        # instead of once per page, reusing the index persisted by previous builds
+        if self.util.git_is_valid:
+            pages_paths = [
+                file.abs_src_path
+                for file in files.documentation_pages()
+                if file.abs_src_path and self.match_path_pattern.match(file.src_uri)
+            ]
+            git_dates_index = self.util.build_git_dates_index(
+                paths=[config.docs_dir],
+                cache_dir=self.cache_dir,
+                files_paths=pages_paths,
+                use_index=self.config.use_git_dates_index,
             )
-        else:
-            logger.error(
-                "The variable `site_url` is not set in the MkDocs "
-                "configuration file whereas a URL is mandatory to publish. "
-                "See: https://validator.w3.org/feed/docs/rss2.html#requiredChannelElements"
+
+            # if the index is disabled or could not be built, pages are read from the
+            # git log worker in background while the next pages are rendered.
+            # Otherwise, the index covers every page within the repository: the
+            # missing ones have no history and fall back to the build date without
+            # walking the git log again, so dates are read from the index right away.
+            if git_dates_index is None and pages_paths:
+                self.dates_executor = ThreadPoolExecutor(
+                    max_workers=min(4, cpu_count() or 1), thread_name_prefix="rss-dates"
+                )
+                self.dates_executor.submit(
+                    self.util.git_log_worker.prefetch, pages_paths
+                )
+
+        # incremental rebuilds: invalidate pages processed by previous builds if the
+        # configuration or the git history changed
+        if self.cmd_is_serve:
+            pages_cache_fingerprint = Util.get_signature(
+                self.plugin_config_fingerprint,
+                config.site_url,
+                self.util.git_dates_index.head if self.util.git_dates_index else None,
             )
-            self.feed_created.rss_url = self.feed_updated.json_url = (
-                self.feed_updated.rss_url
-            ) = self.feed_updated.json_url = None
+            if pages_cache_fingerprint != self.pages_cache_fingerprint:
+                self.pages_cache = {}
+                self.pages_cache_fingerprint = pages_cache_fingerprint
 
-        # ending event
-        return config
+            # forget removed pages. Dirty rebuilds don't render unmodified pages
+            # again: the cached ones are offered at the end of the build.
+            self.pages_cache = {
+                file.src_uri: self.pages_cache[file.src_uri]
+                for file in files.documentation_pages()
+                if file.src_uri in self.pages_cache
+            }
+            self.pages_not_rendered = dict.fromkeys(self.pages_cache)
+
+        return files
 
     @event_priority(priority=-75)
     def on_page_content(
@@ -302,6 +529,8 @@ class GitRssPlugin(BasePlugin[RssPluginConfig]):
         if not self.config.enabled:
             return
 
+        self.pages_not_rendered.pop(page.file.src_uri, None)
+
         # skip pages that don't match the config var match_path
         if not self.match_path_pattern.match(page.file.src_uri):
             return
@@ -309,10 +538,24 @@ class GitRssPlugin(BasePlugin[RssPluginConfig]):
         # skip pages with draft=true
         if page.meta.get("draft", False) is True:
             logger.debug(f"Page {page.title} ignored because it's a draft")
+            self.pages_cache.pop(page.file.src_uri, None)
             return
 
-        # retrieve dates from git log
-        page_dates = self.util.get_file_dates(
+        # incremental rebuild: reuse page information if its source did not change
+        if self.cmd_is_serve:
+            page_signature = Util.get_signature(
+                page.title, page.meta, page.markdown, page.content
+            )
+            cached_page = self.pages_cache.get(page.file.src_uri)
+            if cached_page is not None and cached_page[0] == page_signature:
+                logger.debug(f"Page {page.file.src_uri} unchanged since last build.")
+                self.pages_pending.append((page.file.src_uri, cached_page[1]))
+                self.offer_resolved_pages()
+                return
+
+        # retrieve dates from page meta while the page is processed, then complete
+        # them from git, in background if they are read from the git log
+        dt_created, dt_updated = self.util.get_file_dates_from_meta(
             in_page=page,
             source_date_creation=self.config.date_from_meta.as_creation,
             source_date_update=self.config.date_from_meta.as_update,
@@ -320,7 +563,65 @@ class GitRssPlugin(BasePlugin[RssPluginConfig]):
             meta_default_timezone=self.config.date_from_meta.default_timezone,
             meta_default_time=self.config.date_from_meta.default_time,
         )
+        get_page_dates = partial(
+            self.util.complete_file_dates,
+            abs_src_path=page.file.abs_src_path,
+            dt_created=dt_created,
+            dt_updated=dt_updated,
+            meta_default_timezone=self.config.date_from_meta.default_timezone,
+        )
+        if self.dates_executor is not None:
+            page_dates_future = self.dates_executor.submit(get_page_dates)
+        else:
+            page_dates_future = None
+
+        # page URL with custom parameters and URL of its comments
+        page_url_full, page_url_comments = self.get_page_urls(page)
+
+        # abstract rendering is deferred to pages selected in feeds
+        description, abstract_markdown = self.util.get_description_or_abstract_source(
+            in_page=page,
+            chars_count=self.config.abstract_chars_count,
+            abstract_delimiter=self.config.abstract_delimiter,
+        )
+
+        # offered to the selections once dates are resolved, replacing any previous
+        # version of the page
+        page_info = PageInformation(
+            abs_path=Path(page.file.abs_src_path),
+            authors=self.util.get_authors_from_meta(in_page=page),
+            categories=self.util.get_categories_from_meta(
+                in_page=page, categories_labels=self.config.categories
+            ),
+            comments_url=page_url_comments,
+            description=description,
+            guid=page.canonical_url,
+            link=page_url_full,
+            title=page.title,
+            # for later fetch
+            _abstract_markdown=abstract_markdown,
+            _dates_future=page_dates_future,
+            _mkdocs_page_ref=MkdocsPageSubset.from_page(page),
+        )
+        if page_dates_future is None:
+            self.set_page_dates(page_info, page_dates=get_page_dates())
+        self.pages_pending.append((page.file.src_uri, page_info))
+        if self.cmd_is_serve:
+            self.pages_cache[page.file.src_uri] = (page_signature, page_info)
 
+        # offer pages whose dates are known, keeping the processing order
+        self.offer_resolved_pages()
+
+    def get_page_urls(self, page: Page) -> tuple[str, str | None]:
+        """Build the URL of a page, with the custom URL parameters, and the URL of its
+        comments.
+
+        Args:
+            page (Page): `mkdocs.structure.pages.Page` instance
+
+        Returns:
+            tuple[str, str | None]: page URL and comments URL, if comments path is set
+        """
         # handle custom URL parameters
         if self.config.url_parameters:
             page_url_full = self.util.build_url(
@@ -340,30 +641,91 @@ class GitRssPlugin(BasePlugin[RssPluginConfig]):
         else:
             page_url_comments = None
 
-        # append to list to be filtered later
-        self.pages_to_filter.append(
-            PageInformation(
-                abs_path=Path(page.file.abs_src_path),
-                authors=self.util.get_authors_from_meta(in_page=page),
-                categories=self.util.get_categories_from_meta(
-                    in_page=page, categories_labels=self.config.categories
-                ),
-                comments_url=page_url_comments,
-                created=page_dates[0],
-                description=self.util.get_description_or_abstract(
-                    in_page=page,
-                    chars_count=self.config.abstract_chars_count,
-                    abstract_delimiter=self.config.abstract_delimiter,
-                ),
-                guid=page.canonical_url,
-                link=page_url_full,
-                title=page.title,
-                updated=page_dates[1],
-                # for later fetch
-                _mkdocs_page_ref=MkdocsPageSubset.from_page(page),
+        return page_url_full, page_url_comments
+
+    def set_page_dates(
+        self, page_info: PageInformation, page_dates: tuple[datetime, datetime]
+    ) -> None:
+        """Set creation and update dates of a page, flagging the ones falling back to
+        the build date.
+
+        Args:
+            page_info (PageInformation): page to update
+            page_dates (tuple[datetime, datetime]): creation and update dates
+        """
+        page_info.created, page_info.updated = page_dates
+        page_info._volatile_dates = tuple(
+            date_attribute
+            for date_attribute, page_date in zip(
+                ("created", "updated"), page_dates, strict=True
             )
+            if page_date is self.util.build_datetime
         )
 
+    def add_entry(self, page_info: PageInformation, key: str) -> None:
+        """Offer a page to the feeds selections, including the ones by author and by
+        category.
+
+        Args:
+            page_info (PageInformation): page to offer
+            key (str): unique identifier of the page (i.e. its source URI)
+        """
+        self.entries_created.add(page_info, key=key)
+        self.entries_updated.add(page_info, key=key)
+        if self.entries_archived is not None:
+            self.entries_archived.add(page_info, key=key)
+        if self.entries_by_author is not None:
+            self.entries_by_author.add(page_info, groups=page_info.authors, key=key)
+        if self.entries_by_category is not None:
+            self.entries_by_category.add(
+                page_info, groups=page_info.categories, key=key
+            )
+
+    def offer_resolved_pages(self, wait: bool = False) -> None:
+        """Offer the pending pages to the selections as soon as their dates are
+        resolved, in processing order, so only pages still being resolved are kept.
+
+        Args:
+            wait (bool, optional): wait for the dates of every pending page. Defaults
+                to False.
+        """
+        while self.pages_pending:
+            key, page_info = self.pages_pending[0]
+            if page_info._dates_future is not None:
+                if not (wait or page_info._dates_future.done()):
+                    return
+                self.set_page_dates(
+                    page_info, page_dates=page_info._dates_future.result()
+                )
+                page_info._dates_future = None
+            self.pages_pending.popleft()
+            self.add_entry(page_info, key=key)
+
+    def resolve_pending_pages(self) -> None:
+        """Wait for the dates of the pages processed during the build, offer the
+        pages to the selections, then stop the threads and the git process reading
+        pages dates.
+        """
+        self.offer_resolved_pages(wait=True)
+
+        # pages skipped by a dirty rebuild are unchanged since they were cached
+        for key in self.pages_not_rendered:
+            self.add_entry(self.pages_cache[key][1], key=key)
+        self.pages_not_rendered = {}
+
+        self.stop_dates_lookups()
+
+    def stop_dates_lookups(self) -> None:
+        """Stop the threads and the git process reading pages dates, if any, dropping
+        the lookups not started yet. A new git process is started if dates are looked
+        up again.
+        """
+        if self.dates_executor is not None:
+            self.dates_executor.shutdown(cancel_futures=True)
+            self.dates_executor = None
+        if self.util is not None and self.util.git_log_worker is not None:
+            self.util.git_log_worker.close()
+
     def on_post_build(self, config: config_options.Config) -> None:
         """The post_build event does not alter any variables. Use this event to call
             post-build scripts.
@@ -378,135 +740,426 @@ class GitRssPlugin(BasePlugin[RssPluginConfig]):
         if not self.config.enabled:
             return
 
-        # pretty print or not
-        pretty_print = self.config.pretty_print
+        # every page has been processed: join their dates and offer them to the
+        # selections
+        self.resolve_pending_pages()
+
+        # feeds to write: (feed, dates attribute, RSS filename, JSON filename)
+        feeds_outputs: list[
+            tuple[RssFeedBase, Literal["created", "updated"], str, str]
+        ] = [
+            (
+                self.feed_created,
+                "created",
+                self.config.feeds_filenames.rss_created,
+                self.config.feeds_filenames.json_created,
+            ),
+            (
+                self.feed_updated,
+                "updated",
+                self.config.feeds_filenames.rss_updated,
+                self.config.feeds_filenames.json_updated,
+            ),
+        ]
 
-        # output filepaths
-        out_feed_created = Path(config.site_dir).joinpath(
-            self.config.feeds_filenames.rss_created
-        )
-        out_feed_updated = Path(config.site_dir).joinpath(
-            self.config.feeds_filenames.rss_updated
-        )
-        out_json_created = Path(config.site_dir).joinpath(
-            self.config.feeds_filenames.json_created
-        )
-        out_json_updated = Path(config.site_dir).joinpath(
-            self.config.feeds_filenames.json_updated
-        )
+        # precompressed siblings of the written files
+        if self.config.precompress:
+            self.compressor = FeedsCompressor()
 
         # stylesheet for RSS feed
         if self.config.stylesheet == "auto":
             xsl_source = self.tpl_folder.joinpath("default.xsl")
             xsl_dest = Path(config.site_dir).joinpath("rss.xsl")
             copyfile(xsl_source, xsl_dest)
+            if self.compressor:
+                self.compressor.submit(xsl_dest)
 
         # created items
-        self.feed_created.entries.extend(
-            self.util.filter_pages(
-                pages=self.pages_to_filter,
-                filter_attribute="created",
-                length=self.config.length,
-            )
-        )
+        self.feed_created.entries.extend(self.entries_created.select())
 
         # updated items
-        self.feed_updated.entries.extend(
-            self.util.filter_pages(
-                pages=self.pages_to_filter,
-                filter_attribute="updated",
-                length=self.config.length,
-            )
-        )
+        self.feed_updated.entries.extend(self.entries_updated.select())
+
+        # feeds by author and by category, sharing the pages of the main feeds
+        for grouped_entries, filename_pattern in (
+            (self.entries_by_author, self.config.authors_feeds.filename_pattern),
+            (self.entries_by_category, self.config.categories_feeds.filename_pattern),
+        ):
+            if grouped_entries is not None:
+                feeds_outputs.extend(
+                    self.build_grouped_feeds(
+                        grouped_entries=grouped_entries,
+                        filename_pattern=filename_pattern,
+                    )
+                )
+
+        # archives of the feed by creation date, written only if they changed
+        archives_outputs: list[tuple[RssFeedBase, str, tuple]] = []
+        if self.entries_archived is not None:
+            archives_outputs = self.build_archives(site_dir=config.site_dir)
+
+        # a page can be selected by several feeds but is loaded only once
+        feeds_entries = [
+            page
+            for feed, *_ in feeds_outputs + archives_outputs
+            for page in feed.entries
+        ]
+
+        # render abstracts of selected items only
+        self.util.load_descriptions_for_pages(feeds_entries)
 
         # load RSS items images (enclosures)
         logger.debug(
-            f"Loading images for {len(self.feed_created.entries)} pages by creation "
-            f"and {len(self.feed_updated.entries)} pages by update"
-        )
-        processed_refs = set()
-        self.util.load_images_for_pages(
-            self.feed_created.entries, config.site_url, processed_refs
+            f"Loading images for {len(feeds_entries)} items of {len(feeds_outputs)} "
+            "feeds"
         )
-        self.util.load_images_for_pages(
-            self.feed_updated.entries, config.site_url, processed_refs
+        self.util.load_images_for_pages(feeds_entries, config.site_url)
+
+        # outputs are independent from each other once items are loaded
+        feeds_writers = self.get_feeds_writers(
+            feeds_outputs=feeds_outputs,
+            archives_outputs=archives_outputs,
+            site_dir=config.site_dir,
         )
 
+        # render and write outputs concurrently
+        with ThreadPoolExecutor(
+            max_workers=min(len(feeds_writers), (cpu_count() or 1) + 4),
+            thread_name_prefix="mkdocs-rss-feeds",
+        ) as executor:
+            for future in [executor.submit(writer) for writer in feeds_writers]:
+                future.result()
+
+        self.outputs_cache.save()
+
+        if self.compressor:
+            self.compressor.join()
+            self.compressor = None
+
+    def get_feeds_writers(
+        self,
+        feeds_outputs: list[
+            tuple[RssFeedBase, Literal["created", "updated"], str, str]
+        ],
+        archives_outputs: list[tuple[RssFeedBase, str, tuple]],
+        site_dir: str,
+    ) -> list[Callable[[], None]]:
+        """Prepare the writing of each enabled output of the feeds, whose items are
+        loaded.
+
+        Args:
+            feeds_outputs (list[tuple[RssFeedBase, str, str, str]]): feeds to write,
+                with their dates attribute and their RSS and JSON filenames
+            archives_outputs (list[tuple[RssFeedBase, str, tuple]]): archives to
+                write, with their RSS filename and the values to compute their digest
+            site_dir (str): website build folder
+
+        Returns:
+            list[Callable[[], None]]: writers of the outputs, independent from each
+                other
+        """
+        feeds_writers: list[Callable[[], None]] = []
+
         # RSS
         if self.config.rss_feed_enabled:
-            # Jinja environment depending on the pretty print option
-            if pretty_print:
-                # load Jinja environment and template
-                env = Environment(
-                    autoescape=select_autoescape(["html", "xml"]),
-                    loader=FileSystemLoader(self.tpl_folder),
+            # set pub dates on distinct items since feeds can share pages
+            logger.debug("Fill creation and update dates of RSS items.")
+            for feed, filter_attribute, rss_filename, _ in feeds_outputs:
+                feed.entries = [
+                    replace(
+                        page,
+                        pub_date=format_datetime(dt=getattr(page, filter_attribute)),
+                    )
+                    for page in feed.entries
+                ]
+
+                # -- Feeds sorted by creation and last update dates
+                feeds_writers.append(
+                    partial(
+                        self.write_feed,
+                        out_file=Path(site_dir).joinpath(rss_filename),
+                        site_dir=site_dir,
+                        digest_values=(self.get_digest_feed(feed),),
+                        writer=partial(self.template_engine.write, feed=feed),
+                    )
                 )
-            else:
-                # load Jinja environment and template
-                env = Environment(
-                    autoescape=select_autoescape(["html", "xml"]),
-                    loader=FileSystemLoader(self.tpl_folder),
-                    lstrip_blocks=True,
-                    trim_blocks=True,
+
+            for feed, rss_filename, digest_values in archives_outputs:
+                feed.entries = [
+                    replace(page, pub_date=format_datetime(dt=page.created))
+                    for page in feed.entries
+                ]
+                feeds_writers.append(
+                    partial(
+                        self.write_feed,
+                        out_file=Path(site_dir).joinpath(rss_filename),
+                        site_dir=site_dir,
+                        digest_values=digest_values,
+                        writer=partial(self.template_engine.write, feed=feed),
+                    )
                 )
-            template = env.get_template(self.tpl_file.name)
-
-            # -- Feed sorted by creation date
-            logger.debug("Fill creation dates and dump created feed into RSS template.")
-            # set pub date as created
-            for page in self.feed_created.entries:
-                page.pub_date = format_datetime(dt=page.created)
-
-            # write file
-            with out_feed_created.open(mode="w", encoding="UTF8") as fifeed_created:
-                if pretty_print:
-                    fifeed_created.write(template.render(feed=self.feed_created))
-                else:
-                    prev_char = ""
-                    for char in template.render(feed=asdict(self.feed_created)):
-                        if char == "\n":
-                            # convert new lines to spaces to preserve sentence structure
-                            char = " "
-                        if char == " " and prev_char == " ":
-                            prev_char = char
-                            continue
-                        prev_char = char
-                        fifeed_created.write(char)
-
-            # -- Feed sorted by last update date
-            logger.debug("Fill update dates and dump udpated feed into RSS template.")
-            # set pub date as updated
-            for page in self.feed_updated.entries:
-                page.pub_date = format_datetime(dt=page.updated)
-
-            # write file
-            with out_feed_updated.open(mode="w", encoding="UTF8") as fifeed_updated:
-                if pretty_print:
-                    fifeed_updated.write(template.render(feed=self.feed_updated))
-                else:
-                    prev_char = ""
-                    for char in template.render(feed=asdict(self.feed_updated)):
-                        if char == "\n":
-                            # convert new lines to spaces to preserve sentence structure
-                            char = " "
-                        if char == " " and prev_char == " ":
-                            prev_char = char
-                            continue
-                        prev_char = char
-                        fifeed_updated.write(char)
 
         # JSON FEED
         if self.config.json_feed_enabled:
-            with out_json_created.open(mode="w", encoding="UTF8") as fp:
-                json.dump(
-                    self.util.feed_to_json(self.feed_created),
-                    fp,
-                    indent=4 if self.config.pretty_print else None,
+            for feed, _, _, json_filename in feeds_outputs:
+                feeds_writers.append(
+                    partial(
+                        self.write_json_feed,
+                        feed=feed,
+                        out_file=Path(site_dir).joinpath(json_filename),
+                        site_dir=site_dir,
+                    )
                 )
 
-            with out_json_updated.open(mode="w", encoding="UTF8") as fp:
-                json.dump(
-                    self.util.feed_to_json(self.feed_updated),
-                    fp,
-                    indent=4 if self.config.pretty_print else None,
+        return feeds_writers
+
+    def on_build_error(self, *, error: Exception) -> None:
+        """The build_error event is called after an exception of any kind is caught by
+            MkDocs during the build process. Used to stop the threads and the git
+            process reading pages dates, which are otherwise stopped at the end of
+            the build.
+
+        See: https://www.mkdocs.org/user-guide/plugins/#on_build_error
+
+        Args:
+            error (Exception): exception raised during the build
+        """
+        self.stop_dates_lookups()
+
+    def on_shutdown(self) -> None:
+        """The shutdown event runs once at the very end of an `mkdocs` invocation,
+            before exiting. Used to stop the threads and the git process reading
+            pages dates left by an interrupted build (i.e. mkdocs serve).
+
+        See: https://www.mkdocs.org/user-guide/plugins/#on_shutdown
+        """
+        self.stop_dates_lookups()
+
+    def build_grouped_feeds(
+        self, grouped_entries: GroupedEntriesSelector, filename_pattern: str
+    ) -> list[tuple[RssFeedBase, Literal["created", "updated"], str, str]]:
+        """Derive a feed by creation date and a feed by update date from the main
+        feed for each group (i.e. author or category) of selected pages.
+
+        Args:
+            grouped_entries (GroupedEntriesSelector): selected pages by group
+            filename_pattern (str): path of the outputs relative to the site folder,
+                formatted with the group `slug` and the main feed `filename`
+
+        Returns:
+            list[tuple[RssFeedBase, Literal["created", "updated"], str, str]]: feeds
+                to write, with their dates attribute and their RSS and JSON filenames
+        """
+        feeds_outputs = []
+        for slug, name, entries_created, entries_updated in grouped_entries.select():
+            for filter_attribute, entries, rss_filename, json_filename in (
+                (
+                    "created",
+                    entries_created,
+                    self.config.feeds_filenames.rss_created,
+                    self.config.feeds_filenames.json_created,
+                ),
+                (
+                    "updated",
+                    entries_updated,
+                    self.config.feeds_filenames.rss_updated,
+                    self.config.feeds_filenames.json_updated,
+                ),
+            ):
+                rss_filename = filename_pattern.format(slug=slug, filename=rss_filename)
+                json_filename = filename_pattern.format(
+                    slug=slug, filename=json_filename
+                )
+                feed = replace(
+                    self.base_feed,
+                    entries=entries,
+                    title=f"{self.base_feed.title} - {name}",
                 )
+                if self.base_feed.html_url:
+                    feed.rss_url = self.base_feed.html_url + rss_filename
+                    feed.json_url = self.base_feed.html_url + json_filename
+                feeds_outputs.append(
+                    (feed, filter_attribute, rss_filename, json_filename)
+                )
+
+        return feeds_outputs
+
+    def build_archives(self, site_dir: str) -> list[tuple[RssFeedBase, str, tuple]]:
+        """Split the pages, from the oldest to the most recent, into archived feeds
+        of `archives.page_size` items linked to each other and to the current feed
+        (RFC 5005). Only full pages are archived, so an archive does not change when
+        pages are added, apart from the link to the next archive.
+
+        Archives are identified by their items sources (i.e. not rendered abstracts),
+        so unchanged archives are kept as they are without loading their items.
+
+        Args:
+            site_dir (str): website build folder
+
+        Returns:
+            list[tuple[RssFeedBase, str, tuple]]: archives to write, with their RSS
+                filename and the values to compute their digest
+        """
+        page_size = max(self.config.archives.page_size, 1)
+        # from the oldest to the most recent
+        entries = self.entries_archived.select()[::-1]
+        archives_count = len(entries) // page_size
+
+        def get_filename(index: int) -> str:
+            return self.config.archives.filename_pattern.format(
+                page=index, filename=self.config.feeds_filenames.rss_created
+            )
+
+        def get_url(index: int) -> str | None:
+            if not self.base_feed.html_url or not 0 < index <= archives_count:
+                return None
+            return self.base_feed.html_url + get_filename(index)
+
+        # the current feed links to the most recent archive
+        self.feed_created.prev_archive_url = get_url(archives_count)
+
+        archives_outputs = []
+        for index in range(1, archives_count + 1):
+            feed = replace(
+                self.base_feed,
+                archive=True,
+                current_url=self.feed_created.rss_url,
+                entries=entries[(index - 1) * page_size : index * page_size][::-1],
+                next_archive_url=get_url(index + 1),
+                prev_archive_url=get_url(index - 1),
+                rss_url=get_url(index),
+            )
+            # items sources, as their abstract and image are not loaded yet
+            digest_values = (
+                Util.get_signature(
+                    replace(feed, buildDate=None, entries=[], pubDate=None),
+                    [
+                        (
+                            self.get_digest_page(page),
+                            page._abstract_markdown,
+                            (
+                                page._mkdocs_page_ref.meta
+                                if page._mkdocs_page_ref
+                                else None
+                            ),
+                        )
+                        for page in feed.entries
+                    ],
+                ),
+            )
+
+            out_file = Path(site_dir).joinpath(get_filename(index))
+            key = out_file.relative_to(site_dir).as_posix()
+            if self.outputs_cache.restore(
+                key=key,
+                digest=self.get_feed_digest(key=key, digest_values=digest_values),
+                out_file=out_file,
+            ):
+                if self.compressor:
+                    self.compressor.submit(out_file)
+                continue
+
+            archives_outputs.append((feed, get_filename(index), digest_values))
+
+        logger.debug(
+            f"{len(archives_outputs)} archived feeds to write out of {archives_count}."
+        )
+        return archives_outputs
+
+    def write_json_feed(self, feed: RssFeedBase, out_file: Path, site_dir: str) -> None:
+        """Write a feed as JSON Feed, unless its content did not change since the
+        previous build.
+
+        Args:
+            feed (RssFeedBase): feed to write
+            out_file (Path): output file
+            site_dir (str): website build folder
+        """
+        self.write_feed(
+            out_file=out_file,
+            site_dir=site_dir,
+            digest_values=(
+                self.json_serializer.backend,
+                self.get_digest_feed(feed),
+            ),
+            writer=partial(self.json_serializer.write, feed=feed),
+        )
+
+    def write_feed(
+        self,
+        out_file: Path,
+        site_dir: str,
+        digest_values: tuple,
+        writer: Callable[..., None],
+    ) -> None:
+        """Write a feed file, unless its content did not change since the previous
+        build. Volatile values (i.e. build date) must be excluded from the values
+        used to compute the digest.
+
+        Args:
+            out_file (Path): output file
+            site_dir (str): website build folder
+            digest_values (tuple): values defining the feed content
+            writer (Callable[..., None]): function writing the feed into the file
+                passed as `out_file` keyword argument
+        """
+        key = out_file.relative_to(site_dir).as_posix()
+        digest = self.get_feed_digest(key=key, digest_values=digest_values)
+        if not self.outputs_cache.restore(key=key, digest=digest, out_file=out_file):
+            out_file.parent.mkdir(parents=True, exist_ok=True)
+            writer(out_file=out_file)
+            self.outputs_cache.store(key=key, digest=digest, out_file=out_file)
+
+        if self.compressor:
+            self.compressor.submit(out_file)
+
+    @staticmethod
+    def get_digest_page(page: PageInformation) -> PageInformation:
+        """Copy of a feed item without its dates falling back to the build date, to
+        compute the feed digest.
+
+        Args:
+            page (PageInformation): feed item
+
+        Returns:
+            PageInformation: feed item without volatile values
+        """
+        if not page._volatile_dates:
+            return page
+        return replace(
+            page,
+            pub_date=None,
+            **{date_attribute: None for date_attribute in page._volatile_dates},
+        )
+
+    @classmethod
+    def get_digest_feed(cls, feed: RssFeedBase) -> RssFeedBase:
+        """Copy of a feed without its volatile values (build dates), to compute its
+        digest.
+
+        Args:
+            feed (RssFeedBase): feed to write
+
+        Returns:
+            RssFeedBase: feed without volatile values
+        """
+        return replace(
+            feed,
+            buildDate=None,
+            entries=[cls.get_digest_page(page) for page in feed.entries],
+            pubDate=None,
+        )
+
+    def get_feed_digest(self, key: str, digest_values: tuple) -> str:
+        """Compute the digest of a feed, to compare it with the previous build.
+
+        Args:
+            key (str): output path relative to the site folder
+            digest_values (tuple): values defining the feed content
+
+        Returns:
+            str: feed digest
+        """
+        return Util.get_signature(
+            key, self.config.pretty_print, __version__, *digest_values
+        )
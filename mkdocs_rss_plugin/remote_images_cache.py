@@ -0,0 +1,168 @@
+#! python3  # noqa: E265
+
+# ############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+import json
+from dataclasses import asdict
+from pathlib import Path
+from threading import Lock
+from time import time
+
+# 3rd party
+from mkdocs.plugins import get_plugin_logger
+
+# package
+from mkdocs_rss_plugin.constants import MKDOCS_LOGGER_NAME
+from mkdocs_rss_plugin.models import RemoteImageMetadata
+
+# ############################################################################
+# ########## Globals #############
+# ################################
+
+logger = get_plugin_logger(MKDOCS_LOGGER_NAME)
+
+# name of the file persisting the metadata within the plugin's cache folder
+CACHE_FILENAME: str = "remote_images.json"
+STATUS_ERROR: str = "error"
+STATUS_OK: str = "ok"
+
+# ############################################################################
+# ########## Classes #############
+# ################################
+
+
+class RemoteImagesCache:
+    """Persistent store of remote images metadata (length, mime type), consulted
+    before any network call. Unreachable images are cached too, with a shorter
+    time to live.
+    """
+
+    def __init__(
+        self, cache_dir: Path, ttl: int = 10080, ttl_errors: int = 1440
+    ) -> None:
+        """Initialize the cache and load the metadata persisted by previous builds.
+
+        Args:
+            cache_dir (Path): folder where the metadata are persisted
+            ttl (int, optional): time to live of the metadata of reachable images,
+                in minutes. Defaults to 10080 (1 week).
+            ttl_errors (int, optional): time to live of unreachable images, in
+                minutes. Defaults to 1440 (1 day).
+        """
+        self.cache_file = Path(cache_dir).joinpath(CACHE_FILENAME)
+        self.ttl = ttl
+        self.ttl_errors = ttl_errors
+        self.records: dict[str, RemoteImageMetadata] = {}
+        # URLs stored during the current build, to be persisted
+        self.updated_urls: set[str] = set()
+        self.lock = Lock()
+
+        self.load()
+
+    def get(self, url: str, ignore_ttl: bool = False) -> RemoteImageMetadata | None:
+        """Get metadata of a remote image, unless missing or expired.
+
+        Args:
+            url (str): image URL
+            ignore_ttl (bool, optional): return expired metadata too, e.g. when they
+                can't be fetched again. Defaults to False.
+
+        Returns:
+            RemoteImageMetadata | None: cached metadata
+        """
+        with self.lock:
+            record = self.records.get(url)
+
+        if record is None or (not ignore_ttl and self.is_expired(record)):
+            return None
+
+        return record
+
+    def is_expired(self, record: RemoteImageMetadata) -> bool:
+        """Check if metadata of a remote image are older than their time to live.
+
+        Args:
+            record (RemoteImageMetadata): cached metadata
+
+        Returns:
+            bool: True if the metadata have to be fetched again
+        """
+        ttl = self.ttl if record.status == STATUS_OK else self.ttl_errors
+        return time() - record.fetched_at > ttl * 60
+
+    def set(
+        self,
+        url: str,
+        status: str,
+        length: int | None = None,
+        mime_type: str | None = None,
+    ) -> None:
+        """Store metadata of a remote image.
+
+        Args:
+            url (str): image URL
+            status (str): STATUS_OK or STATUS_ERROR
+            length (int | None, optional): image length. Defaults to None.
+            mime_type (str | None, optional): image mime type. Defaults to None.
+        """
+        with self.lock:
+            self.records[url] = RemoteImageMetadata(
+                fetched_at=time(), status=status, length=length, mime_type=mime_type
+            )
+            self.updated_urls.add(url)
+
+    def load(self) -> None:
+        """Load metadata persisted by previous builds."""
+        self.records = self.read()
+
+    def read(self) -> dict[str, RemoteImageMetadata]:
+        """Read the metadata file.
+
+        Returns:
+            dict[str, RemoteImageMetadata]: image URL -> cached metadata
+        """
+        if not self.cache_file.is_file():
+            return {}
+
+        try:
+            with self.cache_file.open(mode="r", encoding="UTF-8") as in_file:
+                return {
+                    url: RemoteImageMetadata(**record)
+                    for url, record in json.load(in_file).items()
+                }
+        except (OSError, TypeError, ValueError, AttributeError) as err:
+            logger.debug(f"Unable to read remote images cache {self.cache_file}: {err}")
+            return {}
+
+    def save(self) -> None:
+        """Persist metadata for the next builds, if they changed. Metadata written
+        meanwhile by other plugin instances sharing the same cache folder are kept,
+        expired ones are dropped.
+        """
+        with self.lock:
+            if not self.updated_urls:
+                return
+
+            records = self.read()
+            records.update({url: self.records[url] for url in self.updated_urls})
+            try:
+                self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_cache_file = self.cache_file.with_suffix(".tmp")
+                with tmp_cache_file.open(mode="w", encoding="UTF-8") as out_file:
+                    json.dump(
+                        {
+                            url: asdict(record)
+                            for url, record in records.items()
+                            if not self.is_expired(record)
+                        },
+                        out_file,
+                    )
+                tmp_cache_file.replace(self.cache_file)
+                self.updated_urls.clear()
+            except OSError as err:
+                logger.debug(
+                    f"Unable to write remote images cache {self.cache_file}: {err}"
+                )
@@ -0,0 +1,176 @@
+#! python3  # noqa: E265
+
+# ############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+from pathlib import Path
+
+# 3rd party
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    select_autoescape,
+)
+from mkdocs.plugins import get_plugin_logger
+
+# package
+from mkdocs_rss_plugin.constants import MKDOCS_LOGGER_NAME
+from mkdocs_rss_plugin.minifier import WhitespaceMinifier
+from mkdocs_rss_plugin.models import RssFeedBase
+
+# ############################################################################
+# ########## Globals #############
+# ################################
+
+logger = get_plugin_logger(MKDOCS_LOGGER_NAME)
+
+# number of characters rendered before being minified and written at once
+STREAM_BUFFER_SIZE: int = 65536
+
+# ############################################################################
+# ########## Classes #############
+# ################################
+
+
+class FeedTemplateEngine:
+    """Jinja environment shared by all the feeds rendered by a plugin instance, so
+    the RSS template is compiled only once, even across `mkdocs serve` rebuilds.
+    """
+
+    def __init__(
+        self,
+        template_path: Path,
+        pretty_print: bool = False,
+        bytecode_cache_dir: Path | None = None,
+    ) -> None:
+        """Initialize the template engine.
+
+        Args:
+            template_path (Path): path to the Jinja template of the RSS feed
+            pretty_print (bool, optional): keep the template indentation and line
+                breaks. Defaults to False.
+            bytecode_cache_dir (Path | None, optional): folder where Jinja persists
+                compiled templates for the next builds. Defaults to None.
+        """
+        self.template_path = Path(template_path)
+        self.pretty_print = pretty_print
+        self.bytecode_cache_dir = bytecode_cache_dir
+
+        bytecode_cache = None
+        if bytecode_cache_dir is not None:
+            try:
+                Path(bytecode_cache_dir).mkdir(parents=True, exist_ok=True)
+                # cache keys do not depend on the environment options, so
+                # templates compiled with and without whitespace control are stored
+                # in distinct files
+                cache_variant = "pretty" if pretty_print else "minified"
+                bytecode_cache = FileSystemBytecodeCache(
+                    directory=str(bytecode_cache_dir),
+                    pattern=f"__jinja2_{cache_variant}_%s.cache",
+                )
+            except OSError as err:
+                logger.debug(
+                    f"Unable to use {bytecode_cache_dir} as Jinja bytecode cache: "
+                    f"{err}"
+                )
+
+        # Jinja environment depending on the pretty print option
+        self.env = Environment(
+            autoescape=select_autoescape(["html", "xml"]),
+            bytecode_cache=bytecode_cache,
+            loader=FileSystemLoader(self.template_path.parent),
+            lstrip_blocks=not pretty_print,
+            trim_blocks=not pretty_print,
+        )
+        self._template: Template | None = None
+
+    def is_compatible(
+        self,
+        template_path: Path,
+        pretty_print: bool,
+        bytecode_cache_dir: Path | None = None,
+    ) -> bool:
+        """Check if the engine can be reused with the given settings.
+
+        Args:
+            template_path (Path): path to the Jinja template of the RSS feed
+            pretty_print (bool): pretty print option
+            bytecode_cache_dir (Path | None, optional): folder of the Jinja bytecode
+                cache. Defaults to None.
+
+        Returns:
+            bool: True if the engine has been created with the same settings
+        """
+        return (
+            self.template_path == Path(template_path)
+            and self.pretty_print == pretty_print
+            and self.bytecode_cache_dir == bytecode_cache_dir
+        )
+
+    @property
+    def template(self) -> Template:
+        """Compiled RSS template, loaded on first use. Jinja checks the template
+        file is still up to date before reusing it.
+
+        Returns:
+            Template: compiled template
+        """
+        if self._template is None or not self._template.is_up_to_date:
+            self._template = self.env.get_template(self.template_path.name)
+        return self._template
+
+    def render(self, feed: RssFeedBase) -> str:
+        """Render a feed, directly from its dataclass. Whitespaces are collapsed
+        unless pretty print is enabled.
+
+        Args:
+            feed (RssFeedBase): feed to render
+
+        Returns:
+            str: rendered RSS feed
+        """
+        rendered_feed = self.template.render(feed=feed)
+        if self.pretty_print:
+            return rendered_feed
+
+        # convert new lines to spaces to preserve sentence structure
+        return WhitespaceMinifier.minify(rendered_feed)
+
+    def write(
+        self,
+        feed: RssFeedBase,
+        out_file: Path,
+        buffer_size: int = STREAM_BUFFER_SIZE,
+    ) -> None:
+        """Stream a rendered feed into a file, entry after entry, instead of
+        rendering the whole document in memory. Whitespaces are collapsed on the fly
+        unless pretty print is enabled.
+
+        Args:
+            feed (RssFeedBase): feed to render
+            out_file (Path): path to the output file
+            buffer_size (int, optional): number of characters to render before
+                writing them. Defaults to STREAM_BUFFER_SIZE.
+        """
+        minifier = None if self.pretty_print else WhitespaceMinifier()
+        buffer: list[str] = []
+        buffered_length = 0
+
+        with Path(out_file).open(mode="w", encoding="UTF8") as fifeed:
+            for chunk in self.template.generate(feed=feed):
+                buffer.append(chunk)
+                buffered_length += len(chunk)
+                if buffered_length < buffer_size:
+                    continue
+
+                text = "".join(buffer)
+                fifeed.write(minifier.feed(text) if minifier else text)
+                buffer.clear()
+                buffered_length = 0
+
+            text = "".join(buffer)
+            fifeed.write(minifier.feed(text) if minifier else text)
@@ -6,31 +6,23 @@
 
 # standard library
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from functools import lru_cache
+from hashlib import sha256
 from mimetypes import guess_type
 from pathlib import Path
-from typing import Any, Literal
+from re import compile as re_compile
+from threading import BoundedSemaphore, Lock
+from typing import TYPE_CHECKING, Any, Literal, Optional
+from unicodedata import normalize
 from urllib.parse import urlencode, urlparse, urlunparse
 
 # 3rd party
-import markdown
-import urllib3
-from cachecontrol import CacheControl
-from cachecontrol.caches.file_cache import SeparateBodyFileCache
-from git import (
-    GitCommandError,
-    GitCommandNotFound,
-    InvalidGitRepositoryError,
-    Optional,
-    Repo,
-)
 from mkdocs.config.defaults import MkDocsConfig
 from mkdocs.plugins import get_plugin_logger
 from mkdocs.structure.pages import Page
 from mkdocs.utils import get_build_datetime
-from requests import Session
-from requests.exceptions import ConnectionError, HTTPError
 
 # package
 from mkdocs_rss_plugin.constants import (
@@ -38,22 +30,38 @@ from mkdocs_rss_plugin.constants import (
     MKDOCS_LOGGER_NAME,
     REMOTE_REQUEST_HEADERS,
 )
-from mkdocs_rss_plugin.git_manager.ci import CiHandler
-from mkdocs_rss_plugin.integrations.theme_material_blog_plugin import (
-    IntegrationMaterialBlog,
-)
-from mkdocs_rss_plugin.integrations.theme_material_social_plugin import (
-    IntegrationMaterialSocialCards,
-)
+from mkdocs_rss_plugin.json_feed import JsonFeedSerializer
 from mkdocs_rss_plugin.models import MkdocsPageSubset, PageInformation, RssFeedBase
+from mkdocs_rss_plugin.remote_images_cache import (
+    STATUS_ERROR,
+    STATUS_OK,
+    RemoteImagesCache,
+)
 from mkdocs_rss_plugin.timezoner import set_datetime_zoneinfo
 
+# heavy dependencies (git, requests, markdown, Material theme...) are imported when
+# the related feature is used, to keep the plugin loading cheap
+if TYPE_CHECKING:
+    import markdown
+    from requests import Session
+
+    from mkdocs_rss_plugin.git_manager.dates_index import GitDatesIndex
+    from mkdocs_rss_plugin.git_manager.log_worker import GitLogWorker
+    from mkdocs_rss_plugin.integrations.theme_material_blog_plugin import (
+        IntegrationMaterialBlog,
+    )
+    from mkdocs_rss_plugin.integrations.theme_material_social_plugin import (
+        IntegrationMaterialSocialCards,
+    )
+
 # ############################################################################
 # ########## Globals #############
 # ################################
 
 logger = get_plugin_logger(MKDOCS_LOGGER_NAME)
-urllib3.disable_warnings()  # disable warnings for unverified requests
+
+# characters replaced by the separator in slugs
+RE_SLUG_SEPARATORS = re_compile(r"[^a-z0-9]+")
 
 # ############################################################################
 # ########## Classes #############
@@ -64,16 +72,25 @@ class Util:
     """Plugin logic."""
 
     git_is_valid: bool = False
+    git_dates_index: Optional["GitDatesIndex"] = None
+    git_log_worker: Optional["GitLogWorker"] = None
 
     def __init__(
         self,
         cache_dir: Path = DEFAULT_CACHE_FOLDER,
-        integration_material_blog: Optional[IntegrationMaterialBlog] = None,
+        integration_material_blog: Optional["IntegrationMaterialBlog"] = None,
         integration_material_social_cards: Optional[
-            IntegrationMaterialSocialCards
+            "IntegrationMaterialSocialCards"
         ] = None,
+        markdown_extensions: Optional[list] = None,
+        markdown_extensions_configs: Optional[dict] = None,
         mkdocs_command_is_on_serve: bool = False,
         path: str = ".",
+        remote_images_cache_ttl: int = 10080,
+        remote_images_cache_ttl_errors: int = 1440,
+        remote_images_max_workers: int = 8,
+        remote_images_max_workers_per_host: int = 4,
+        remote_images_offline: bool = False,
         use_git: bool = True,
     ) -> None:
         """Class hosting the plugin logic.
@@ -86,8 +103,22 @@ class Util:
             integration_material_social_cards (bool, optional): option to enable
                 integration with Social Cards plugin from Material theme. \
                 Defaults to None.
+            markdown_extensions (list, optional): Markdown extensions to use when
+                converting abstracts. Defaults to None.
+            markdown_extensions_configs (dict, optional): Markdown extensions
+                settings. Defaults to None.
             mkdocs_command_is_on_serve: _description_. Defaults to False.
             path (str, optional): path to the git repository to use. Defaults to ".".
+            remote_images_cache_ttl (int, optional): time to live, in minutes, of the
+                persisted remote images metadata. Defaults to 10080 (1 week).
+            remote_images_cache_ttl_errors (int, optional): time to live, in minutes,
+                of the persisted unreachable remote images. Defaults to 1440 (1 day).
+            remote_images_max_workers (int, optional): max number of remote images
+                lengths to retrieve concurrently. Defaults to 8.
+            remote_images_max_workers_per_host (int, optional): max number of
+                concurrent requests to the same host. Defaults to 4.
+            remote_images_offline (bool, optional): never request remote images, \
+                only rely on local files and persisted metadata. Defaults to False.
             use_git (bool, optional): flag to use git under the hood or not. \
                 Defaults to True.
         """
@@ -100,6 +131,11 @@ class Util:
 
         if use_git:
             logger.debug("Git use is enabled.")
+            from git import InvalidGitRepositoryError, Repo
+
+            from mkdocs_rss_plugin.git_manager.ci import CiHandler
+            from mkdocs_rss_plugin.git_manager.log_worker import GitLogWorker
+
             try:
                 git_repo = Repo(path, search_parent_directories=True)
                 self.repo = git_repo.git
@@ -126,6 +162,8 @@ class Util:
             # Checks if user is running builds on CI and raise appropriate warnings
             if self.git_is_valid:
                 CiHandler(git_repo.git).raise_ci_warnings()
+                # single git process to read dates of files missing from the index
+                self.git_log_worker = GitLogWorker(repo=self.repo)
         else:
             self.git_is_valid = False
             logger.debug(
@@ -135,18 +173,70 @@ class Util:
         # save git enable/disable status
         self.use_git = use_git
 
+        # fallback of dates which could not be retrieved, shared by all pages so
+        # they can be recognized as changing at each build
+        self.build_datetime: datetime = get_build_datetime()
+
         # save integrations
         self.material_blog = integration_material_blog
         self.social_cards = integration_material_social_cards
 
-        # http/s session
-        session = Session()
-        session.headers.update(REMOTE_REQUEST_HEADERS)
-        self.req_session = CacheControl(
-            sess=session,
-            cache=SeparateBodyFileCache(directory=cache_dir),
-            cacheable_methods=("GET", "HEAD"),
+        # Markdown converter for abstracts, created on first use and reused
+        self.markdown_extensions = markdown_extensions or []
+        self.markdown_extensions_configs = markdown_extensions_configs or {}
+        self.markdown_converter: Optional["markdown.Markdown"] = None
+
+        # remote images concurrency limits
+        self.remote_images_max_workers = max(remote_images_max_workers, 1)
+        self.remote_images_max_workers_per_host = max(
+            remote_images_max_workers_per_host, 1
         )
+        self.hosts_semaphores: dict[str, BoundedSemaphore] = {}
+        self.hosts_semaphores_lock = Lock()
+
+        # offline mode: remote images lengths not resolved without network
+        self.remote_images_offline = remote_images_offline
+        self.remote_images_unresolved: set[str] = set()
+
+        # remote images metadata persisted between builds
+        self.remote_images_cache = RemoteImagesCache(
+            cache_dir=cache_dir,
+            ttl=remote_images_cache_ttl,
+            ttl_errors=remote_images_cache_ttl_errors,
+        )
+
+        # http/s session, shared by threads retrieving remote images lengths,
+        # created on first use
+        self.cache_dir = cache_dir
+        self._req_session: Optional["Session"] = None
+        self.req_session_lock = Lock()
+
+    @property
+    def req_session(self) -> "Session":
+        """HTTP session with cache control, shared by threads retrieving remote
+            images lengths. Created on first use, so requests and cachecontrol are
+            only imported if a remote image has to be requested.
+
+        Returns:
+            Session: HTTP session
+        """
+        with self.req_session_lock:
+            if self._req_session is None:
+                import urllib3
+                from cachecontrol import CacheControl
+                from cachecontrol.caches.file_cache import SeparateBodyFileCache
+                from requests import Session
+
+                urllib3.disable_warnings()  # disable warnings for unverified requests
+                session = Session()
+                session.headers.update(REMOTE_REQUEST_HEADERS)
+                self._req_session = CacheControl(
+                    sess=session,
+                    cache=SeparateBodyFileCache(directory=self.cache_dir),
+                    cacheable_methods=("GET", "HEAD"),
+                )
+
+            return self._req_session
 
     def build_url(
         self, base_url: str, path: str, args_dict: Optional[dict] = None
@@ -197,6 +287,63 @@ class Util:
                 return None
         return data
 
+    def build_git_dates_index(
+        self,
+        paths: Iterable[str],
+        cache_dir: Optional[Path] = None,
+        files_paths: Optional[Iterable[str]] = None,
+        use_index: bool = True,
+    ) -> Optional["GitDatesIndex"]:
+        """Build the git dates index for the given paths, walking the git log once
+            instead of querying it for every page.
+
+        The git log worker reading dates of files missing from the index is limited
+        to the same paths.
+
+        Args:
+            paths (Iterable[str]): paths (folders or files) to index, typically the
+                Mkdocs docs_dir
+            cache_dir (Path, optional): folder where to persist the index between
+                builds, so only new commits are walked next time. Defaults to None.
+            files_paths (Iterable[str], optional): files to index too, typically the
+                pages to include in feeds. Only the ones out of the given paths but
+                within the repository are added to the walked paths. Defaults to None.
+            use_index (bool, optional): build the index. If False, files are only
+                read from the git log worker. Defaults to True.
+
+        Returns:
+            GitDatesIndex | None: git dates index or None if git is not used, if the
+                index is not used or if it could not be built
+        """
+        if not self.git_is_valid:
+            return None
+
+        from mkdocs_rss_plugin.git_manager.dates_index import GitDatesIndex
+        from mkdocs_rss_plugin.git_manager.log_worker import GitLogWorker
+
+        paths = [Path(p) for p in paths]
+        repo_dir = Path(self.repo.working_dir)
+        for file_path in map(Path, files_paths or []):
+            if file_path.is_relative_to(repo_dir) and not any(
+                file_path.is_relative_to(p) for p in paths
+            ):
+                paths.append(file_path)
+
+        # files missing from the index are read from the git log of the same paths
+        if self.git_log_worker is not None:
+            self.git_log_worker.close()
+        self.git_log_worker = GitLogWorker(repo=self.repo, paths=map(str, paths))
+
+        git_dates_index = GitDatesIndex(repo=self.repo)
+        if use_index and git_dates_index.build(
+            paths=map(str, paths), cache_dir=cache_dir
+        ):
+            self.git_dates_index = git_dates_index
+        else:
+            self.git_dates_index = None
+
+        return self.git_dates_index
+
     def get_file_dates(
         self,
         in_page: Page,
@@ -222,6 +369,47 @@ class Util:
         Returns:
             tuple[datetime, datetime]: tuple of timestamps (creation date, last commit date)
         """
+        dt_created, dt_updated = self.get_file_dates_from_meta(
+            in_page=in_page,
+            source_date_creation=source_date_creation,
+            source_date_update=source_date_update,
+            meta_datetime_format=meta_datetime_format,
+            meta_default_time=meta_default_time,
+            meta_default_timezone=meta_default_timezone,
+        )
+        return self.complete_file_dates(
+            abs_src_path=in_page.file.abs_src_path,
+            dt_created=dt_created,
+            dt_updated=dt_updated,
+            meta_default_timezone=meta_default_timezone,
+        )
+
+    def get_file_dates_from_meta(
+        self,
+        in_page: Page,
+        source_date_creation: str,
+        source_date_update: str,
+        meta_datetime_format: str,
+        meta_default_time: datetime,
+        meta_default_timezone: str,
+    ) -> tuple[Optional[datetime], Optional[datetime]]:
+        """Extract creation and update dates from page metadata (yaml frontmatter),
+            if they are set there or if git is not used.
+
+        Args:
+            in_page (Page): input page
+            source_date_creation (str): which source to use (git or meta tag) for
+                creation date
+            source_date_update (str): which source to use (git or meta tag) for update
+                date
+            meta_datetime_format (str): datetime string format
+            meta_default_time (datetime): fallback time to set if not specified
+            meta_default_timezone (str): timezone to use
+
+        Returns:
+            tuple[Optional[datetime], Optional[datetime]]: tuple of dates (creation
+                date, update date), None if not retrieved from metadata
+        """
         logger.debug(f"Extracting dates for {in_page.file.src_uri}")
         # empty vars
         dt_created = dt_updated = None
@@ -278,49 +466,36 @@ class Util:
                     f"unrecognized type: {dt_updated} ({type(dt_updated)})"
                 )
 
+        return dt_created, dt_updated
+
+    def complete_file_dates(
+        self,
+        abs_src_path: str,
+        dt_created: Optional[datetime],
+        dt_updated: Optional[datetime],
+        meta_default_timezone: str,
+    ) -> tuple[datetime, datetime]:
+        """Complete dates missing from page metadata with the git dates index or the
+            git log, falling back to the build date. Only the file path is read, not
+            the page itself.
+
+        Args:
+            abs_src_path (str): absolute path to the page source file
+            dt_created (Optional[datetime]): creation date from page metadata
+            dt_updated (Optional[datetime]): update date from page metadata
+            meta_default_timezone (str): timezone to use
+
+        Returns:
+            tuple[datetime, datetime]: tuple of timestamps (creation date, last commit date)
+        """
         # explore git log
         if self.git_is_valid:
-            try:
-                # only if dates have not been retrieved from page meta
-                if not dt_created:
-                    dt_created = self.repo.log(
-                        in_page.file.abs_src_path,
-                        n=1,
-                        date="short",
-                        format="%at",
-                        diff_filter="AR",
-                    )
-                if not dt_updated:
-                    dt_updated = self.repo.log(
-                        in_page.file.abs_src_path,
-                        n=1,
-                        date="short",
-                        format="%at",
-                    )
-            except GitCommandError as err:
-                logger.info(
-                    f"Unable to read git logs of '{in_page.file.abs_src_path}'. "
-                    "Is git log readable? Falling back to build date. "
-                    "To disable this warning, set 'use_git: false' in plugin options. "
-                    f"Trace: {err}"
-                )
-            except GitCommandNotFound as err:
-                logger.warning(
-                    "Unable to perform command 'git log'. Is git installed? "
-                    "Falling back to build date. "
-                    "To disable this warning, set 'use_git: false' in plugin options. "
-                    f"Trace: {err}"
-                )
-                self.git_is_valid = False
-            # convert timestamps into datetimes
-            if isinstance(dt_created, (str, float, int)) and dt_created:
-                dt_created = set_datetime_zoneinfo(
-                    datetime.fromtimestamp(float(dt_created)), meta_default_timezone
-                )
-            if isinstance(dt_updated, (str, float, int)) and dt_updated:
-                dt_updated = set_datetime_zoneinfo(
-                    datetime.fromtimestamp(float(dt_updated)), meta_default_timezone
-                )
+            dt_created, dt_updated = self.get_git_file_dates(
+                abs_src_path=abs_src_path,
+                dt_created=dt_created,
+                dt_updated=dt_updated,
+                meta_default_timezone=meta_default_timezone,
+            )
 
         # results
         if all([dt_created, dt_updated]):
@@ -331,35 +506,98 @@ class Util:
         elif dt_created:
             log_msg = (
                 "Updated date could not be retrieved for page: "
-                f"{in_page.file.abs_src_path}. Fallback to build date."
+                f"{abs_src_path}. Fallback to build date."
             )
             if self.use_git:
                 log_msg += "Maybe it has never been committed yet?"
             logger.debug(log_msg)
             return (
                 dt_created,
-                get_build_datetime(),
+                self.build_datetime,
             )
         elif dt_updated:
             log_msg = (
                 "Creation date could not be retrieved for page: "
-                f"{in_page.file.abs_src_path}. Fallback to build date."
+                f"{abs_src_path}. Fallback to build date."
             )
             if self.use_git:
                 log_msg += "Maybe it has never been committed yet?"
             logger.debug(log_msg)
             return (
-                get_build_datetime(),
+                self.build_datetime,
                 dt_updated,
             )
         else:
+            logger.info(f"Dates could not be retrieved for page: {abs_src_path}.")
+            return (
+                self.build_datetime,
+                self.build_datetime,
+            )
+
+    def get_git_file_dates(
+        self,
+        abs_src_path: str,
+        dt_created: Optional[datetime],
+        dt_updated: Optional[datetime],
+        meta_default_timezone: str,
+    ) -> tuple[Optional[datetime], Optional[datetime]]:
+        """Complete dates missing from page metadata with the git dates index or, if
+            it could not be built, the git log worker.
+
+        Args:
+            abs_src_path (str): absolute path to the page source file
+            dt_created (Optional[datetime]): creation date from page metadata
+            dt_updated (Optional[datetime]): update date from page metadata
+            meta_default_timezone (str): timezone to use
+
+        Returns:
+            tuple[Optional[datetime], Optional[datetime]]: tuple of dates (creation
+                date, last commit date), None if not found
+        """
+        from git import GitCommandError, GitCommandNotFound
+
+        # look into the git dates index first, then into the git log worker
+        is_indexed = (
+            self.git_dates_index is not None and abs_src_path in self.git_dates_index
+        )
+        if is_indexed:
+            indexed_created, indexed_updated = self.git_dates_index.get(abs_src_path)
+            dt_created = dt_created or indexed_created
+            dt_updated = dt_updated or indexed_updated
+
+        try:
+            # only if dates have not been retrieved from page meta and the index
+            # could not be built: files missing from it have no history
+            if not all([dt_created, dt_updated]) and self.git_dates_index is None:
+                logged_created, logged_updated = self.git_log_worker.get(abs_src_path)
+                dt_created = dt_created or logged_created
+                dt_updated = dt_updated or logged_updated
+        except GitCommandError as err:
             logger.info(
-                f"Dates could not be retrieved for page: {in_page.file.abs_src_path}."
+                f"Unable to read git logs of '{abs_src_path}'. "
+                "Is git log readable? Falling back to build date. "
+                "To disable this warning, set 'use_git: false' in plugin options. "
+                f"Trace: {err}"
             )
-            return (
-                get_build_datetime(),
-                get_build_datetime(),
+        except GitCommandNotFound as err:
+            logger.warning(
+                "Unable to perform command 'git log'. Is git installed? "
+                "Falling back to build date. "
+                "To disable this warning, set 'use_git: false' in plugin options. "
+                f"Trace: {err}"
+            )
+            self.git_is_valid = False
+        # convert timestamps into datetimes
+        if isinstance(dt_created, (str, float, int)) and dt_created:
+            dt_created = set_datetime_zoneinfo(
+                datetime.fromtimestamp(float(dt_created)), meta_default_timezone
             )
+        if isinstance(dt_updated, (str, float, int)) and dt_updated:
+            dt_updated = set_datetime_zoneinfo(
+                datetime.fromtimestamp(float(dt_updated)), meta_default_timezone
+            )
+
+        return dt_created, dt_updated
 
     def get_authors_from_meta(self, in_page: Page) -> Optional[tuple[str]]:
         """Returns authors from page meta. It handles 'author' and 'authors' for keys, \
@@ -510,6 +748,35 @@ class Util:
         Returns:
             str: page description to use
         """
+        description, abstract_markdown = self.get_description_or_abstract_source(
+            in_page=in_page,
+            chars_count=chars_count,
+            abstract_delimiter=abstract_delimiter,
+        )
+        if abstract_markdown is not None:
+            return self.render_abstract(abstract_markdown)
+        return description
+
+    def get_description_or_abstract_source(
+        self,
+        in_page: Page,
+        chars_count: int = 160,
+        abstract_delimiter: Optional[str] = None,
+    ) -> tuple[Optional[str], Optional[str]]:
+        """Same as get_description_or_abstract but without rendering the Markdown
+            abstract, so it can be deferred to the pages actually used in feeds.
+
+        Args:
+            in_page (Page): page to look at
+            chars_count (int, optional): if page.meta.description is not set, number of
+                chars of the content to use. Defaults to 160.
+            abstract_delimiter (str, optional): description delimiter (also called
+                excerpt). Defaults to None.
+
+        Returns:
+            tuple[str | None, str | None]: (page description, Markdown abstract to
+                render), only one of them being set
+        """
         if in_page.meta.get("rss", {}).get("feed_description"):
             description = in_page.meta["rss"]["feed_description"]
         else:
@@ -518,12 +785,12 @@ class Util:
         # If the full page is wanted (unlimited chars count)
         if chars_count == -1 and (in_page.content or in_page.markdown):
             if in_page.content:
-                return in_page.content
+                return in_page.content, None
             else:
-                return markdown.markdown(in_page.markdown, output_format="html5")
+                return None, in_page.markdown
         # If the description is explicitly given
         elif description:
-            return description
+            return description, None
         # If the abstract is cut by the delimiter
         elif (
             abstract_delimiter
@@ -532,19 +799,13 @@ class Util:
             )
             > -1
         ):
-            return markdown.markdown(
-                in_page.markdown[:excerpt_separator_position],
-                output_format="html5",
-            )
+            return None, in_page.markdown[:excerpt_separator_position]
         # Use first chars_count from the markdown
         elif chars_count > 0 and in_page.markdown:
             if len(in_page.markdown) <= chars_count:
-                return markdown.markdown(in_page.markdown, output_format="html5")
+                return None, in_page.markdown
             else:
-                return markdown.markdown(
-                    f"{in_page.markdown[: chars_count - 3]}...",
-                    output_format="html5",
-                )
+                return None, f"{in_page.markdown[: chars_count - 3]}..."
         # No explicit description and no (or empty) abstract found
         else:
             logger.warning(
@@ -552,7 +813,66 @@ class Util:
                 "therefore the feed won't be compliant, "
                 "because an item must have a description."
             )
-            return ""
+            return "", None
+
+    def get_markdown_converter(self) -> "markdown.Markdown":
+        """Returns the Markdown converter used for abstracts, creating it on first call.
+
+        Building a Markdown instance (and its processors registries) is costly
+        compared to a conversion, so the same instance is reset between abstracts.
+
+        Returns:
+            markdown.Markdown: Markdown converter
+        """
+        if self.markdown_converter is not None:
+            return self.markdown_converter
+
+        import markdown
+
+        try:
+            self.markdown_converter = markdown.Markdown(
+                extensions=self.markdown_extensions,
+                extension_configs=self.markdown_extensions_configs,
+                output_format="html5",
+            )
+        except Exception as err:
+            logger.warning(
+                "Unable to load Markdown extensions to convert abstracts. Using "
+                f"Markdown without extensions. Trace: {err}"
+            )
+            self.markdown_converter = markdown.Markdown(output_format="html5")
+
+        return self.markdown_converter
+
+    def render_abstract(self, abstract_markdown: str) -> str:
+        """Convert a Markdown abstract into HTML.
+
+        Args:
+            abstract_markdown (str): Markdown text to convert
+
+        Returns:
+            str: HTML abstract
+        """
+        return self.get_markdown_converter().reset().convert(abstract_markdown)
+
+    def load_descriptions_for_pages(self, pages: list[PageInformation]) -> None:
+        """Render deferred abstracts for a list of pages (mutation in-place).
+
+        Args:
+            pages: list of PageInformation
+        """
+        for page_info in pages:
+            if (
+                page_info.description is None
+                and page_info._abstract_markdown is not None
+            ):
+                logger.debug(
+                    f"Render abstract for '{page_info.title}' ({page_info.abs_path})"
+                )
+                page_info.description = self.render_abstract(
+                    page_info._abstract_markdown
+                )
+                page_info._abstract_markdown = None
 
     def load_images_for_pages(
         self,
@@ -562,6 +882,9 @@ class Util:
     ) -> None:
         """Load images for a list of pages (mutation in-place).
 
+        Remote images lengths are retrieved concurrently, within the limits of
+        remote_images_max_workers, while images are assigned in pages order.
+
         Args:
             pages: list of PageInformation
             base_url: final website base URL
@@ -570,19 +893,60 @@ class Util:
         if processed_refs is None:
             processed_refs = set()
 
+        pages_to_load: list[PageInformation] = []
         for page_info in pages:
             if (
                 page_info._mkdocs_page_ref
                 and id(page_info._mkdocs_page_ref) not in processed_refs
             ):
-                logger.debug(
-                    f"Get image for '{page_info.title}' ({page_info.abs_path})"
-                )
-                page_info.image = self.get_image(
-                    in_page=page_info._mkdocs_page_ref, base_url=base_url
-                )
+                pages_to_load.append(page_info)
                 processed_refs.add(id(page_info._mkdocs_page_ref))
 
+        if not pages_to_load:
+            return
+
+        def _get_page_image(page_info: PageInformation) -> Optional[tuple]:
+            logger.debug(f"Get image for '{page_info.title}' ({page_info.abs_path})")
+            return self.get_image(in_page=page_info._mkdocs_page_ref, base_url=base_url)
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.remote_images_max_workers, len(pages_to_load)),
+            thread_name_prefix="mkdocs-rss-images",
+        ) as executor:
+            for page_info, image in zip(
+                pages_to_load,
+                executor.map(_get_page_image, pages_to_load),
+                strict=True,
+            ):
+                page_info.image = image
+
+        self.remote_images_cache.save()
+
+        if self.remote_images_unresolved:
+            logger.info(
+                f"Offline mode - Length of {len(self.remote_images_unresolved)} remote "
+                "images could not be resolved from local files or cache, so their "
+                "enclosure is published without length: "
+                f"{', '.join(sorted(self.remote_images_unresolved))}"
+            )
+
+    def get_host_semaphore(self, url: str) -> BoundedSemaphore:
+        """Returns the semaphore limiting concurrent requests to the URL's host.
+
+        Args:
+            url (str): URL to request
+
+        Returns:
+            BoundedSemaphore: semaphore of the host
+        """
+        host = urlparse(url).netloc
+        with self.hosts_semaphores_lock:
+            if host not in self.hosts_semaphores:
+                self.hosts_semaphores[host] = BoundedSemaphore(
+                    self.remote_images_max_workers_per_host
+                )
+            return self.hosts_semaphores[host]
+
     def get_image(
         self, in_page: MkdocsPageSubset, base_url: str
     ) -> Optional[tuple[str, str, int]]:
@@ -609,7 +973,7 @@ class Util:
                 f"{in_page.src_uri}"
             )
         elif (
-            isinstance(self.social_cards, IntegrationMaterialSocialCards)
+            self.social_cards is not None
             and self.social_cards.IS_ENABLED
             and self.social_cards.IS_SOCIAL_PLUGIN_CARDS_ENABLED
             and self.social_cards.is_social_plugin_enabled_page(
@@ -623,12 +987,16 @@ class Util:
             if img_local_cache_path := self.social_cards.get_social_card_cache_path_for_page(
                 mkdocs_page=in_page
             ):
-                img_length = img_local_cache_path.stat().st_size
+                img_length = self.social_cards.get_social_card_length(
+                    img_local_cache_path
+                )
                 img_type = guess_type(url=img_local_cache_path, strict=False)[0]
             elif img_local_build_path := self.social_cards.get_social_card_build_path_for_page(
                 mkdocs_page=in_page
             ):
-                img_length = img_local_build_path.stat().st_size
+                img_length = self.social_cards.get_social_card_length(
+                    img_local_build_path
+                )
                 img_type = guess_type(url=img_local_build_path, strict=False)[0]
             else:
                 logger.debug(
@@ -660,6 +1028,13 @@ class Util:
             img_url = self.build_url(base_url=base_url, path=img_url)
         else:
             img_length = self.get_remote_image_length(image_url=img_url)
+            # fallback to the content type returned by the server
+            if mime_type is None and (
+                img_metadata := self.remote_images_cache.get(
+                    img_url, ignore_ttl=self.remote_images_offline
+                )
+            ):
+                mime_type = img_metadata.mime_type
 
         # return final tuple
         return (img_url, mime_type, img_length)
@@ -694,8 +1069,9 @@ class Util:
     ) -> Optional[int]:
         """Retrieve length for remote images (starting with 'http').
 
-        Firstly, it tries to perform a HEAD request and get the length from the headers. \
-        If it fails, it tries again with a GET and disabling SSL verification.
+        Firstly, it looks into the remote images metadata persisted by previous
+        builds. Then, it tries to perform a HEAD request and get the length from the \
+        headers. If it fails, it tries again with a GET and disabling SSL verification.
 
         Args:
             image_url (str): image URL
@@ -710,9 +1086,31 @@ class Util:
         Returns:
             int | None: image length as int or None
         """
+        # metadata retrieved by a previous build, including unreachable images. In
+        # offline mode, they can't be refreshed so expired ones are used too
+        if attempt == 0 and (
+            img_metadata := self.remote_images_cache.get(
+                image_url, ignore_ttl=self.remote_images_offline
+            )
+        ):
+            logger.debug(
+                f"Remote image metadata found in cache ({img_metadata.status}): "
+                f"{image_url}"
+            )
+            return img_metadata.length
+
         if self.mkdocs_command_is_on_serve:
             return None
 
+        if self.remote_images_offline:
+            logger.debug(
+                f"Offline mode - Remote image length not resolved: {image_url}"
+            )
+            self.remote_images_unresolved.add(image_url)
+            return None
+
+        from requests.exceptions import ConnectionError, HTTPError
+
         # first, try HEAD request to avoid downloading the image
         try:
             attempt += 1
@@ -720,12 +1118,13 @@ class Util:
                 f"Get remote image length (attempt {attempt}/2) - "
                 f"Sending {http_method} request to {image_url}"
             )
-            req_response = self.req_session.request(
-                method=http_method,
-                timeout=req_timeout,
-                url=image_url,
-                verify=ssl_verify,
-            )
+            with self.get_host_semaphore(image_url):
+                req_response = self.req_session.request(
+                    method=http_method,
+                    timeout=req_timeout,
+                    url=image_url,
+                    verify=ssl_verify,
+                )
             req_response.raise_for_status()
             img_length = req_response.headers.get("content-length")
         except (ConnectionError, HTTPError) as err:
@@ -743,9 +1142,18 @@ class Util:
                     f"Remote image is not reachable: {image_url} after "
                     f"{attempt} attempts. Trace: {err}"
                 )
+                self.remote_images_cache.set(url=image_url, status=STATUS_ERROR)
                 return None
 
-        return int(img_length) if img_length else None
+        img_length = int(img_length) if img_length else None
+        self.remote_images_cache.set(
+            url=image_url,
+            status=STATUS_OK,
+            length=img_length,
+            mime_type=req_response.headers.get("content-type", "").split(";")[0]
+            or None,
+        )
+        return img_length
 
     @staticmethod
     def get_site_url(mkdocs_config: MkDocsConfig) -> Optional[str]:
@@ -829,9 +1237,41 @@ class Util:
 
         return None
 
+    @staticmethod
+    def get_signature(*values: Any) -> str:
+        """Compute a digest of the given values, used to detect changes between
+            builds.
+
+        Args:
+            values (Any): values to hash, using their representation
+
+        Returns:
+            str: hexadecimal digest
+        """
+        return sha256(repr(values).encode("UTF-8")).hexdigest()
+
+    @staticmethod
+    def slugify(value: str, separator: str = "-") -> str:
+        """Turn a text (i.e. a category name) into an ASCII identifier usable in
+            paths and URLs.
+
+        Args:
+            value (str): text to slugify
+            separator (str, optional): words separator. Defaults to "-".
+
+        Returns:
+            str: slug, or a short digest of the text if it has no ASCII letter or
+                digit
+        """
+        ascii_value = normalize("NFKD", str(value)).encode("ascii", "ignore").decode()
+        slug = RE_SLUG_SEPARATORS.sub(separator, ascii_value.lower()).strip(separator)
+        if not slug and str(value).strip():
+            return sha256(str(value).encode("UTF-8")).hexdigest()[:12]
+        return slug
+
     @staticmethod
     def filter_pages(
-        pages: list[PageInformation],
+        pages: Iterable[PageInformation],
         filter_attribute: Literal["created", "updated"],
         length: int,
     ) -> list[PageInformation]:
@@ -861,26 +1301,6 @@ class Util:
             dict: dict that can be passed to json.dump
         """
         return {
-            "version": "https://jsonfeed.org/version/1.1",
-            "title": feed.title,
-            "home_page_url": feed.html_url,
-            "feed_url": feed.json_url,
-            "description": feed.description,
-            "icon": feed.logo_url,
-            "authors": ([{"name": feed.author}] if feed.author is not None else []),
-            "language": str(feed.language),
-            "items": [
-                {
-                    "id": item.guid,
-                    "url": item.link,
-                    "title": item.title,
-                    "content_html": item.description,
-                    "image": (item.image or (None,))[0],
-                    "date_modified": item.updated.isoformat("T"),
-                    "date_published": item.created.isoformat("T"),
-                    "authors": [{"name": name} for name in (item.authors or ())],
-                    "tags": item.categories,
-                }
-                for item in feed.entries
-            ],
+            **JsonFeedSerializer.feed_header(feed),
+            "items": [JsonFeedSerializer.feed_item(item) for item in feed.entries],
         }
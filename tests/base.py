@@ -10,6 +10,7 @@
 import logging
 import shutil
 import unittest
+from os import getenv
 from pathlib import Path
 
 # 3rd party
@@ -23,6 +24,14 @@ from mkdocs.config.base import Config
 # package
 from mkdocs_rss_plugin.plugin import GitRssPlugin
 
+# #############################################################################
+# ########## Globals ###############
+# ##################################
+
+# timings compared with previous implementations are flaky on loaded machines: they
+# are only checked on demand, i.e. `MKDOCS_RSS_BENCHMARKS=1 pytest`
+BENCHMARKS_ENABLED: bool = getenv("MKDOCS_RSS_BENCHMARKS", "0") == "1"
+
 # #############################################################################
 # ########## Classes ###############
 # ##################################
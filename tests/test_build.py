@@ -14,19 +14,36 @@
 # ##################################
 
 # Standard library
+import gzip
 import json
 import logging
+import os
 import tempfile
 import unittest
 from pathlib import Path
+from threading import current_thread
+from time import perf_counter, time
 from traceback import format_exception
+from typing import Any
+from unittest.mock import patch
 
 # 3rd party
 import feedparser
 import jsonfeed
+from mkdocs.commands.build import build
+from mkdocs.config import load_config
+from mkdocs.config.defaults import MkDocsConfig
+from mkdocs.structure.files import File, Files
+from mkdocs.structure.pages import Page
+
+# package
+from mkdocs_rss_plugin.git_manager.dates_index import CACHE_FILENAME, GitDatesIndex
+from mkdocs_rss_plugin.git_manager.log_worker import GitLogWorker
+from mkdocs_rss_plugin.plugin import GitRssPlugin
+from mkdocs_rss_plugin.util import Util
 
 # test suite
-from tests.base import BaseTest
+from tests.base import BENCHMARKS_ENABLED, BaseTest
 
 # -- Globals --
 logger = logging.getLogger(__name__)
@@ -37,6 +54,9 @@ OUTPUT_RSS_FEED_UPDATED = "feed_rss_updated.xml"
 OUTPUT_JSON_FEED_CREATED = "feed_json_created.json"
 OUTPUT_JSON_FEED_UPDATED = "feed_json_updated.json"
 
+# max time added to a build of 1,000 pages by the disabled plugin
+DISABLED_PLUGIN_BUILD_BUDGET_MS = 20
+
 # #############################################################################
 # ########## Classes ###############
 # ##################################
@@ -191,6 +211,41 @@ class TestBuildRss(BaseTest):
                 Path(tmpdirname).joinpath(OUTPUT_JSON_FEED_UPDATED).exists()
             )
 
+    def test_disabled_plugin_hooks(self):
+        """Test that a disabled plugin goes through a whole build without setting
+        up anything, within a fixed time budget."""
+        mkdocs_config = MkDocsConfig()
+        mkdocs_config.load_dict({"site_name": "Disabled"})
+        files = Files(
+            [
+                File(
+                    path=f"page_{i}.md",
+                    src_dir="docs",
+                    dest_dir="site",
+                    use_directory_urls=True,
+                )
+                for i in range(1000)
+            ]
+        )
+        pages = [Page(title=None, file=file, config=mkdocs_config) for file in files]
+
+        plugin = GitRssPlugin()
+        errors, _ = plugin.load_config({"enabled": False})
+        self.assertEqual(errors, [])
+
+        start = perf_counter()
+        plugin.on_startup(command="build", dirty=False)
+        plugin.on_config(mkdocs_config)
+        for page in pages:
+            plugin.on_page_content("<p>content</p>", page, mkdocs_config, files)
+        plugin.on_post_build(mkdocs_config)
+        disabled_duration = (perf_counter() - start) * 1e3
+
+        for attribute in ("entries_created", "feed_created", "template_engine", "util"):
+            self.assertIsNone(getattr(plugin, attribute, None))
+        if BENCHMARKS_ENABLED:
+            self.assertLess(disabled_duration, DISABLED_PLUGIN_BUILD_BUDGET_MS)
+
     def test_simple_build_rss_enabled_not_jsonfeed(self):
         with tempfile.TemporaryDirectory() as tmpdirname:
             cli_result = self.build_docs_setup(
@@ -329,6 +384,44 @@ class TestBuildRss(BaseTest):
                 if feed_item.title in ("Test page with meta",):
                     self.assertTrue("category" in feed_item)
 
+    def test_build_categories_feeds(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            site_dir = Path(tmpdirname, "site")
+            config = load_config(
+                str(Path("tests/fixtures/mkdocs_item_categories.yml").resolve()),
+                site_dir=str(site_dir),
+            )
+            config.plugins["rss"].config.cache_dir = str(Path(tmpdirname, "cache"))
+            config.plugins["rss"].config.categories_feeds.enabled = True
+            build(config)
+
+            categories_folder = Path(site_dir, "category")
+            self.assertTrue(categories_folder.joinpath("test").is_dir())
+
+            for category_folder in categories_folder.iterdir():
+                category = category_folder.name
+                for filename in (OUTPUT_RSS_FEED_CREATED, OUTPUT_RSS_FEED_UPDATED):
+                    feed_parsed = feedparser.parse(category_folder / filename)
+                    self.assertEqual(feed_parsed.bozo, 0)
+                    self.assertTrue(feed_parsed.feed.title.endswith(f" - {category}"))
+                    self.assertIn(
+                        f"{config.site_url}category/{category}/{filename}",
+                        [link.href for link in feed_parsed.feed.links],
+                    )
+                    self.assertGreater(len(feed_parsed.entries), 0)
+                    for feed_item in feed_parsed.entries:
+                        self.assertIn(
+                            category, [tag.term for tag in feed_item.get("tags", [])]
+                        )
+
+                for filename in (OUTPUT_JSON_FEED_CREATED, OUTPUT_JSON_FEED_UPDATED):
+                    with category_folder.joinpath(filename).open(
+                        encoding="UTF-8"
+                    ) as in_json:
+                        json_feed = json.load(in_json)
+                    for item in json_feed.get("items"):
+                        self.assertIn(category, item.get("tags"))
+
     def test_simple_build_item_comments_enabled(self):
         with tempfile.TemporaryDirectory() as tmpdirname:
             cli_result = self.build_docs_setup(
@@ -620,6 +713,468 @@ class TestBuildRss(BaseTest):
             )
             self.assertEqual(feed_parsed.bozo, 0)
 
+    def test_serve_rebuilds_do_not_accumulate_pages(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            site_dir = Path(tmpdirname, "site")
+            config = load_config(
+                str(Path("tests/fixtures/mkdocs_complete.yml").resolve()),
+                site_dir=str(site_dir),
+            )
+            config.plugins["rss"].config.cache_dir = str(Path(tmpdirname, "cache"))
+            rss_plugin = config.plugins["rss"]
+            config.plugins.on_startup(command="serve", dirty=False)
+
+            build(config)
+            first_build_pages = rss_plugin.entries_created.select()
+            self.assertGreater(len(first_build_pages), 0)
+
+            # rebuild as mkdocs serve does on file change: the configuration is
+            # reloaded but plugins instances are kept
+            config = load_config(
+                str(Path("tests/fixtures/mkdocs_complete.yml").resolve()),
+                site_dir=str(site_dir),
+            )
+            config.plugins["rss"].config.cache_dir = str(Path(tmpdirname, "cache"))
+            self.assertIs(config.plugins["rss"], rss_plugin)
+            build(config)
+
+            self.assertEqual(
+                len(rss_plugin.entries_created.select()), len(first_build_pages)
+            )
+            self.assertEqual(
+                len(rss_plugin.feed_created.entries),
+                len({entry.guid for entry in rss_plugin.feed_created.entries}),
+            )
+
+            # unchanged pages are reused instead of being processed again
+            for page_info, first_build_page_info in zip(
+                rss_plugin.entries_created.select(), first_build_pages, strict=True
+            ):
+                self.assertIs(page_info, first_build_page_info)
+
+            config.plugins.on_shutdown()
+
+    def test_serve_dirty_rebuild_keeps_unmodified_pages(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            config = load_config(
+                str(Path("tests/fixtures/mkdocs_complete.yml").resolve()),
+                site_dir=str(Path(tmpdirname, "site")),
+            )
+            rss_plugin = config.plugins["rss"]
+            rss_plugin.config.cache_dir = str(Path(tmpdirname, "cache"))
+            config.plugins.on_startup(command="serve", dirty=True)
+
+            build(config)
+            first_build_guids = [
+                entry.guid for entry in rss_plugin.feed_created.entries
+            ]
+            self.assertGreater(len(first_build_guids), 0)
+
+            # only pages modified since their last output are rendered again
+            modified_page = Path("tests/fixtures/docs/page_with_meta.md")
+            page_stat = modified_page.stat()
+            os.utime(modified_page, (page_stat.st_atime, time() + 60))
+            try:
+                config = load_config(
+                    str(Path("tests/fixtures/mkdocs_complete.yml").resolve()),
+                    site_dir=str(Path(tmpdirname, "site")),
+                )
+                config.plugins["rss"].config.cache_dir = str(Path(tmpdirname, "cache"))
+                build(config, dirty=True)
+            finally:
+                os.utime(
+                    modified_page, ns=(page_stat.st_atime_ns, page_stat.st_mtime_ns)
+                )
+
+            self.assertEqual(
+                [entry.guid for entry in rss_plugin.feed_created.entries],
+                first_build_guids,
+            )
+            self.assertEqual(rss_plugin.pages_not_rendered, {})
+
+            config.plugins.on_shutdown()
+
+    def test_rebuild_keeps_unchanged_feeds(self):
+        feeds_filenames = (
+            OUTPUT_RSS_FEED_CREATED,
+            OUTPUT_RSS_FEED_UPDATED,
+            OUTPUT_JSON_FEED_CREATED,
+            OUTPUT_JSON_FEED_UPDATED,
+        )
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            site_dir = Path(tmpdirname, "site")
+            outputs = {}
+            for build_timestamp in ("1700000000", "1800000000"):
+                config = load_config(
+                    str(Path("tests/fixtures/mkdocs_complete.yml").resolve()),
+                    site_dir=str(site_dir),
+                )
+                config.plugins["rss"].config.cache_dir = str(Path(tmpdirname, "cache"))
+                with patch.dict("os.environ", {"SOURCE_DATE_EPOCH": build_timestamp}):
+                    build(config)
+
+                # the site folder is emptied before each build
+                for feed_filename in feeds_filenames:
+                    out_feed = site_dir.joinpath(feed_filename)
+                    outputs.setdefault(feed_filename, []).append(
+                        (out_feed.read_bytes(), out_feed.stat().st_mtime_ns)
+                    )
+
+            # only the build date changed: feeds are left as they were
+            for feed_filename in feeds_filenames:
+                self.assertEqual(
+                    outputs[feed_filename][0], outputs[feed_filename][1], feed_filename
+                )
+
+    def test_build_archives(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            site_dir = Path(tmpdirname, "site")
+            loaded_pages_counts = []
+            outputs = {}
+            for build_timestamp in ("1700000000", "1800000000"):
+                config = load_config(
+                    str(Path("tests/fixtures/mkdocs_complete.yml").resolve()),
+                    site_dir=str(site_dir),
+                )
+                rss_plugin = config.plugins["rss"]
+                rss_plugin.config.cache_dir = str(Path(tmpdirname, "cache"))
+                rss_plugin.config.archives.enabled = True
+                rss_plugin.config.archives.page_size = 3
+                with (
+                    patch.dict("os.environ", {"SOURCE_DATE_EPOCH": build_timestamp}),
+                    patch.object(
+                        Util,
+                        "load_images_for_pages",
+                        autospec=True,
+                        side_effect=Util.load_images_for_pages,
+                    ) as load_images,
+                ):
+                    build(config)
+                loaded_pages_counts.append(len(load_images.call_args.args[1]))
+
+                for out_file in site_dir.joinpath("archives").glob("*/*.xml"):
+                    outputs.setdefault(out_file.parent.name, []).append(
+                        (out_file.read_bytes(), out_file.stat().st_mtime_ns)
+                    )
+
+            archives_count = len(rss_plugin.entries_archived) // 3
+            self.assertGreater(archives_count, 1)
+            self.assertEqual(
+                sorted(outputs, key=int),
+                [str(index) for index in range(1, archives_count + 1)],
+            )
+
+            # current feed links to the most recent archive
+            feed_parsed = feedparser.parse(site_dir / OUTPUT_RSS_FEED_CREATED)
+            links = {link.rel: link.href for link in feed_parsed.feed.links}
+            self.assertEqual(
+                links.get("prev-archive"),
+                f"{config.site_url}archives/{archives_count}/{OUTPUT_RSS_FEED_CREATED}",
+            )
+
+            archived_guids = []
+            for index in range(1, archives_count + 1):
+                out_file = site_dir.joinpath(
+                    "archives", str(index), OUTPUT_RSS_FEED_CREATED
+                )
+                feed_parsed = feedparser.parse(out_file)
+                self.assertEqual(feed_parsed.bozo, 0)
+                self.assertIn(b"<fh:archive ", out_file.read_bytes())
+                self.assertEqual(len(feed_parsed.entries), 3)
+                archived_guids.extend(entry.id for entry in feed_parsed.entries)
+
+                links = {link.rel: link.href for link in feed_parsed.feed.links}
+                self.assertEqual(
+                    links.get("current"),
+                    f"{config.site_url}{OUTPUT_RSS_FEED_CREATED}",
+                )
+                self.assertEqual("prev-archive" in links, index > 1)
+                self.assertEqual("next-archive" in links, index < archives_count)
+
+                # unchanged archives are left as they were
+                self.assertEqual(outputs[str(index)][0], outputs[str(index)][1])
+
+            # a page is archived only once
+            self.assertEqual(len(archived_guids), len(set(archived_guids)))
+            # items of unchanged archives are not loaded again
+            self.assertLess(loaded_pages_counts[1], loaded_pages_counts[0])
+
+    def test_build_dates_in_background(self):
+        original_get_file_dates_from_meta = Util.get_file_dates_from_meta
+        original_complete_file_dates = Util.complete_file_dates
+        meta_threads = []
+        lookups_threads = []
+
+        def get_file_dates_from_meta(util, **kwargs: Any):
+            meta_threads.append(current_thread().name)
+            return original_get_file_dates_from_meta(util, **kwargs)
+
+        def complete_file_dates(util, **kwargs: Any):
+            lookups_threads.append(current_thread().name)
+            return original_complete_file_dates(util, **kwargs)
+
+        for use_git_dates_index in (True, False):
+            with tempfile.TemporaryDirectory() as tmpdirname:
+                site_dir = Path(tmpdirname, "site")
+                config = load_config(
+                    str(Path("tests/fixtures/mkdocs_complete.yml").resolve()),
+                    site_dir=str(site_dir),
+                )
+                rss_plugin = config.plugins["rss"]
+                rss_plugin.config.cache_dir = str(Path(tmpdirname, "cache"))
+                rss_plugin.config.use_git_dates_index = use_git_dates_index
+                meta_threads.clear()
+                lookups_threads.clear()
+                with (
+                    patch.object(
+                        Util,
+                        "get_file_dates_from_meta",
+                        autospec=True,
+                        side_effect=get_file_dates_from_meta,
+                    ),
+                    patch.object(
+                        Util,
+                        "complete_file_dates",
+                        autospec=True,
+                        side_effect=complete_file_dates,
+                    ),
+                ):
+                    build(config)
+
+                # pages meta are read while pages are processed. Dates are looked up
+                # out of the main thread only if they are read from the git log, and
+                # joined before writing.
+                self.assertGreater(len(lookups_threads), 0)
+                self.assertEqual(
+                    set(meta_threads), {current_thread().name}, use_git_dates_index
+                )
+                for thread_name in lookups_threads:
+                    self.assertEqual(
+                        thread_name.startswith("rss-dates"), not use_git_dates_index
+                    )
+                self.assertIsNone(rss_plugin.dates_executor)
+                self.assertEqual(len(rss_plugin.pages_pending), 0)
+                for item in rss_plugin.feed_created.entries:
+                    self.assertIsNotNone(item.created)
+                    self.assertIsNotNone(item.updated)
+                    self.assertIsNone(item._dates_future)
+
+    def test_build_pages_offered_once_resolved(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            site_dir = Path(tmpdirname, "site")
+            config = load_config(
+                str(Path("tests/fixtures/mkdocs_complete_no_git.yml").resolve()),
+                site_dir=str(site_dir),
+            )
+            config.plugins["rss"].config.cache_dir = str(Path(tmpdirname, "cache"))
+            rss_plugin = config.plugins["rss"]
+            pending_counts = []
+            original_add_entry = GitRssPlugin.add_entry
+
+            def add_entry(plugin, page_info, key):
+                pending_counts.append(len(plugin.pages_pending))
+                return original_add_entry(plugin, page_info, key)
+
+            with patch.object(
+                GitRssPlugin, "add_entry", autospec=True, side_effect=add_entry
+            ):
+                build(config)
+
+            # pages with known dates are offered while rendering, not kept until
+            # the end of the build
+            self.assertGreater(len(pending_counts), 0)
+            self.assertEqual(set(pending_counts), {0})
+            self.assertGreater(len(rss_plugin.feed_created.entries), 0)
+
+    def test_build_dates_prefetched_without_index(self):
+        # add a new page without tracking it
+        temp_page = Path("tests/fixtures/docs/temp_page_not_in_git_log.md")
+        temp_page.write_text("# This page is dynamically created for test purposes\n")
+
+        feeds_dates = []
+        prefetch_calls = []
+        for is_index_built in (True, False):
+            with tempfile.TemporaryDirectory() as tmpdirname:
+                config = load_config(
+                    str(Path("tests/fixtures/mkdocs_complete.yml").resolve()),
+                    site_dir=str(Path(tmpdirname, "site")),
+                )
+                rss_plugin = config.plugins["rss"]
+                rss_plugin.config.cache_dir = str(Path(tmpdirname, "cache"))
+                with (
+                    # same fallback date for the page not in git log in both builds
+                    patch.dict("os.environ", {"SOURCE_DATE_EPOCH": "1900000000"}),
+                    patch.object(
+                        GitDatesIndex,
+                        "build",
+                        autospec=True,
+                        return_value=False,
+                        side_effect=GitDatesIndex.build if is_index_built else None,
+                    ),
+                    patch.object(
+                        GitLogWorker,
+                        "prefetch",
+                        autospec=True,
+                        side_effect=GitLogWorker.prefetch,
+                    ) as prefetch,
+                ):
+                    build(config)
+
+                prefetch_calls.append(prefetch.call_args_list)
+                feeds_dates.append(
+                    [
+                        (item.guid, item.created, item.updated)
+                        for item in rss_plugin.feed_created.entries
+                    ]
+                )
+
+        # rm page
+        temp_page.unlink()
+
+        # pages missing from a built index have no history: no need to read the
+        # git log again
+        self.assertEqual(prefetch_calls[0], [])
+
+        # without index, every page matching is read in one pass through the git
+        # log, before pages are rendered
+        self.assertEqual(len(prefetch_calls[1]), 1)
+        self.assertGreaterEqual(
+            len(prefetch_calls[1][0].args[1]), len(rss_plugin.feed_created.entries)
+        )
+        self.assertEqual(feeds_dates[0], feeds_dates[1])
+
+    def test_build_dates_without_index(self):
+        feeds_dates = []
+        read_until_calls = []
+        for use_git_dates_index in (True, False):
+            with tempfile.TemporaryDirectory() as tmpdirname:
+                config = load_config(
+                    str(Path("tests/fixtures/mkdocs_complete.yml").resolve()),
+                    site_dir=str(Path(tmpdirname, "site")),
+                )
+                rss_plugin = config.plugins["rss"]
+                rss_plugin.config.cache_dir = str(Path(tmpdirname, "cache"))
+                rss_plugin.config.use_git_dates_index = use_git_dates_index
+                with (
+                    # same fallback date for the pages not in git log in both builds
+                    patch.dict("os.environ", {"SOURCE_DATE_EPOCH": "1900000000"}),
+                    patch.object(
+                        GitLogWorker,
+                        "read_until",
+                        autospec=True,
+                        side_effect=GitLogWorker.read_until,
+                    ) as read_until,
+                ):
+                    build(config)
+
+                self.assertEqual(
+                    Path(tmpdirname, "cache", CACHE_FILENAME).is_file(),
+                    use_git_dates_index,
+                )
+                read_until_calls.append(read_until.call_count)
+                feeds_dates.append(
+                    [
+                        (item.guid, item.created, item.updated)
+                        for feed in (rss_plugin.feed_created, rss_plugin.feed_updated)
+                        for item in feed.entries
+                    ]
+                )
+
+        # without index, pages dates are read by the git log worker, stopped once
+        # the build is done
+        self.assertEqual(read_until_calls[0], 0)
+        self.assertGreater(read_until_calls[1], 0)
+        self.assertIsNone(rss_plugin.util.git_dates_index)
+        self.assertIsNone(rss_plugin.util.git_log_worker.process)
+        self.assertEqual(feeds_dates[0], feeds_dates[1])
+
+    def test_build_error_stops_dates_lookups(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            config = load_config(
+                str(Path("tests/fixtures/mkdocs_complete.yml").resolve()),
+                site_dir=str(Path(tmpdirname, "site")),
+            )
+            rss_plugin = config.plugins["rss"]
+            rss_plugin.config.cache_dir = str(Path(tmpdirname, "cache"))
+            rss_plugin.config.use_git_dates_index = False
+            build_failed = []
+            closed_after_failure = []
+            original_close = GitLogWorker.close
+
+            def get_description_or_abstract_source(util, **kwargs: Any):
+                build_failed.append(True)
+                raise RuntimeError("page rendering failed")
+
+            def close(worker):
+                closed_after_failure.append(bool(build_failed))
+                return original_close(worker)
+
+            with (
+                patch.object(
+                    Util,
+                    "get_description_or_abstract_source",
+                    autospec=True,
+                    side_effect=get_description_or_abstract_source,
+                ),
+                patch.object(GitLogWorker, "close", autospec=True, side_effect=close),
+                self.assertRaises(RuntimeError),
+            ):
+                build(config)
+
+            self.assertIn(True, closed_after_failure)
+            self.assertIsNone(rss_plugin.dates_executor)
+
+    def test_build_feeds_pub_dates(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            site_dir = Path(tmpdirname, "site")
+            config = load_config(
+                str(Path("tests/fixtures/mkdocs_complete.yml").resolve()),
+                site_dir=str(site_dir),
+            )
+            config.plugins["rss"].config.cache_dir = str(Path(tmpdirname, "cache"))
+            rss_plugin = config.plugins["rss"]
+            build(config)
+
+            # feeds are written concurrently: items shared by both feeds must not
+            # share their publication date
+            for feed, out_feed, date_attribute in (
+                (rss_plugin.feed_created, OUTPUT_RSS_FEED_CREATED, "created"),
+                (rss_plugin.feed_updated, OUTPUT_RSS_FEED_UPDATED, "updated"),
+            ):
+                parsed_feed = feedparser.parse(Path(site_dir, out_feed))
+                self.assertEqual(len(parsed_feed.entries), len(feed.entries))
+                for item, parsed_item in zip(
+                    feed.entries, parsed_feed.entries, strict=True
+                ):
+                    self.assertEqual(
+                        parsed_item.published_parsed,
+                        getattr(item, date_attribute).utctimetuple(),
+                    )
+
+    def test_build_precompress(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            site_dir = Path(tmpdirname, "site")
+            config = load_config(
+                str(Path("tests/fixtures/mkdocs_complete.yml").resolve()),
+                site_dir=str(site_dir),
+            )
+            config.plugins["rss"].config.cache_dir = str(Path(tmpdirname, "cache"))
+            config.plugins["rss"].config.precompress = True
+            build(config)
+
+            for filename in (
+                OUTPUT_RSS_FEED_CREATED,
+                OUTPUT_RSS_FEED_UPDATED,
+                OUTPUT_JSON_FEED_CREATED,
+                OUTPUT_JSON_FEED_UPDATED,
+                "rss.xsl",
+            ):
+                out_file = Path(site_dir, filename)
+                self.assertEqual(
+                    gzip.decompress(out_file.with_name(f"{filename}.gz").read_bytes()),
+                    out_file.read_bytes(),
+                )
+
     def test_simple_build_pretty_print_enabled(self):
         with tempfile.TemporaryDirectory() as tmpdirname:
             cli_result = self.build_docs_setup(
@@ -0,0 +1,84 @@
+#! python3  # noqa: E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_compressor
+
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import gzip
+import tempfile
+import unittest
+from pathlib import Path
+
+# plugin target
+from mkdocs_rss_plugin.compressor import FeedsCompressor, brotli
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestFeedsCompressor(unittest.TestCase):
+    """Test precompressed siblings of the generated files."""
+
+    # -- Standard methods --------------------------------------------------------
+    def setUp(self):
+        """Executed before each test."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.in_file = Path(self.tmp_dir.name, "feed_rss_created.xml")
+        self.in_file.write_text("<rss>" + "<item>Lorem ipsum</item>" * 500 + "</rss>")
+
+    def tearDown(self):
+        """Executed after each test."""
+        self.tmp_dir.cleanup()
+
+    # -- TESTS ---------------------------------------------------------
+    def test_compress(self):
+        """Test siblings are written once, with the source content and mtime."""
+        compressor = FeedsCompressor()
+        written_files = compressor.compress(self.in_file)
+
+        gz_file = self.in_file.with_name("feed_rss_created.xml.gz")
+        self.assertIn(gz_file, written_files)
+        self.assertEqual(
+            gzip.decompress(gz_file.read_bytes()), self.in_file.read_bytes()
+        )
+        self.assertEqual(gz_file.stat().st_mtime_ns, self.in_file.stat().st_mtime_ns)
+        if brotli is not None:
+            br_file = self.in_file.with_name("feed_rss_created.xml.br")
+            self.assertIn(br_file, written_files)
+            self.assertEqual(
+                brotli.decompress(br_file.read_bytes()), self.in_file.read_bytes()
+            )
+
+        # up to date siblings are left untouched
+        self.assertEqual(compressor.compress(self.in_file), [])
+
+        # same source, same output
+        gz_content = gz_file.read_bytes()
+        gz_file.unlink()
+        compressor.compress(self.in_file)
+        self.assertEqual(gz_file.read_bytes(), gz_content)
+
+    def test_background_compression(self):
+        """Test submitted files are compressed once joined."""
+        compressor = FeedsCompressor()
+        compressor.submit(self.in_file)
+        compressor.join()
+        self.assertTrue(self.in_file.with_name("feed_rss_created.xml.gz").is_file())
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
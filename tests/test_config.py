@@ -63,7 +63,21 @@ class TestConfig(BaseTest):
         expected = {
             "abstract_chars_count": 160,
             "abstract_delimiter": "<!-- more -->",
+            "abstract_use_markdown_extensions": False,
+            "archives": {
+                "enabled": False,
+                "filename_pattern": "archives/{page}/{filename}",
+                "page_size": 50,
+            },
+            "authors_feeds": {
+                "enabled": False,
+                "filename_pattern": "author/{slug}/{filename}",
+            },
             "categories": None,
+            "categories_feeds": {
+                "enabled": False,
+                "filename_pattern": "category/{slug}/{filename}",
+            },
             "cache_dir": f"{DEFAULT_CACHE_FOLDER.resolve()}",
             "comments_path": None,
             "date_from_meta": {
@@ -87,11 +101,20 @@ class TestConfig(BaseTest):
                 "rss_created": "feed_rss_created.xml",
                 "rss_updated": "feed_rss_updated.xml",
             },
+            "precompress": False,
             "pretty_print": False,
+            "remote_images": {
+                "cache_ttl": 10080,
+                "cache_ttl_errors": 1440,
+                "max_workers": 8,
+                "max_workers_per_host": 4,
+                "offline": False,
+            },
             "stylesheet": "auto",
             "rss_feed_enabled": True,
             "url_parameters": None,
             "use_git": True,
+            "use_git_dates_index": True,
             "use_material_blog": True,
             "use_material_social_cards": True,
         }
@@ -110,8 +133,22 @@ class TestConfig(BaseTest):
         expected = {
             "abstract_chars_count": 160,
             "abstract_delimiter": "<!-- more -->",
+            "abstract_use_markdown_extensions": False,
+            "archives": {
+                "enabled": False,
+                "filename_pattern": "archives/{page}/{filename}",
+                "page_size": 50,
+            },
+            "authors_feeds": {
+                "enabled": False,
+                "filename_pattern": "author/{slug}/{filename}",
+            },
             "cache_dir": f"{DEFAULT_CACHE_FOLDER.resolve()}",
             "categories": None,
+            "categories_feeds": {
+                "enabled": False,
+                "filename_pattern": "category/{slug}/{filename}",
+            },
             "comments_path": None,
             "date_from_meta": {
                 "as_creation": "git",
@@ -134,11 +171,20 @@ class TestConfig(BaseTest):
                 "rss_created": "feed_rss_created.xml",
                 "rss_updated": "feed_rss_updated.xml",
             },
+            "precompress": False,
             "pretty_print": False,
+            "remote_images": {
+                "cache_ttl": 10080,
+                "cache_ttl_errors": 1440,
+                "max_workers": 8,
+                "max_workers_per_host": 4,
+                "offline": False,
+            },
             "stylesheet": "auto",
             "rss_feed_enabled": True,
             "url_parameters": None,
             "use_git": True,
+            "use_git_dates_index": True,
             "use_material_blog": True,
             "use_material_social_cards": True,
         }
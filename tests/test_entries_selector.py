@@ -0,0 +1,135 @@
+#! python3  # noqa: E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_entries_selector
+
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import random
+import unittest
+from datetime import datetime, timedelta
+
+# plugin target
+from mkdocs_rss_plugin.entries_selector import (
+    FeedEntriesSelector,
+    GroupedEntriesSelector,
+)
+from mkdocs_rss_plugin.models import PageInformation
+from mkdocs_rss_plugin.util import Util
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestFeedEntriesSelector(unittest.TestCase):
+    """Test bounded feed entries selector."""
+
+    # -- Standard methods --------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """Executed when module is loaded before any test."""
+        rand = random.Random(42)  # noqa: S311 - seeded test data, not security related
+        base_date = datetime(2024, 1, 1)
+        # few distinct dates to get ties
+        cls.pages = [
+            PageInformation(
+                title=f"page {i}",
+                created=base_date + timedelta(days=rand.randint(0, 30)),
+                updated=base_date + timedelta(days=rand.randint(0, 30)),
+            )
+            for i in range(500)
+        ]
+
+    # -- TESTS ---------------------------------------------------------
+    def test_select_matches_full_sort(self):
+        """Test that the selection matches the full sort of all pages."""
+        for filter_attribute in ("created", "updated"):
+            for length in (0, 1, 20, 499, 500, 1000):
+                selector = FeedEntriesSelector(
+                    filter_attribute=filter_attribute, length=length
+                )
+                for page in self.pages:
+                    selector.add(page, key=page.title)
+
+                self.assertLessEqual(len(selector), length)
+                self.assertEqual(
+                    [page.title for page in selector.select()],
+                    [
+                        page.title
+                        for page in Util.filter_pages(
+                            pages=self.pages,
+                            filter_attribute=filter_attribute,
+                            length=length,
+                        )
+                    ],
+                )
+
+    def test_add_replaces_same_key(self):
+        """Test that a page added twice with the same key is replaced."""
+        selector = FeedEntriesSelector(filter_attribute="created", length=3)
+        selector.add(PageInformation(title="a", created=datetime(2024, 1, 1)), "a")
+        selector.add(PageInformation(title="b", created=datetime(2024, 1, 2)), "b")
+        selector.add(PageInformation(title="a2", created=datetime(2024, 1, 3)), "a")
+
+        self.assertEqual([page.title for page in selector.select()], ["a2", "b"])
+
+    def test_grouped_select_matches_filtered_sort(self):
+        """Test that each group selection matches the sort of the group pages."""
+        categories = ("Python", "python", "Release notes", "été")
+        rand = random.Random(7)  # noqa: S311 - seeded test data, not security related
+        pages = [
+            PageInformation(
+                title=page.title,
+                created=page.created,
+                updated=page.updated,
+                categories=rand.sample(categories, k=rand.randint(0, 2)),
+            )
+            for page in self.pages
+        ]
+
+        grouped_selector = GroupedEntriesSelector(length=20, slugify=Util.slugify)
+        for page in pages:
+            grouped_selector.add(page, groups=page.categories, key=page.title)
+
+        groups = list(grouped_selector.select())
+        self.assertEqual(
+            [slug for slug, *_ in groups], ["ete", "python", "release-notes"]
+        )
+        for slug, _, entries_created, entries_updated in groups:
+            group_pages = [
+                page
+                for page in pages
+                if slug in [Util.slugify(category) for category in page.categories]
+            ]
+            for filter_attribute, entries in (
+                ("created", entries_created),
+                ("updated", entries_updated),
+            ):
+                self.assertEqual(
+                    [page.title for page in entries],
+                    [
+                        page.title
+                        for page in Util.filter_pages(
+                            pages=group_pages,
+                            filter_attribute=filter_attribute,
+                            length=20,
+                        )
+                    ],
+                )
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,298 @@
+#! python3  # noqa: E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_git_dates_index
+
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# 3rd party
+from git import Git, Repo
+
+# plugin target
+from mkdocs_rss_plugin.git_manager.dates_index import CACHE_FILENAME, GitDatesIndex
+
+# #############################################################################
+# ########## Functions #############
+# ##################################
+
+
+def get_commit_env(timestamp: int) -> dict[str, str]:
+    """Environment variables setting the author and committer of a commit.
+
+    Args:
+        timestamp (int): author and committer date
+
+    Returns:
+        dict[str, str]: environment variables
+    """
+    return {
+        f"GIT_{role}_{key}": value
+        for role in ("AUTHOR", "COMMITTER")
+        for key, value in (
+            ("DATE", f"@{timestamp} +0000"),
+            ("EMAIL", "test@example.com"),
+            ("NAME", "Test"),
+        )
+    }
+
+
+def commit_all(git_repo: Git, message: str, timestamp: int) -> None:
+    """Commit every change of a repository at a given date.
+
+    Args:
+        git_repo (Git): Git command wrapper of the repository
+        message (str): commit message
+        timestamp (int): author and committer date
+    """
+    git_repo.add(A=True)
+    git_repo.commit(m=message, env=get_commit_env(timestamp))
+
+
+def init_branches_history(repo_dir: Path) -> Git:
+    """Create a repository whose main branch and a side branch both changed the
+    docs folder since they forked. The side branch is not merged yet.
+
+    Args:
+        repo_dir (Path): folder of the repository to create
+
+    Returns:
+        Git: Git command wrapper of the repository, on the main branch
+    """
+    git_repo = Repo.init(repo_dir).git
+    docs_dir = repo_dir.joinpath("docs")
+    docs_dir.mkdir()
+    docs_dir.joinpath("a.md").write_text("top\n\n\n\nbottom\n", encoding="UTF-8")
+    docs_dir.joinpath("b.md").write_text("b\n", encoding="UTF-8")
+    docs_dir.joinpath("d.md").write_text("d\n", encoding="UTF-8")
+    commit_all(git_repo, message="init", timestamp=100)
+    main_branch = git_repo.rev_parse("--abbrev-ref", "HEAD")
+
+    # side branch: changes a.md bottom, b.md, adds c.md and changes d.md as main
+    git_repo.checkout("-b", "side")
+    docs_dir.joinpath("a.md").write_text("top\n\n\n\nbottom side\n", encoding="UTF-8")
+    docs_dir.joinpath("b.md").write_text("b side\n", encoding="UTF-8")
+    docs_dir.joinpath("c.md").write_text("c\n", encoding="UTF-8")
+    docs_dir.joinpath("d.md").write_text("d changed\n", encoding="UTF-8")
+    commit_all(git_repo, message="side", timestamp=150)
+
+    # main branch: changes a.md top and d.md as the side branch, more recently
+    git_repo.checkout(main_branch)
+    docs_dir.joinpath("a.md").write_text("top main\n\n\n\nbottom\n", encoding="UTF-8")
+    docs_dir.joinpath("d.md").write_text("d changed\n", encoding="UTF-8")
+    commit_all(git_repo, message="main", timestamp=200)
+
+    return git_repo
+
+
+def merge_side_branch(git_repo: Git, timestamp: int) -> None:
+    """Merge the side branch of a repository created by `init_branches_history`.
+
+    Args:
+        git_repo (Git): Git command wrapper of the repository
+        timestamp (int): merge commit date
+    """
+    git_repo.merge("side", no_ff=True, m="merge", env=get_commit_env(timestamp))
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestGitDatesIndex(unittest.TestCase):
+    """Test git dates index."""
+
+    # -- Standard methods --------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """Executed when module is loaded before any test."""
+        cls.git_repo = Repo(".", search_parent_directories=True).git
+        cls.docs_dir = Path("tests/fixtures/docs").resolve()
+
+    # -- TESTS ---------------------------------------------------------
+    def test_parse_log(self):
+        """Test parsing of a raw git log output, from the newest to the oldest."""
+        git_dates_index = GitDatesIndex(repo=self.git_repo)
+        git_dates_index.parse_log(
+            "\x01300\0\nM\0docs/a.md\0"
+            "\x01200\0\nR100\0docs/b.md\0docs/c.md\0M\0docs/a.md\0"
+            "\x01100\0\nA\0docs/a.md\0A\0docs/b.md\0"
+        )
+        root_dir = Path(self.git_repo.working_dir)
+
+        self.assertEqual(git_dates_index.get(str(root_dir / "docs/a.md")), (100, 300))
+        self.assertEqual(git_dates_index.get(str(root_dir / "docs/c.md")), (200, 200))
+        self.assertIsNone(git_dates_index.get(str(root_dir / "docs/d.md")))
+        self.assertEqual(len(git_dates_index), 3)
+
+    def test_build_matches_file_log(self):
+        """Test that indexed dates match the ones from per-file git log calls."""
+        git_dates_index = GitDatesIndex(repo=self.git_repo)
+        self.assertTrue(git_dates_index.build(paths=[str(self.docs_dir)]))
+        self.assertGreater(len(git_dates_index), 0)
+
+        for md_file in self.docs_dir.glob("*.md"):
+            self.assertIn(str(md_file), git_dates_index)
+            created, updated = git_dates_index.get(str(md_file))
+            self.assertEqual(
+                created,
+                int(
+                    self.git_repo.log(str(md_file), n=1, format="%at", diff_filter="AR")
+                ),
+            )
+            self.assertEqual(
+                updated, int(self.git_repo.log(str(md_file), n=1, format="%at"))
+            )
+
+    def test_build_matches_file_log_with_merges(self):
+        """Test that merge commits count as modifications of the files differing
+        from all their parents, as for per-file git log calls."""
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            repo_dir = Path(tmpdirname).resolve()
+            git_repo = init_branches_history(repo_dir)
+            merge_side_branch(git_repo, timestamp=300)
+
+            git_dates_index = GitDatesIndex(repo=git_repo)
+            self.assertTrue(git_dates_index.build(paths=[str(repo_dir / "docs")]))
+
+            # a.md changed on both sides: the merge is its last modification
+            self.assertEqual(
+                git_dates_index.get(str(repo_dir / "docs/a.md")), (100, 300)
+            )
+            for md_file in sorted(repo_dir.glob("docs/*.md")):
+                self.assertEqual(
+                    git_dates_index.get(str(md_file)),
+                    (
+                        int(
+                            git_repo.log(
+                                str(md_file), n=1, format="%at", diff_filter="AR"
+                            )
+                        ),
+                        int(git_repo.log(str(md_file), n=1, format="%at")),
+                    ),
+                )
+
+    def test_build_persisted_in_cache(self):
+        """Test that the index is persisted and reused when HEAD did not change."""
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            git_dates_index = GitDatesIndex(repo=self.git_repo)
+            self.assertTrue(
+                git_dates_index.build(
+                    paths=[str(self.docs_dir)], cache_dir=Path(tmpdirname)
+                )
+            )
+            cache_file = Path(tmpdirname).joinpath(CACHE_FILENAME)
+            self.assertTrue(cache_file.is_file())
+
+            # tamper the cached dates to check they are loaded instead of walked
+            cached_index = json.loads(cache_file.read_text(encoding="UTF-8"))
+            self.assertEqual(cached_index.get("head"), self.git_repo.rev_parse("HEAD"))
+            cached_index["dates"] = {"tests/fixtures/docs/index.md": [1, 2]}
+            cache_file.write_text(json.dumps(cached_index), encoding="UTF-8")
+
+            cached_dates_index = GitDatesIndex(repo=self.git_repo)
+            self.assertTrue(
+                cached_dates_index.build(
+                    paths=[str(self.docs_dir)], cache_dir=Path(tmpdirname)
+                )
+            )
+            self.assertEqual(len(cached_dates_index), 1)
+            self.assertEqual(
+                cached_dates_index.get(str(self.docs_dir / "index.md")), (1, 2)
+            )
+
+    def test_build_cache_updated_with_merged_branch(self):
+        """Test that commits of a merged branch older than the cached ones don't
+        replace their dates."""
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            repo_dir = Path(tmpdirname, "repo").resolve()
+            cache_dir = Path(tmpdirname, "cache")
+            git_repo = init_branches_history(repo_dir)
+            docs_paths = [str(repo_dir / "docs")]
+            self.assertTrue(
+                GitDatesIndex(repo=git_repo).build(
+                    paths=docs_paths, cache_dir=cache_dir
+                )
+            )
+
+            # d.md changed the same way on both sides: the merge is not a change
+            merge_side_branch(git_repo, timestamp=300)
+            updated_dates_index = GitDatesIndex(repo=git_repo)
+            with patch.object(
+                GitDatesIndex, "merge", autospec=True, side_effect=GitDatesIndex.merge
+            ) as merge:
+                self.assertTrue(
+                    updated_dates_index.build(paths=docs_paths, cache_dir=cache_dir)
+                )
+            merge.assert_called_once()
+
+            walked_dates_index = GitDatesIndex(repo=git_repo)
+            self.assertTrue(walked_dates_index.build(paths=docs_paths))
+            self.assertEqual(
+                updated_dates_index.get(str(repo_dir / "docs/d.md")), (100, 200)
+            )
+            self.assertEqual(updated_dates_index.dates, walked_dates_index.dates)
+
+    def test_build_cache_unknown_head(self):
+        """Test that the index is rebuilt when the cached commit is unknown."""
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            cache_file = Path(tmpdirname).joinpath(CACHE_FILENAME)
+            cache_file.write_text(
+                json.dumps(
+                    {
+                        "head": "0" * 40,
+                        "paths": ["tests/fixtures/docs"],
+                        "dates": {"tests/fixtures/docs/index.md": [1, 2]},
+                    }
+                ),
+                encoding="UTF-8",
+            )
+
+            git_dates_index = GitDatesIndex(repo=self.git_repo)
+            self.assertTrue(
+                git_dates_index.build(
+                    paths=[str(self.docs_dir)], cache_dir=Path(tmpdirname)
+                )
+            )
+            self.assertNotEqual(
+                git_dates_index.get(str(self.docs_dir / "index.md")), (1, 2)
+            )
+            self.assertEqual(
+                json.loads(cache_file.read_text(encoding="UTF-8")).get("head"),
+                self.git_repo.rev_parse("HEAD"),
+            )
+
+    def test_merge_newer_dates(self):
+        """Test merging dates walked from newer commits."""
+        git_dates_index = GitDatesIndex(repo=self.git_repo)
+        git_dates_index.dates = {"a.md": (100, 200), "b.md": (100, 100)}
+        git_dates_index.merge(
+            {"a.md": (None, 300), "b.md": (50, 50), "c.md": (300, 300)}
+        )
+
+        self.assertEqual(
+            git_dates_index.dates,
+            {"a.md": (100, 300), "b.md": (50, 100), "c.md": (300, 300)},
+        )
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+#! python3  # noqa: E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_git_log_worker
+
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import unittest
+from pathlib import Path
+
+# 3rd party
+from git import Repo
+
+# plugin target
+from mkdocs_rss_plugin.git_manager.log_worker import GitLogWorker
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestGitLogWorker(unittest.TestCase):
+    """Test git log worker."""
+
+    # -- Standard methods --------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """Executed when module is loaded before any test."""
+        cls.git_repo = Repo(".", search_parent_directories=True).git
+        cls.docs_dir = Path("tests/fixtures/docs").resolve()
+
+    # -- TESTS ---------------------------------------------------------
+    def test_get_matches_file_log(self):
+        """Test that dates read by the worker match per-file git log calls."""
+        git_log_worker = GitLogWorker(repo=self.git_repo)
+        md_files = sorted(self.docs_dir.glob("*.md"))
+        self.assertGreater(len(md_files), 0)
+
+        for md_file in md_files:
+            created, updated = git_log_worker.get(str(md_file))
+            self.assertEqual(
+                created,
+                int(
+                    self.git_repo.log(str(md_file), n=1, format="%at", diff_filter="AR")
+                ),
+            )
+            self.assertEqual(
+                updated, int(self.git_repo.log(str(md_file), n=1, format="%at"))
+            )
+
+        # a single git process, still running as the history is not fully read
+        self.assertIsNotNone(git_log_worker.process)
+        git_log_worker.close()
+        self.assertIsNone(git_log_worker.process)
+
+    def test_get_untracked_file(self):
+        """Test that an untracked file is answered without reading the history."""
+        git_log_worker = GitLogWorker(repo=self.git_repo)
+        self.assertEqual(
+            git_log_worker.get(str(self.docs_dir / "not_tracked.md")), (None, None)
+        )
+        self.assertFalse(git_log_worker.is_exhausted)
+        self.assertIsNone(git_log_worker.process)
+
+        # tracked files are still read from the git log
+        self.assertIsNotNone(git_log_worker.get(str(self.docs_dir / "index.md"))[0])
+        git_log_worker.close()
+
+    def test_get_limited_to_paths(self):
+        """Test that the git log is limited to the worker paths."""
+        git_log_worker = GitLogWorker(repo=self.git_repo, paths=[str(self.docs_dir)])
+        whole_repo_git_log_worker = GitLogWorker(repo=self.git_repo)
+
+        index_path = str(self.docs_dir / "index.md")
+        self.assertEqual(
+            git_log_worker.get(index_path), whole_repo_git_log_worker.get(index_path)
+        )
+        self.assertTrue(
+            all(
+                Path(indexed_path).is_relative_to(self.docs_dir)
+                for indexed_path in git_log_worker.dates_index.dates
+            )
+        )
+
+        # files out of the paths are not looked for
+        self.assertEqual(
+            git_log_worker.get(str(Path("README.md").resolve())), (None, None)
+        )
+        self.assertIsNotNone(
+            whole_repo_git_log_worker.get(str(Path("README.md").resolve()))[0]
+        )
+        git_log_worker.close()
+        whole_repo_git_log_worker.close()
+
+    def test_get_after_close(self):
+        """Test that a closed worker restarts git to answer the next queries."""
+        git_log_worker = GitLogWorker(repo=self.git_repo)
+        first_dates = git_log_worker.get(str(self.docs_dir / "index.md"))
+        git_log_worker.close()
+
+        fresh_git_log_worker = GitLogWorker(repo=self.git_repo)
+        for md_file in sorted(self.docs_dir.glob("*.md")):
+            self.assertEqual(
+                git_log_worker.get(str(md_file)), fresh_git_log_worker.get(str(md_file))
+            )
+        self.assertEqual(
+            git_log_worker.get(str(self.docs_dir / "index.md")), first_dates
+        )
+        git_log_worker.close()
+        fresh_git_log_worker.close()
+
+    def test_iter_tokens(self):
+        """Test splitting a stream into tokens across chunks."""
+
+        class FakeStream:
+            def __init__(self, chunks: list[bytes]):
+                self.chunks = chunks
+
+            def read1(self, size: int) -> bytes:
+                return self.chunks.pop(0) if self.chunks else b""
+
+        self.assertEqual(
+            list(
+                GitLogWorker.iter_tokens(
+                    FakeStream([b"\x01100\0\nA\0do", b"cs/a.md\0M", b"\0docs/b.md"])
+                )
+            ),
+            ["\x01100", "\nA", "docs/a.md", "M", "docs/b.md"],
+        )
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -19,9 +19,11 @@ import unittest
 from logging import DEBUG, getLogger
 from pathlib import Path
 from traceback import format_exception
+from unittest.mock import patch
 
 # 3rd party
 import feedparser
+from mkdocs.commands.build import build
 from mkdocs.config import load_config
 
 # package
@@ -124,6 +126,75 @@ class TestRssPluginIntegrationsMaterialBlog(BaseTest):
             feed_parsed = feedparser.parse(Path(tmpdirname) / "feed_rss_updated.xml")
             self.assertEqual(feed_parsed.bozo, 0)
 
+    def test_build_authors_feeds(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            config = load_config(
+                str(
+                    Path(
+                        "tests/fixtures/mkdocs_items_material_blog_enabled.yml"
+                    ).resolve()
+                ),
+                site_dir=tmpdirname,
+            )
+            config.plugins["rss"].config.authors_feeds.enabled = True
+            build(config)
+
+            # blog authors are resolved from their id to their name
+            feed_parsed = feedparser.parse(
+                Path(tmpdirname, "author", "martin-donath", "feed_rss_created.xml")
+            )
+            self.assertEqual(feed_parsed.bozo, 0)
+            self.assertTrue(feed_parsed.feed.title.endswith(" - Martin Donath"))
+            self.assertEqual(len(feed_parsed.entries), 1)
+            self.assertEqual(feed_parsed.entries[0].author, "Martin Donath")
+
+            feed_parsed = feedparser.parse(
+                Path(tmpdirname, "author", "julien-moura", "feed_rss_updated.xml")
+            )
+            self.assertEqual(feed_parsed.bozo, 0)
+            self.assertGreater(len(feed_parsed.entries), 0)
+            for feed_item in feed_parsed.entries:
+                self.assertIn(
+                    "Julien Moura", [author.name for author in feed_item.authors]
+                )
+
+    def test_build_feeds_unchanged_with_build_dates(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            site_dir = Path(tmpdirname, "site")
+            outputs = []
+            # build dates more recent than any commit, as when building now
+            for build_timestamp in ("1800000000", "1900000000"):
+                config = load_config(
+                    str(
+                        Path(
+                            "tests/fixtures/mkdocs_items_material_blog_enabled.yml"
+                        ).resolve()
+                    ),
+                    site_dir=str(site_dir),
+                )
+                rss_plugin = config.plugins["rss"]
+                rss_plugin.config.cache_dir = str(Path(tmpdirname, "cache"))
+                with patch.dict("os.environ", {"SOURCE_DATE_EPOCH": build_timestamp}):
+                    build(config)
+
+                outputs.append(
+                    {
+                        out_file.name: (
+                            out_file.read_bytes(),
+                            out_file.stat().st_mtime_ns,
+                        )
+                        for out_file in site_dir.glob("feed_*")
+                    }
+                )
+
+            # some items (i.e. blog views) fall back to the build date
+            self.assertTrue(
+                any(item._volatile_dates for item in rss_plugin.feed_created.entries)
+            )
+            # which is not enough to write the feeds again
+            self.assertEqual(len(outputs[0]), 4)
+            self.assertEqual(outputs[0], outputs[1])
+
 
 # ##############################################################################
 # ##### Stand alone program ########
@@ -19,6 +19,7 @@ import unittest
 from logging import DEBUG, getLogger
 from pathlib import Path
 from traceback import format_exception
+from unittest.mock import patch
 
 # 3rd party
 import feedparser
@@ -29,6 +30,7 @@ from mkdocs_rss_plugin.__about__ import __title_clean__
 from mkdocs_rss_plugin.integrations.theme_material_social_plugin import (
     IntegrationMaterialSocialCards,
 )
+from mkdocs_rss_plugin.models import MkdocsPageSubset
 
 # test suite
 from tests.base import BaseTest
@@ -258,6 +260,57 @@ class TestRssPluginIntegrationsMaterialSocialCards(BaseTest):
             feed_parsed = feedparser.parse(Path(tmpdirname) / "feed_rss_updated.xml")
             self.assertEqual(feed_parsed.bozo, 0)
 
+    def test_social_cards_lookups_from_scanned_folder(self):
+        cfg_mkdocs = load_config(
+            str(
+                Path(
+                    "tests/fixtures/mkdocs_item_image_social_cards_enabled_site.yml"
+                ).resolve()
+            )
+        )
+        integration_social_cards = IntegrationMaterialSocialCards(
+            mkdocs_config=cfg_mkdocs
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            cards_dir = Path(tmpdirname, "assets", "images", "social")
+            cards_dir.joinpath("blog", "posts").mkdir(parents=True)
+            cards_dir.joinpath("index.png").write_bytes(b"0" * 10)
+            cards_dir.joinpath("blog", "posts", "first.png").write_bytes(b"0" * 20)
+            integration_social_cards.social_cards_cache_dir = Path(tmpdirname)
+
+            # cards are looked up without probing the file system once per page
+            with patch.object(Path, "is_file", side_effect=AssertionError):
+                for src_uri, expected_length in (
+                    ("index.md", 10),
+                    ("blog/posts/first.md", 20),
+                    ("missing.md", None),
+                ):
+                    card_path = (
+                        integration_social_cards.get_social_card_cache_path_for_page(
+                            mkdocs_page=MkdocsPageSubset(
+                                abs_src_path=f"docs/{src_uri}",
+                                dest_uri=src_uri.replace(".md", "/index.html"),
+                                src_uri=src_uri,
+                                meta={},
+                            )
+                        )
+                    )
+                    if expected_length is None:
+                        self.assertIsNone(card_path)
+                        continue
+                    self.assertEqual(
+                        integration_social_cards.get_social_card_length(card_path),
+                        expected_length,
+                    )
+
+            # folder scanned only once
+            self.assertEqual(len(integration_social_cards.cards_indexes), 1)
+
+        self.assertEqual(
+            IntegrationMaterialSocialCards.scan_cards_dir(Path(tmpdirname)), {}
+        )
+
 
 # ##############################################################################
 # ##### Stand alone program ########
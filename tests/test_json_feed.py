@@ -0,0 +1,176 @@
+#! python3  # noqa: E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_json_feed
+
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import json
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from time import perf_counter
+
+# plugin target
+from mkdocs_rss_plugin.json_feed import JsonFeedSerializer, orjson
+from mkdocs_rss_plugin.models import PageInformation, RssFeedBase
+from mkdocs_rss_plugin.util import Util
+
+# test suite
+from tests.base import BENCHMARKS_ENABLED
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestJsonFeedSerializer(unittest.TestCase):
+    """Test JSON Feed serialization."""
+
+    # -- Standard methods --------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """Executed when module is loaded before any test."""
+        start_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        cls.feeds = [
+            RssFeedBase(title="Empty feed", language="en"),
+            RssFeedBase(
+                author="Jane Doe",
+                description="Feed with “non ASCII” characters\nand new lines",
+                json_url="https://example.com/feed_json_created.json",
+                title="Test feed",
+                entries=[
+                    PageInformation(
+                        authors=("Jane Doe",) if i % 2 else None,
+                        categories=["test", f"tag {i}"],
+                        created=start_date + timedelta(hours=i),
+                        description=f"<p>Page {i} content\n\twith “quotes”.</p>",
+                        guid=f"https://example.com/page_{i}/",
+                        image=(
+                            (f"https://example.com/{i}.png", "image/png", 42)
+                            if i % 3
+                            else None
+                        ),
+                        link=f"https://example.com/page_{i}/",
+                        title=f"Page {i}",
+                        updated=start_date + timedelta(days=i, microseconds=i),
+                    )
+                    for i in range(10)
+                ],
+            ),
+        ]
+
+    # -- TESTS ---------------------------------------------------------
+    def test_stdlib_output(self):
+        """Test streamed output is the same as dumping the whole feed at once."""
+        for feed in self.feeds:
+            for pretty_print in (False, True):
+                with self.subTest(feed=feed.title, pretty_print=pretty_print):
+                    serializer = JsonFeedSerializer(
+                        pretty_print=pretty_print, use_orjson=False
+                    )
+                    self.assertEqual(
+                        b"".join(serializer.iter_chunks(feed)),
+                        json.dumps(
+                            Util.feed_to_json(feed), indent=4 if pretty_print else None
+                        ).encode(),
+                    )
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_output(self):
+        """Test orjson output is the same as dumping the whole feed at once."""
+        for feed in self.feeds:
+            for pretty_print in (False, True):
+                with self.subTest(feed=feed.title, pretty_print=pretty_print):
+                    serializer = JsonFeedSerializer(
+                        pretty_print=pretty_print, use_orjson=True
+                    )
+                    self.assertEqual(
+                        b"".join(serializer.iter_chunks(feed)),
+                        orjson.dumps(
+                            Util.feed_to_json(feed),
+                            option=orjson.OPT_INDENT_2 if pretty_print else None,
+                        ),
+                    )
+
+    def test_write(self):
+        """Test written feed is valid JSON, whatever the backend."""
+        backends = (False, True) if orjson is not None else (False,)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            out_file = Path(tmp_dir, "feed.json")
+            for use_orjson in backends:
+                JsonFeedSerializer(use_orjson=use_orjson).write(
+                    feed=self.feeds[1], out_file=out_file
+                )
+                self.assertEqual(
+                    json.loads(out_file.read_text(encoding="UTF-8")),
+                    Util.feed_to_json(self.feeds[1]),
+                )
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_write_large_feed(self):
+        """Test the streamed orjson serializer against the standard library dumping
+        a whole dict, previously used, on a 5,000 items feed with full-content
+        bodies."""
+        start_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        full_content = (
+            "<p>Lorem ipsum dolor sit amet, “consectetur” adipiscing.</p>\n" * 80
+        )
+        feed = RssFeedBase(
+            description="Synthetic feed",
+            html_url="https://example.com/",
+            json_url="https://example.com/feed_json_created.json",
+            title="Benchmark",
+            entries=[
+                PageInformation(
+                    authors=("Jane Doe",),
+                    categories=["benchmark", f"tag_{i % 10}"],
+                    created=start_date + timedelta(hours=i),
+                    description=f"<h1>Page {i}</h1>\n{full_content}",
+                    guid=f"https://example.com/page_{i}/",
+                    image=(f"https://example.com/page_{i}.png", "image/png", 1024),
+                    link=f"https://example.com/page_{i}/",
+                    title=f"Page {i}",
+                    updated=start_date + timedelta(hours=i, minutes=30),
+                )
+                for i in range(5000)
+            ],
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            stdlib_file = Path(tmp_dir, "stdlib.json")
+            orjson_file = Path(tmp_dir, "orjson.json")
+
+            # previous implementation: intermediate dict dumped by the stdlib
+            start = perf_counter()
+            with stdlib_file.open(mode="w", encoding="UTF8") as fp:
+                json.dump(Util.feed_to_json(feed), fp)
+            stdlib_duration = perf_counter() - start
+
+            start = perf_counter()
+            JsonFeedSerializer(use_orjson=True).write(feed=feed, out_file=orjson_file)
+            orjson_duration = perf_counter() - start
+
+            self.assertEqual(
+                json.loads(orjson_file.read_bytes()),
+                json.loads(stdlib_file.read_bytes()),
+            )
+        if BENCHMARKS_ENABLED:
+            self.assertLess(orjson_duration, stdlib_duration)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+#! python3  # noqa: E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_minifier
+
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import random
+import unittest
+from io import StringIO
+from time import perf_counter
+
+# plugin target
+from mkdocs_rss_plugin.minifier import WhitespaceMinifier
+
+# test suite
+from tests.base import BENCHMARKS_ENABLED
+
+# #############################################################################
+# ########## Functions #############
+# ##################################
+
+
+def minify_char_by_char(text: str) -> str:
+    """Reference implementation: the character loop previously used by the plugin."""
+    output = []
+    prev_char = ""
+    for char in text:
+        if char == "\n":
+            char = " "
+        if char == " " and prev_char == " ":
+            prev_char = char
+            continue
+        prev_char = char
+        output.append(char)
+    return "".join(output)
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestWhitespaceMinifier(unittest.TestCase):
+    """Test feed whitespaces minifier."""
+
+    # -- Standard methods --------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """Executed when module is loaded before any test."""
+        rand = random.Random(42)  # noqa: S311 - seeded test data, not security related
+        cls.samples = [
+            "",
+            " ",
+            "\n",
+            "\n \n",
+            "  leading and trailing  ",
+            "<item>\n      <title>A  title</title>\n\t<link>x</link>\r\n</item>\n",
+            "".join(rand.choice("ab \n\t") for _ in range(5000)),
+        ]
+
+    # -- TESTS ---------------------------------------------------------
+    def test_minify_matches_char_loop(self):
+        """Test that minified output is the same as the previous implementation."""
+        for sample in self.samples:
+            self.assertEqual(
+                WhitespaceMinifier.minify(sample), minify_char_by_char(sample)
+            )
+
+    def test_feed_chunks(self):
+        """Test that minifying by chunks gives the same output as in one go."""
+        rand = random.Random(42)  # noqa: S311 - seeded test data, not security related
+        for sample in self.samples:
+            minifier = WhitespaceMinifier()
+            chunks, position = [], 0
+            while position < len(sample):
+                chunk_length = rand.randint(0, 12)
+                chunks.append(minifier.feed(sample[position : position + chunk_length]))
+                position += chunk_length
+
+            self.assertEqual("".join(chunks), minify_char_by_char(sample))
+
+    def test_minify_large_feed(self):
+        """Test the bulk minifier against the character loop writer previously used
+        on a multi-megabytes feed."""
+        feed = "\n".join(
+            f"    <item>\n      <title>Page {i}</title>\n"
+            f"      <description>{'Lorem ipsum  dolor sit amet.  ' * 100}</description>\n"
+            "    </item>"
+            for i in range(1000)
+        )
+        self.assertGreater(len(feed), 2_000_000)
+
+        # previous implementation: one write call per character
+        start = perf_counter()
+        char_loop_output = StringIO()
+        prev_char = ""
+        for char in feed:
+            if char == "\n":
+                char = " "
+            if char == " " and prev_char == " ":
+                prev_char = char
+                continue
+            prev_char = char
+            char_loop_output.write(char)
+        char_loop_duration = perf_counter() - start
+
+        start = perf_counter()
+        bulk_output = StringIO()
+        bulk_output.write(WhitespaceMinifier.minify(feed))
+        bulk_duration = perf_counter() - start
+
+        self.assertEqual(char_loop_output.getvalue(), bulk_output.getvalue())
+        self.assertEqual(bulk_output.getvalue(), minify_char_by_char(feed))
+        if BENCHMARKS_ENABLED:
+            self.assertLess(bulk_duration, char_loop_duration)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
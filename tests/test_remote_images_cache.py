@@ -0,0 +1,118 @@
+#! python3  # noqa: E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_remote_images_cache
+
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# plugin target
+from mkdocs_rss_plugin.remote_images_cache import (
+    CACHE_FILENAME,
+    STATUS_ERROR,
+    STATUS_OK,
+    RemoteImagesCache,
+)
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestRemoteImagesCache(unittest.TestCase):
+    """Test persistent cache of remote images metadata."""
+
+    # -- Standard methods --------------------------------------------------------
+    def setUp(self):
+        """Executed before each test."""
+        self.tmp_cache_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.tmp_cache_dir.name)
+
+    def tearDown(self):
+        """Executed after each test."""
+        self.tmp_cache_dir.cleanup()
+
+    # -- TESTS ---------------------------------------------------------
+    def test_persistence(self):
+        """Test metadata are reloaded by the next build."""
+        cache = RemoteImagesCache(cache_dir=self.cache_dir)
+        cache.set(
+            url="https://example.com/a.png",
+            status=STATUS_OK,
+            length=42,
+            mime_type="image/png",
+        )
+        cache.set(url="https://example.com/b.png", status=STATUS_ERROR)
+        cache.save()
+        self.assertTrue(self.cache_dir.joinpath(CACHE_FILENAME).is_file())
+
+        next_cache = RemoteImagesCache(cache_dir=self.cache_dir)
+        self.assertEqual(next_cache.get("https://example.com/a.png").length, 42)
+        self.assertEqual(
+            next_cache.get("https://example.com/a.png").mime_type, "image/png"
+        )
+        self.assertEqual(
+            next_cache.get("https://example.com/b.png").status, STATUS_ERROR
+        )
+        self.assertIsNone(next_cache.get("https://example.com/c.png"))
+
+    def test_ttl(self):
+        """Test unreachable images expire sooner than reachable ones."""
+        cache = RemoteImagesCache(cache_dir=self.cache_dir, ttl=60, ttl_errors=10)
+        with patch("mkdocs_rss_plugin.remote_images_cache.time", return_value=0):
+            cache.set(url="https://example.com/a.png", status=STATUS_OK, length=1)
+            cache.set(url="https://example.com/b.png", status=STATUS_ERROR)
+
+        with patch("mkdocs_rss_plugin.remote_images_cache.time", return_value=30 * 60):
+            self.assertIsNotNone(cache.get("https://example.com/a.png"))
+            self.assertIsNone(cache.get("https://example.com/b.png"))
+
+        with patch("mkdocs_rss_plugin.remote_images_cache.time", return_value=61 * 60):
+            self.assertIsNone(cache.get("https://example.com/a.png"))
+
+    def test_save_merges_and_prunes(self):
+        """Test metadata written by another instance are kept and expired ones are
+        dropped when saving."""
+        with patch("mkdocs_rss_plugin.remote_images_cache.time", return_value=0):
+            cache = RemoteImagesCache(cache_dir=self.cache_dir, ttl=60)
+            other_cache = RemoteImagesCache(cache_dir=self.cache_dir, ttl=60)
+            cache.set(url="https://example.com/old.png", status=STATUS_OK, length=1)
+            cache.save()
+
+        with patch("mkdocs_rss_plugin.remote_images_cache.time", return_value=90 * 60):
+            cache.set(url="https://example.com/a.png", status=STATUS_OK, length=2)
+            other_cache.set(url="https://example.com/b.png", status=STATUS_OK, length=3)
+            cache.save()
+            other_cache.save()
+
+            next_cache = RemoteImagesCache(cache_dir=self.cache_dir, ttl=60)
+            self.assertEqual(
+                sorted(next_cache.records),
+                ["https://example.com/a.png", "https://example.com/b.png"],
+            )
+
+    def test_corrupted_cache(self):
+        """Test a corrupted cache file is ignored."""
+        self.cache_dir.joinpath(CACHE_FILENAME).write_text("not json", encoding="UTF-8")
+        cache = RemoteImagesCache(cache_dir=self.cache_dir)
+        self.assertEqual(cache.records, {})
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
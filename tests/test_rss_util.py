@@ -14,15 +14,43 @@
 # ##################################
 
 # Standard library
+import subprocess
+import sys
+import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
+from time import perf_counter
+from unittest.mock import MagicMock, patch
 
 # 3rd party
+import markdown
 from validator_collection import checkers
 
 # plugin target
+from mkdocs_rss_plugin.models import MkdocsPageSubset, PageInformation
 from mkdocs_rss_plugin.util import Util
 
+# test suite
+from tests.base import BENCHMARKS_ENABLED
+
+# #############################################################################
+# ########## Globals ###############
+# ##################################
+
+# dependencies to import only when the related feature is used
+LAZY_IMPORTED_MODULES = (
+    "cachecontrol",
+    "git",
+    "markdown",
+    "material",
+    "requests",
+    "urllib3",
+)
+# max time to import the plugin, on top of MkDocs itself
+PLUGIN_IMPORT_TIME_BUDGET_MS = 150
+
 
 # #############################################################################
 # ########## Classes ###############
@@ -69,6 +97,224 @@ class TestRssUtil(unittest.TestCase):
         print(item_url)
         self.assertTrue(checkers.is_url(item_url))
 
+    def test_load_descriptions_for_pages(self):
+        """Test deferred abstracts rendering."""
+        pages = [
+            PageInformation(title="deferred", _abstract_markdown="Some **bold**"),
+            PageInformation(title="explicit", description="Already set"),
+        ]
+        self.plg_utils.load_descriptions_for_pages(pages)
+
+        self.assertEqual(pages[0].description, "<p>Some <strong>bold</strong></p>")
+        self.assertIsNone(pages[0]._abstract_markdown)
+        self.assertEqual(pages[1].description, "Already set")
+
+    def test_render_abstract_markdown_extensions(self):
+        """Test abstracts conversion using Markdown extensions."""
+        table_md = "| a | b |\n|---|---|\n| 1 | 2 |"
+        self.assertNotIn("<table>", self.plg_utils.render_abstract(table_md))
+
+        plg_utils_extensions = Util(use_git=False, markdown_extensions=["tables"])
+        self.assertIn("<table>", plg_utils_extensions.render_abstract(table_md))
+        # converter is reused and reset between abstracts
+        self.assertIs(
+            plg_utils_extensions.get_markdown_converter(),
+            plg_utils_extensions.get_markdown_converter(),
+        )
+
+    def test_render_abstract_reused_converter(self):
+        """Test that the reused converter renders abstracts as a fresh Markdown
+        parser per abstract does."""
+        abstracts = [
+            f"# Page {i}\n\nSome *emphasized* text with a [link](https://example.com/{i})"
+            f" and `inline code`, followed by a list:\n\n- item {i}\n- item {i + 1}\n"
+            for i in range(3000)
+        ]
+
+        start = perf_counter()
+        fresh_results = [
+            markdown.markdown(abstract, output_format="html5") for abstract in abstracts
+        ]
+        fresh_duration = perf_counter() - start
+
+        start = perf_counter()
+        reused_results = [
+            self.plg_utils.render_abstract(abstract) for abstract in abstracts
+        ]
+        reused_duration = perf_counter() - start
+
+        self.assertEqual(fresh_results, reused_results)
+        if BENCHMARKS_ENABLED:
+            self.assertLess(reused_duration, fresh_duration)
+
+    def test_load_images_for_pages_concurrently(self):
+        """Test images loading is concurrent, bounded and keeps pages order."""
+        tmp_cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_cache_dir.cleanup)
+        plg_utils = Util(
+            cache_dir=Path(tmp_cache_dir.name),
+            use_git=False,
+            remote_images_max_workers=3,
+            remote_images_max_workers_per_host=2,
+        )
+        pages = [
+            PageInformation(
+                title=f"page {i}",
+                _mkdocs_page_ref=MkdocsPageSubset(
+                    abs_src_path=f"page_{i}.md",
+                    dest_uri=f"page_{i}/index.html",
+                    src_uri=f"page_{i}.md",
+                    meta={"image": f"https://host{i % 2}.example.com/image_{i}.png"},
+                ),
+            )
+            for i in range(12)
+        ]
+
+        lock = threading.Lock()
+        running = {"total": 0, "max_total": 0}
+        running_per_host: dict[str, int] = {}
+        max_per_host: dict[str, int] = {}
+
+        def fake_request(method, timeout, url, verify):
+            host = url.split("/")[2]
+            with lock:
+                running["total"] += 1
+                running["max_total"] = max(running["max_total"], running["total"])
+                running_per_host[host] = running_per_host.get(host, 0) + 1
+                max_per_host[host] = max(
+                    max_per_host.get(host, 0), running_per_host[host]
+                )
+            time.sleep(0.05)
+            with lock:
+                running["total"] -= 1
+                running_per_host[host] -= 1
+            response = MagicMock()
+            response.headers = {"content-length": url.split("_")[-1].split(".")[0]}
+            return response
+
+        with patch.object(plg_utils.req_session, "request", side_effect=fake_request):
+            plg_utils.load_images_for_pages(pages, base_url="https://example.com/")
+
+        self.assertEqual(
+            [page.image[2] for page in pages], [i for i in range(len(pages))]
+        )
+        self.assertGreater(running["max_total"], 1)
+        self.assertLessEqual(running["max_total"], 3)
+        self.assertTrue(all(count <= 2 for count in max_per_host.values()))
+
+    def test_remote_image_from_cache(self):
+        """Test remote images metadata persisted by a previous build skip the
+        network, including unreachable images."""
+        with tempfile.TemporaryDirectory() as tmp_cache_dir:
+            plg_utils = Util(cache_dir=Path(tmp_cache_dir), use_git=False)
+            response = MagicMock()
+            response.headers = {
+                "content-length": "1234",
+                "content-type": "image/webp; charset=binary",
+            }
+            with patch.object(
+                plg_utils.req_session, "request", return_value=response
+            ) as mock_request:
+                self.assertEqual(
+                    plg_utils.get_remote_image_length(
+                        image_url="https://example.com/image"
+                    ),
+                    1234,
+                )
+            plg_utils.remote_images_cache.set(
+                url="https://example.com/unreachable.png", status="error"
+            )
+            plg_utils.remote_images_cache.save()
+
+            # new build
+            plg_utils_next = Util(cache_dir=Path(tmp_cache_dir), use_git=False)
+            with patch.object(plg_utils_next.req_session, "request") as mock_request:
+                page = MkdocsPageSubset(
+                    abs_src_path="page.md",
+                    dest_uri="page/index.html",
+                    src_uri="page.md",
+                    meta={"image": "https://example.com/image"},
+                )
+                self.assertEqual(
+                    plg_utils_next.get_image(in_page=page, base_url=""),
+                    ("https://example.com/image", "image/webp", 1234),
+                )
+                self.assertIsNone(
+                    plg_utils_next.get_remote_image_length(
+                        image_url="https://example.com/unreachable.png"
+                    )
+                )
+                mock_request.assert_not_called()
+
+    def test_remote_image_offline(self):
+        """Test offline mode resolves images lengths without any network call."""
+        with tempfile.TemporaryDirectory() as tmp_cache_dir:
+            plg_utils = Util(
+                cache_dir=Path(tmp_cache_dir), remote_images_offline=True, use_git=False
+            )
+            plg_utils.remote_images_cache.set(
+                url="https://example.com/cached.png", status="ok", length=42
+            )
+            pages = [
+                PageInformation(
+                    title=f"page {i}",
+                    _mkdocs_page_ref=MkdocsPageSubset(
+                        abs_src_path="docs/index.md",
+                        dest_uri=f"page_{i}/index.html",
+                        src_uri=f"page_{i}.md",
+                        meta={"image": image},
+                    ),
+                )
+                for i, image in enumerate(
+                    (
+                        "assets/rss_icon.svg",
+                        "https://example.com/cached.png",
+                        "https://example.com/unknown.png",
+                    )
+                )
+            ]
+
+            with patch.object(plg_utils.req_session, "request") as mock_request:
+                plg_utils.load_images_for_pages(pages, base_url="https://example.com/")
+                mock_request.assert_not_called()
+
+        self.assertIsInstance(pages[0].image[2], int)
+        self.assertEqual(pages[1].image[2], 42)
+        self.assertIsNone(pages[2].image[2])
+        self.assertEqual(
+            plg_utils.remote_images_unresolved, {"https://example.com/unknown.png"}
+        )
+
+    def test_remote_image_offline_expired(self):
+        """Test offline mode uses metadata cached by a previous build even if they
+        expired, as they can't be fetched again."""
+        with tempfile.TemporaryDirectory() as tmp_cache_dir:
+            with patch("mkdocs_rss_plugin.remote_images_cache.time", return_value=0):
+                plg_utils = Util(cache_dir=Path(tmp_cache_dir), use_git=False)
+                plg_utils.remote_images_cache.set(
+                    url="https://example.com/cached.png",
+                    status="ok",
+                    length=42,
+                    mime_type="image/png",
+                )
+                plg_utils.remote_images_cache.save()
+
+            offline_utils = Util(
+                cache_dir=Path(tmp_cache_dir), remote_images_offline=True, use_git=False
+            )
+            self.assertIsNone(
+                offline_utils.remote_images_cache.get("https://example.com/cached.png")
+            )
+            with patch.object(offline_utils.req_session, "request") as mock_request:
+                self.assertEqual(
+                    offline_utils.get_remote_image_length(
+                        image_url="https://example.com/cached.png"
+                    ),
+                    42,
+                )
+                mock_request.assert_not_called()
+            self.assertEqual(offline_utils.remote_images_unresolved, set())
+
     def test_local_image_ok(self):
         """Test local image length calculation."""
         img_length = self.plg_utils.get_local_image_length(
@@ -130,6 +376,50 @@ class TestRssUtil(unittest.TestCase):
                 )
                 self.assertEqual(result, param["value"])
 
+    def test_lazy_imports(self):
+        """Test with `python -X importtime` that loading the plugin does not import
+        heavy dependencies, MkDocs being already loaded as it is during a build."""
+        marker = "-- mkdocs loaded --"
+        result = subprocess.run(  # noqa: S603 - fixed command, trusted interpreter
+            [
+                sys.executable,
+                "-X",
+                "importtime",
+                "-c",
+                "import sys; "
+                "import jinja2, mkdocs.config.defaults, mkdocs.plugins, "
+                "mkdocs.structure.files, mkdocs.structure.pages, mkdocs.utils; "
+                f"sys.stderr.write('{marker}\\n'); "
+                "import mkdocs_rss_plugin.plugin",
+            ],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+
+        # modules imported by the plugin: name -> cumulative time in microseconds
+        imported_modules: dict[str, int] = {}
+        for line in result.stderr.split(marker, 1)[1].splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            _, cumulative, module_name = line.split("|")
+            if cumulative.strip().isdigit():
+                imported_modules[module_name.strip()] = int(cumulative)
+
+        self.assertEqual(
+            [
+                module_name
+                for module_name in imported_modules
+                if module_name.split(".")[0] in LAZY_IMPORTED_MODULES
+            ],
+            [],
+        )
+        if BENCHMARKS_ENABLED:
+            self.assertLess(
+                imported_modules["mkdocs_rss_plugin.plugin"] / 1e3,
+                PLUGIN_IMPORT_TIME_BUDGET_MS,
+            )
+
 
 # ##############################################################################
 # ##### Stand alone program ########
@@ -0,0 +1,180 @@
+#! python3  # noqa: E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_template_engine
+
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import tempfile
+import unittest
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from pathlib import Path
+from time import perf_counter
+
+# 3rd party
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+# plugin target
+from mkdocs_rss_plugin.constants import DEFAULT_TEMPLATE_FILENAME
+from mkdocs_rss_plugin.minifier import WhitespaceMinifier
+from mkdocs_rss_plugin.models import MkdocsPageSubset, PageInformation, RssFeedBase
+from mkdocs_rss_plugin.template_engine import FeedTemplateEngine
+
+# test suite
+from tests.base import BENCHMARKS_ENABLED
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestFeedTemplateEngine(unittest.TestCase):
+    """Test RSS template engine."""
+
+    # -- Standard methods --------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """Executed when module is loaded before any test."""
+        cls.feed = RssFeedBase(
+            description="Feed   with\nspaces",
+            html_url="https://example.com/",
+            rss_url="https://example.com/feed_rss_created.xml",
+            title="Test feed",
+            entries=[
+                PageInformation(
+                    description=f"<p>Full content\n\n  of the   page {i}.</p>\n" * 20,
+                    guid=f"https://example.com/page_{i}/",
+                    link=f"https://example.com/page_{i}/",
+                    title=f"Page {i}",
+                )
+                for i in range(50)
+            ],
+        )
+
+    def setUp(self):
+        """Executed before each test."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.out_file = Path(self.tmp_dir.name, "feed.xml")
+
+    def tearDown(self):
+        """Executed after each test."""
+        self.tmp_dir.cleanup()
+
+    # -- TESTS ---------------------------------------------------------
+    def test_write_matches_render(self):
+        """Test streamed feed is the same as the rendered one, whatever the buffer
+        size."""
+        for pretty_print in (False, True):
+            template_engine = FeedTemplateEngine(
+                template_path=DEFAULT_TEMPLATE_FILENAME, pretty_print=pretty_print
+            )
+            expected_feed = template_engine.render(self.feed)
+            for buffer_size in (1, 7, 1024, 10_000_000):
+                with self.subTest(pretty_print=pretty_print, buffer_size=buffer_size):
+                    template_engine.write(
+                        feed=self.feed, out_file=self.out_file, buffer_size=buffer_size
+                    )
+                    self.assertEqual(
+                        self.out_file.read_text(encoding="UTF8"), expected_feed
+                    )
+
+    def test_bytecode_cache_variants(self):
+        """Test pretty and minified templates compiled by previous builds are not
+        mixed up."""
+        bytecode_cache_dir = Path(self.tmp_dir.name, "jinja")
+        expected_feeds = {
+            pretty_print: FeedTemplateEngine(
+                template_path=DEFAULT_TEMPLATE_FILENAME, pretty_print=pretty_print
+            ).render(self.feed)
+            for pretty_print in (False, True)
+        }
+
+        for _ in range(2):
+            for pretty_print in (False, True):
+                template_engine = FeedTemplateEngine(
+                    template_path=DEFAULT_TEMPLATE_FILENAME,
+                    pretty_print=pretty_print,
+                    bytecode_cache_dir=bytecode_cache_dir,
+                )
+                self.assertEqual(
+                    template_engine.render(self.feed), expected_feeds[pretty_print]
+                )
+
+        self.assertEqual(len(list(bytecode_cache_dir.iterdir())), 2)
+
+    def test_render_matches_environment_per_build(self):
+        """Test the shared template engine rendering the dataclass gives the same
+        feed as a Jinja environment created per build rendering a dict copy."""
+        start_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        feed = RssFeedBase(
+            description="Synthetic feed",
+            html_url="https://example.com/",
+            rss_url="https://example.com/feed_rss_created.xml",
+            title="Benchmark",
+            entries=[
+                PageInformation(
+                    abs_path=Path(f"docs/page_{i}.md"),
+                    authors=("Jane Doe", "John Doe"),
+                    categories=["benchmark", f"tag_{i % 10}"],
+                    created=start_date + timedelta(hours=i),
+                    description=f"<p>Abstract of the page {i} &amp; more.</p>" * 5,
+                    guid=f"https://example.com/page_{i}/",
+                    image=(f"https://example.com/page_{i}.png", "image/png", 1024),
+                    link=f"https://example.com/page_{i}/",
+                    pub_date=format_datetime(start_date + timedelta(hours=i)),
+                    title=f"Page {i}",
+                    updated=start_date + timedelta(hours=i),
+                    _mkdocs_page_ref=MkdocsPageSubset(
+                        abs_src_path=f"docs/page_{i}.md",
+                        dest_uri=f"page_{i}/index.html",
+                        src_uri=f"page_{i}.md",
+                        meta={"title": f"Page {i}", "tags": ["benchmark"]},
+                    ),
+                )
+                for i in range(500)
+            ],
+        )
+        builds_count = 10
+
+        # previous implementation: new environment and feed copy at each build
+        start = perf_counter()
+        for _ in range(builds_count):
+            env = Environment(
+                autoescape=select_autoescape(["html", "xml"]),
+                loader=FileSystemLoader(DEFAULT_TEMPLATE_FILENAME.parent),
+                lstrip_blocks=True,
+                trim_blocks=True,
+            )
+            template = env.get_template(DEFAULT_TEMPLATE_FILENAME.name)
+            previous_output = WhitespaceMinifier.minify(
+                template.render(feed=asdict(feed))
+            )
+        previous_duration = perf_counter() - start
+
+        start = perf_counter()
+        template_engine = FeedTemplateEngine(template_path=DEFAULT_TEMPLATE_FILENAME)
+        for _ in range(builds_count):
+            engine_output = template_engine.render(feed)
+        engine_duration = perf_counter() - start
+
+        self.assertEqual(previous_output, engine_output)
+        if BENCHMARKS_ENABLED:
+            self.assertLess(engine_duration, previous_duration)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()